@@ -25,80 +25,190 @@ Data flows: Source → Still → Unified Still Schema → Barrel Schema → Targ
 See documentation at: https://datadistillery.org/
 """
 
-from typing import Union
+import importlib
+from typing import TYPE_CHECKING, Any, Union
 
 __version__ = "0.1.0"
 
-# Core imports organized by module
+if TYPE_CHECKING:
+    # Authentication (core infrastructure)
+    from gkc.auth import AuthenticationError, OpenStreetMapAuth, WikiverseAuth
+
+    # Bottler (final output transformation)
+    from gkc.bottler import (
+        ClaimBuilder,
+        DataTypeTransformer,
+        Distillate,
+        SnakBuilder,
+    )
+
+    # Cooperage (Barrel Schema and reference management)
+    from gkc.cooperage import (
+        CooperageError,
+        MetadataCache,
+        fetch_entity_rdf,
+        fetch_schema_specification,
+        get_entity_uri,
+        get_metadata_cache,
+        set_metadata_cache,
+        validate_entity_reference,
+    )
+
+    # Entity Profiles (GKC Entity Profile definitions)
+    from gkc.entity_profile import GKCEntityProfile
+
+    # YAML-first profiles (SpiritSafe)
+    from gkc.profiles import (
+        FormSchemaGenerator,
+        ProfileDefinition,
+        ProfileLoader,
+        ProfilePydanticGenerator,
+        ProfileValidator,
+        ValidationIssue,
+        ValidationResult,
+    )
+
+    # ShEx validation utilities
+    from gkc.shex import ShexValidationError, ShexValidator
+
+    # Sitelinks (cross-reference validation)
+    from gkc.sitelinks import (
+        SitelinkValidator,
+        check_wikipedia_page,
+        validate_sitelink_dict,
+    )
+
+    # SPARQL (query utility, cross-cutting)
+    from gkc.sparql import (
+        SPARQLError,
+        SPARQLQuery,
+        execute_sparql,
+        execute_sparql_to_dataframe,
+    )
 
-# Authentication (core infrastructure)
-from gkc.auth import AuthenticationError, OpenStreetMapAuth, WikiverseAuth
-
-# Bottler (final output transformation)
-from gkc.bottler import (
-    ClaimBuilder,
-    DataTypeTransformer,
-    Distillate,
-    SnakBuilder,
-)
-
-# Cooperage (Barrel Schema and reference management)
-from gkc.cooperage import (
-    CooperageError,
-    fetch_entity_rdf,
-    fetch_schema_specification,
-    get_entity_uri,
-    validate_entity_reference,
+    # SpiritSafe source configuration + lookup utilities
+    from gkc.spirit_safe import (
+        DEFAULT_SPIRIT_SAFE_GITHUB_REPO,
+        LookupCache,
+        LookupFetcher,
+        ProfileMetadata,
+        SpiritSafeSourceConfig,
+        get_profile_metadata,
+        get_spirit_safe_source,
+        hydrate_profile_lookups,
+        list_profiles,
+        profile_exists,
+        resolve_profile_path,
+        resolve_query_ref,
+        set_spirit_safe_source,
+    )
+
+# Public names are resolved from their submodules on first access (PEP 562),
+# so ``import gkc`` does not pay for rdflib, pydantic, requests and friends
+# until something that needs them is actually used.
+_EXPORTS: dict[str, tuple[str, ...]] = {
+    "gkc.auth": (
+        "AuthenticationError",
+        "OpenStreetMapAuth",
+        "WikiverseAuth",
+    ),
+    "gkc.bottler": (
+        "ClaimBuilder",
+        "DataTypeTransformer",
+        "Distillate",
+        "SnakBuilder",
+    ),
+    "gkc.cooperage": (
+        "CooperageError",
+        "MetadataCache",
+        "fetch_entity_rdf",
+        "fetch_schema_specification",
+        "get_entity_uri",
+        "get_metadata_cache",
+        "set_metadata_cache",
+        "validate_entity_reference",
+    ),
+    "gkc.entity_profile": ("GKCEntityProfile",),
+    "gkc.profiles": (
+        "FormSchemaGenerator",
+        "ProfileDefinition",
+        "ProfileLoader",
+        "ProfilePydanticGenerator",
+        "ProfileValidator",
+        "ValidationIssue",
+        "ValidationResult",
+    ),
+    "gkc.shex": (
+        "ShexValidationError",
+        "ShexValidator",
+    ),
+    "gkc.sitelinks": (
+        "SitelinkValidator",
+        "check_wikipedia_page",
+        "validate_sitelink_dict",
+    ),
+    "gkc.sparql": (
+        "SPARQLError",
+        "SPARQLQuery",
+        "execute_sparql",
+        "execute_sparql_to_dataframe",
+    ),
+    "gkc.spirit_safe": (
+        "DEFAULT_SPIRIT_SAFE_GITHUB_REPO",
+        "LookupCache",
+        "LookupFetcher",
+        "ProfileMetadata",
+        "SpiritSafeSourceConfig",
+        "get_profile_metadata",
+        "get_spirit_safe_source",
+        "hydrate_profile_lookups",
+        "list_profiles",
+        "profile_exists",
+        "resolve_profile_path",
+        "resolve_query_ref",
+        "set_spirit_safe_source",
+    ),
+}
+_LAZY_ATTRIBUTES: dict[str, str] = {
+    name: module for module, names in _EXPORTS.items() for name in names
+}
+
+_SUBMODULES = frozenset(
+    {
+        "auth",
+        "bottler",
+        "cli",
+        "cooperage",
+        "entity_profile",
+        "mash",
+        "mash_formatters",
+        "profiles",
+        "shex",
+        "shipper",
+        "sitelinks",
+        "sparql",
+        "spirit_safe",
+    }
 )
 
-# Entity Profiles (GKC Entity Profile definitions)
-from gkc.entity_profile import GKCEntityProfile
-
-# YAML-first profiles (SpiritSafe)
-from gkc.profiles import (
-    FormSchemaGenerator,
-    ProfileDefinition,
-    ProfileLoader,
-    ProfilePydanticGenerator,
-    ProfileValidator,
-    ValidationIssue,
-    ValidationResult,
-)
 
-# ShEx validation utilities
-from gkc.shex import ShexValidationError, ShexValidator
+def __getattr__(name: str) -> Any:
+    """Import a public name's submodule on first access and cache the value."""
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is not None:
+        value = getattr(importlib.import_module(module_name), name)
+    elif name in _SUBMODULES:
+        value = importlib.import_module(f"gkc.{name}")
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
 
-# Sitelinks (cross-reference validation)
-from gkc.sitelinks import (
-    SitelinkValidator,
-    check_wikipedia_page,
-    validate_sitelink_dict,
-)
 
-# SPARQL (query utility, cross-cutting)
-from gkc.sparql import (
-    SPARQLError,
-    SPARQLQuery,
-    execute_sparql,
-    execute_sparql_to_dataframe,
-)
+def __dir__() -> list[str]:
+    """List lazily loaded public names alongside the module globals."""
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
 
-# SpiritSafe source configuration + lookup utilities
-from gkc.spirit_safe import (
-    DEFAULT_SPIRIT_SAFE_GITHUB_REPO,
-    LookupCache,
-    LookupFetcher,
-    ProfileMetadata,
-    SpiritSafeSourceConfig,
-    get_profile_metadata,
-    get_spirit_safe_source,
-    hydrate_profile_lookups,
-    list_profiles,
-    profile_exists,
-    resolve_profile_path,
-    resolve_query_ref,
-    set_spirit_safe_source,
-)
 
 # Language Configuration
 # Package-level language settings for multilingual data handling
@@ -152,9 +262,12 @@ __all__ = [
     "SnakBuilder",
     # Cooperage (new names)
     "CooperageError",
+    "MetadataCache",
     "fetch_entity_rdf",
     "fetch_schema_specification",
     "get_entity_uri",
+    "get_metadata_cache",
+    "set_metadata_cache",
     "validate_entity_reference",
     # Entity Profiles
     "GKCEntityProfile",
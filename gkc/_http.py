@@ -0,0 +1,63 @@
+"""
+Shared HTTP session for stateless Wikimedia API calls.
+
+Module-level ``requests.get`` opens a fresh connection (TCP + TLS handshake)
+for every call. Routing read-only lookups through one pooled, keep-alive
+session lets repeated calls to the same hosts reuse their connections.
+
+Authenticated clients keep their own sessions; cookies and login state are
+never shared through this module.
+
+Plain meaning: Reuse network connections between Wikidata requests.
+"""
+
+import threading
+from typing import Any, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Enough pooled connections per host for the batch fetchers' thread pools
+POOL_MAXSIZE = 32
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def session() -> requests.Session:
+    """
+    Return the shared pooled session, creating it on first use.
+
+    The session carries no default headers; pass ``User-Agent`` per request.
+
+    Returns:
+        Process-wide requests.Session with keep-alive connection pools
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                shared = requests.Session()
+                adapter = HTTPAdapter(pool_maxsize=POOL_MAXSIZE)
+                shared.mount("https://", adapter)
+                shared.mount("http://", adapter)
+                _session = shared
+    return _session
+
+
+def get(url: str, **kwargs: Any) -> requests.Response:
+    """Issue a GET request through the shared session."""
+    return session().get(url, **kwargs)
+
+
+def close_session() -> None:
+    """
+    Close and discard the shared session.
+
+    The next call to session() starts a fresh one.
+    """
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
@@ -0,0 +1,194 @@
+"""
+JSON encoding helpers with an optional fast path.
+
+Uses ``orjson`` when it is installed and falls back to the standard library
+otherwise. Both paths emit the same text: UTF-8 without ASCII escaping, and
+compact separators (``,`` and ``:``) unless indented, so output differs from a
+default ``json.dumps`` call. Write it to binary handles or to text handles
+opened with ``encoding="utf-8"``; pass ``ensure_ascii=True`` to ``dumps`` for
+streams of unknown encoding such as stdout. Install the ``fast`` extra
+(``pip install gkc[fast]``) to enable the faster encoder.
+
+Plain meaning: Read and write JSON as quickly as the environment allows.
+"""
+
+import io
+import json
+from typing import IO, Any, Iterator, Union
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def dumps(
+    obj: Any, indent: bool = False, sort_keys: bool = False, ensure_ascii: bool = False
+) -> str:
+    """
+    Serialize an object to a JSON string.
+
+    Non-ASCII characters are written as-is rather than ``\\u`` escaped unless
+    ``ensure_ascii`` is set, and compact output has no spaces after separators.
+
+    Args:
+        obj: JSON-compatible object
+        indent: Pretty-print with two-space indentation
+        sort_keys: Emit object keys in sorted order
+        ensure_ascii: Escape non-ASCII characters (always uses the stdlib
+            encoder, since orjson cannot escape them)
+
+    Returns:
+        JSON text
+
+    Plain meaning: Turn Python data into JSON text.
+    """
+    if HAS_ORJSON and not ensure_ascii:
+        try:
+            return _orjson_dumps(obj, indent, sort_keys).decode("utf-8")
+        except orjson.JSONEncodeError:
+            # e.g. integers wider than 64 bits; the stdlib encoder handles them
+            pass
+    return json.dumps(
+        obj,
+        indent=2 if indent else None,
+        separators=None if indent else (",", ":"),
+        sort_keys=sort_keys,
+        ensure_ascii=ensure_ascii,
+    )
+
+
+def dumpb(obj: Any, indent: bool = False, sort_keys: bool = False) -> bytes:
+    """
+    Serialize an object to UTF-8 encoded JSON bytes.
+
+    Skips the decode/re-encode round trip of ``dumps`` when the result is
+    headed straight for a binary file or socket.
+
+    Args:
+        obj: JSON-compatible object
+        indent: Pretty-print with two-space indentation
+        sort_keys: Emit object keys in sorted order
+
+    Returns:
+        JSON as UTF-8 bytes
+
+    Plain meaning: Turn Python data into JSON ready to write to disk.
+    """
+    if HAS_ORJSON:
+        try:
+            return _orjson_dumps(obj, indent, sort_keys)
+        except orjson.JSONEncodeError:
+            pass
+    return dumps(obj, indent=indent, sort_keys=sort_keys).encode("utf-8")
+
+
+def _orjson_dumps(obj: Any, indent: bool, sort_keys: bool) -> bytes:
+    """Encode with orjson using options equivalent to the stdlib call."""
+    option = orjson.OPT_NON_STR_KEYS
+    if indent:
+        option |= orjson.OPT_INDENT_2
+    if sort_keys:
+        option |= orjson.OPT_SORT_KEYS
+    return orjson.dumps(obj, option=option)
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """
+    Parse JSON text or bytes.
+
+    Raises:
+        json.JSONDecodeError: If the input is not valid JSON
+
+    Plain meaning: Turn JSON text into Python data.
+    """
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dump(obj: Any, fp: IO[Any], indent: bool = False) -> None:
+    """
+    Serialize an object as JSON to a text or binary file handle.
+
+    Top-level lists and dicts are written one member at a time, so the
+    encoded form of the whole document is never held in memory at once.
+
+    Args:
+        obj: JSON-compatible object
+        fp: Open text or binary file handle
+        indent: Pretty-print with two-space indentation
+
+    Plain meaning: Write Python data to a JSON file piece by piece.
+    """
+    binary = isinstance(fp, (io.RawIOBase, io.BufferedIOBase))
+    for chunk in iter_encode(obj, indent=indent):
+        fp.write(chunk if binary else chunk.decode("utf-8"))
+
+
+def iter_encode(obj: Any, indent: bool = False) -> Iterator[bytes]:
+    """
+    Encode an object as a sequence of UTF-8 JSON chunks.
+
+    A top-level list or dict yields one chunk per member; anything else is
+    encoded in a single chunk. Joining the chunks gives the same document
+    ``dumpb`` would produce.
+
+    Args:
+        obj: JSON-compatible object
+        indent: Pretty-print with two-space indentation
+
+    Yields:
+        Consecutive pieces of the encoded document
+    """
+    if not isinstance(obj, (list, dict)) or not obj:
+        yield dumpb(obj, indent=indent)
+        return
+
+    if indent:
+        separator, key_separator = b",\n  ", b": "
+    else:
+        separator, key_separator = b",", b":"
+
+    def encode_member(value: Any) -> bytes:
+        encoded = dumpb(value, indent=indent)
+        # Newlines only occur between tokens (string newlines are escaped),
+        # so nesting a member one level deeper is a plain replacement
+        return encoded.replace(b"\n", b"\n  ") if indent else encoded
+
+    opening = b"[" if isinstance(obj, list) else b"{"
+    yield opening + b"\n  " if indent else opening
+    first = True
+    if isinstance(obj, list):
+        for value in obj:
+            yield (b"" if first else separator) + encode_member(value)
+            first = False
+    else:
+        for key, value in obj.items():
+            yield (
+                (b"" if first else separator)
+                + dumpb(_key_text(key))
+                + key_separator
+                + encode_member(value)
+            )
+            first = False
+    closing = b"]" if isinstance(obj, list) else b"}"
+    yield b"\n" + closing if indent else closing
+
+
+def _key_text(key: Any) -> str:
+    """Coerce a dict key to the string both encoders would emit for it."""
+    if isinstance(key, str):
+        return key
+    if key is None:
+        return "null"
+    if isinstance(key, bool):
+        return "true" if key else "false"
+    return str(key)
+
+
+def load(fp: IO[Any]) -> Any:
+    """Parse JSON from a text or binary file handle."""
+    return loads(fp.read())
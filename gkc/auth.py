@@ -17,11 +17,17 @@ Bot passwords provide:
 - Format: Username@BotName (e.g., "Alice@MyBot")
 """
 
-import getpass
 import os
-from typing import Optional
+import sys
+from http.cookiejar import LoadError, LWPCookieJar
+from pathlib import Path
+from typing import Any, ClassVar, Optional, Union
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from gkc import _json
 
 # Default MediaWiki API endpoints for common Wikimedia projects
 DEFAULT_WIKIMEDIA_APIS = {
@@ -38,9 +44,52 @@ class AuthenticationError(Exception):
     pass
 
 
+DEFAULT_USER_AGENT = "GKC-Python-Client/0.1 (https://github.com/skybristol/gkc)"
+
+# Transient API failures worth retrying. urllib3 leaves POST (logins, edits)
+# out of its retryable methods, so only idempotent requests are repeated.
+_API_RETRY = Retry(
+    total=3,
+    backoff_factor=0.3,
+    status_forcelist=(429, 500, 502, 503, 504),
+)
+
+
+def _build_session() -> requests.Session:
+    """Create a keep-alive API session with pooled connections and retries."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=_API_RETRY)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({"User-Agent": DEFAULT_USER_AGENT})
+    return session
+
+
+def _response_data(response: requests.Response) -> Any:
+    """
+    Parse a MediaWiki API response body.
+
+    Decodes the raw bytes with the package JSON helper (orjson when
+    installed) instead of ``response.json()``.
+
+    Raises:
+        AuthenticationError: If the body is not valid JSON
+    """
+    try:
+        return _json.loads(response.content)
+    except ValueError as e:
+        raise AuthenticationError(f"Invalid JSON in API response: {str(e)}")
+
+
 class AuthBase:
     """Base class for authentication."""
 
+    # Per-service credential sources; subclasses override these
+    _USERNAME_ENV: ClassVar[str] = ""
+    _PASSWORD_ENV: ClassVar[str] = ""
+    _SERVICE_LABEL: ClassVar[str] = ""
+    _USERNAME_PROMPT: ClassVar[str] = ""
+
     def __init__(self, username: Optional[str] = None, password: Optional[str] = None):
         """
         Initialize authentication.
@@ -58,6 +107,46 @@ class AuthBase:
         """Check if credentials are available."""
         return bool(self.username and self.password)
 
+    @classmethod
+    def _resolve_credentials(
+        cls,
+        username: Optional[str],
+        password: Optional[str],
+        interactive: bool,
+    ) -> tuple[Optional[str], Optional[str], bool]:
+        """
+        Fill in credentials from the environment, then optionally by prompting.
+
+        Returns:
+            Tuple of (username, password, prompted)
+
+        Raises:
+            AuthenticationError: If a prompt is needed but stdin is unavailable.
+        """
+        # Try provided parameters first
+        username = username or os.environ.get(cls._USERNAME_ENV)
+        password = password or os.environ.get(cls._PASSWORD_ENV)
+
+        # If credentials still not available and interactive mode is requested
+        if not interactive or (username and password):
+            return username, password, False
+
+        # Without a usable stdin (detached daemons, some CI runners) input() can
+        # only fail; isatty() is not checked because notebooks prompt without one
+        if sys.stdin is None or sys.stdin.closed:
+            raise AuthenticationError(
+                f"{cls._SERVICE_LABEL} credentials not found and interactive=True, "
+                "but stdin is not available. Set "
+                f"{cls._USERNAME_ENV} and {cls._PASSWORD_ENV} instead."
+            )
+
+        import getpass
+
+        print(f"{cls._SERVICE_LABEL} credentials not found in environment.")
+        username = input(cls._USERNAME_PROMPT).strip()
+        password = getpass.getpass(f"Enter {cls._SERVICE_LABEL} password: ").strip()
+        return username, password, True
+
 
 class WikiverseAuth(AuthBase):
     """
@@ -105,12 +194,41 @@ class WikiverseAuth(AuthBase):
         ... })
     """
 
+    _USERNAME_ENV = "WIKIVERSE_USERNAME"
+    _PASSWORD_ENV = "WIKIVERSE_PASSWORD"
+    _SERVICE_LABEL = "Wikiverse"
+    _USERNAME_PROMPT = "Enter Wikiverse username (format: Username@BotName): "
+
+    # Invariant API parameters; requests only reads them, so they are shared
+    _LOGIN_TOKEN_PARAMS: ClassVar[dict[str, str]] = {
+        "action": "query",
+        "meta": "tokens",
+        "type": "login",
+        "format": "json",
+    }
+    _CSRF_TOKEN_PARAMS: ClassVar[dict[str, str]] = {
+        "action": "query",
+        "meta": "tokens",
+        "type": "csrf",
+        "format": "json",
+    }
+    _SESSION_TOKEN_PARAMS: ClassVar[dict[str, str]] = {
+        "action": "query",
+        "meta": "tokens|userinfo",
+        "type": "csrf",
+        "format": "json",
+    }
+    _LOGIN_PARAMS: ClassVar[dict[str, str]] = {"action": "login", "format": "json"}
+    _LOGOUT_PARAMS: ClassVar[dict[str, str]] = {"action": "logout", "format": "json"}
+
     def __init__(
         self,
         username: Optional[str] = None,
         password: Optional[str] = None,
         api_url: Optional[str] = None,
         interactive: bool = False,
+        session: Optional[requests.Session] = None,
+        cookie_jar_path: Optional[Union[str, Path]] = None,
     ):
         """
         Initialize Wikiverse authentication for bot accounts.
@@ -125,48 +243,62 @@ class WikiverseAuth(AuthBase):
                     WIKIVERSE_API_URL environment variable, or defaults to Wikidata.
                     Can also use shortcuts: "wikidata", "wikipedia", "commons"
             interactive: If True and credentials are not found, prompt user for input.
+            session: Existing requests.Session to log in with. Its cookies hold
+                the login, so share one only between objects that should act as
+                the same account. Used as given (headers are not changed).
+            cookie_jar_path: Optional file for persisting login cookies. When
+                set, login() first tries to resume the saved session and only
+                performs a full login if it has expired; fresh logins are
+                saved back (owner-only permissions). The file grants access
+                to the account, so keep it private.
         """
-        # Try provided parameters first
-        username = username or os.environ.get("WIKIVERSE_USERNAME")
-        password = password or os.environ.get("WIKIVERSE_PASSWORD")
+        username, password, prompted = self._resolve_credentials(
+            username, password, interactive
+        )
         api_url = api_url or os.environ.get("WIKIVERSE_API_URL")
-
-        # If credentials still not available and interactive mode is requested
-        if interactive and not (username and password):
-            print("Bot password credentials not found in environment.")
-            username = input(
-                "Enter Wikiverse username (format: Username@BotName): "
+        if prompted and not api_url:
+            api_url_input = input(
+                "Enter API URL (or 'wikidata', 'wikipedia', 'commons') "
+                "[default: wikidata]: "
             ).strip()
-            password = getpass.getpass("Enter Wikiverse password: ").strip()
-            if not api_url:
-                api_url_input = input(
-                    "Enter API URL (or 'wikidata', 'wikipedia', 'commons') "
-                    "[default: wikidata]: "
-                ).strip()
-                api_url = api_url_input if api_url_input else "wikidata"
+            api_url = api_url_input if api_url_input else "wikidata"
 
         super().__init__(username, password)
 
-        # Resolve API URL shortcuts to full URLs
-        if api_url and api_url.lower() in DEFAULT_WIKIMEDIA_APIS:
-            self.api_url = DEFAULT_WIKIMEDIA_APIS[api_url.lower()]
-        elif api_url:
-            self.api_url = api_url
-        else:
-            # Default to Wikidata
-            self.api_url = DEFAULT_WIKIMEDIA_APIS["wikidata"]
+        # Split "Account@BotName" once; the getters below are called per edit
+        self._account_name: Optional[str] = None
+        self._bot_name: Optional[str] = None
+        if self.username:
+            account_name, separator, bot_name = self.username.partition("@")
+            if separator:
+                self._account_name, self._bot_name = account_name, bot_name
+
+        # Resolve API URL shortcuts to full URLs (default: Wikidata)
+        self.api_url = (
+            DEFAULT_WIKIMEDIA_APIS.get(api_url.lower(), api_url)
+            if api_url
+            else DEFAULT_WIKIMEDIA_APIS["wikidata"]
+        )
 
         # Initialize session for authenticated requests
-        self.session = requests.Session()
-        self.session.headers.update(
-            {"User-Agent": "GKC-Python-Client/0.1 (https://github.com/skybristol/gkc)"}
-        )
+        self.session = session if session is not None else _build_session()
         self._logged_in = False
+        # CSRF tokens and user info are stable for the life of a login session
+        self._csrf_token: Optional[str] = None
+        self._userinfo: Optional[dict[str, Any]] = None
+        self.cookie_jar_path = Path(cookie_jar_path) if cookie_jar_path else None
 
-    def login(self) -> bool:
+    def login(self, force: bool = False) -> bool:
         """
         Perform login to MediaWiki API using bot password credentials.
 
+        Calling login() on a session that is already logged in returns
+        immediately without contacting the API.
+
+        Args:
+            force: Perform a full login even if this session is already logged
+                in or a saved cookie jar could be resumed.
+
         Returns:
             True if login successful, False otherwise.
 
@@ -184,17 +316,23 @@ class WikiverseAuth(AuthBase):
                 "Please provide username and password."
             )
 
+        if self._logged_in and not force:
+            return True
+
+        if (
+            not force
+            and self.cookie_jar_path is not None
+            and self._resume_saved_session()
+        ):
+            return True
+
         try:
             # Step 1: Get login token
-            token_params = {
-                "action": "query",
-                "meta": "tokens",
-                "type": "login",
-                "format": "json",
-            }
-            token_response = self.session.get(self.api_url, params=token_params)
+            token_response = self.session.get(
+                self.api_url, params=self._LOGIN_TOKEN_PARAMS
+            )
             token_response.raise_for_status()
-            token_data = token_response.json()
+            token_data = _response_data(token_response)
 
             if "query" not in token_data or "tokens" not in token_data["query"]:
                 raise AuthenticationError(
@@ -206,15 +344,14 @@ class WikiverseAuth(AuthBase):
 
             # Step 2: Perform login with credentials and token
             login_params = {
-                "action": "login",
+                **self._LOGIN_PARAMS,
                 "lgname": self.username,
                 "lgpassword": self.password,
                 "lgtoken": login_token,
-                "format": "json",
             }
             login_response = self.session.post(self.api_url, data=login_params)
             login_response.raise_for_status()
-            login_data = login_response.json()
+            login_data = _response_data(login_response)
 
             # Check login result
             if "login" not in login_data:
@@ -227,12 +364,15 @@ class WikiverseAuth(AuthBase):
 
             if result == "Success":
                 self._logged_in = True
+                self._clear_session_cache()
                 # Verify we have session cookies
                 if not self.session.cookies:
                     raise AuthenticationError(
                         "Login reported success but no session cookies were set. "
                         "This may indicate a network or API configuration issue."
                     )
+                if self.cookie_jar_path is not None:
+                    self._save_cookies()
                 return True
             else:
                 # Provide detailed error message
@@ -268,30 +408,70 @@ class WikiverseAuth(AuthBase):
         """
         if self._logged_in:
             try:
-                # Get CSRF token for logout
-                token_params = {
-                    "action": "query",
-                    "meta": "tokens",
-                    "type": "csrf",
-                    "format": "json",
-                }
-                token_response = self.session.get(self.api_url, params=token_params)
-                token_data = token_response.json()
-                csrf_token = token_data["query"]["tokens"]["csrftoken"]
+                # Get CSRF token for logout, reusing one fetched for edits
+                csrf_token = self._csrf_token
+                if csrf_token is None:
+                    token_response = self.session.get(
+                        self.api_url, params=self._CSRF_TOKEN_PARAMS
+                    )
+                    token_data = _response_data(token_response)
+                    csrf_token = token_data["query"]["tokens"]["csrftoken"]
 
                 # Perform logout
-                logout_params = {
-                    "action": "logout",
-                    "token": csrf_token,
-                    "format": "json",
-                }
+                logout_params = {**self._LOGOUT_PARAMS, "token": csrf_token}
                 self.session.post(self.api_url, data=logout_params)
             except Exception:
                 # Ignore logout errors, just clear session
                 pass
             finally:
                 self._logged_in = False
+                self._clear_session_cache()
                 self.session.cookies.clear()
+                if self.cookie_jar_path is not None:
+                    self.cookie_jar_path.unlink(missing_ok=True)
+
+    def _resume_saved_session(self) -> bool:
+        """
+        Reuse login cookies saved by an earlier process, if still valid.
+
+        One meta=tokens|userinfo request both confirms the login and primes the
+        CSRF token cache, replacing the login-token and login round trips.
+        """
+        assert self.cookie_jar_path is not None
+        jar = LWPCookieJar(str(self.cookie_jar_path))
+        try:
+            jar.load(ignore_discard=True)
+        except (OSError, LoadError):
+            return False
+        if not len(jar):
+            return False
+
+        for cookie in jar:
+            self.session.cookies.set_cookie(cookie)
+        self._logged_in = True
+        try:
+            userinfo = self.get_userinfo()
+        except AuthenticationError:
+            userinfo = {}
+        if userinfo.get("name") == self.get_account_name() and "anon" not in userinfo:
+            return True
+
+        # Expired or belongs to another account: start from a clean session
+        self._logged_in = False
+        self._clear_session_cache()
+        self.session.cookies.clear()
+        return False
+
+    def _save_cookies(self) -> None:
+        """Write the session's cookies to cookie_jar_path, readable by owner only."""
+        assert self.cookie_jar_path is not None
+        self.cookie_jar_path.parent.mkdir(parents=True, exist_ok=True)
+        # Create the file with restricted permissions before any secret is written
+        os.close(os.open(self.cookie_jar_path, os.O_WRONLY | os.O_CREAT, 0o600))
+        jar = LWPCookieJar(str(self.cookie_jar_path))
+        for cookie in self.session.cookies:
+            jar.set_cookie(cookie)
+        jar.save(ignore_discard=True)
 
     def get_csrf_token(self) -> str:
         """
@@ -300,6 +480,9 @@ class WikiverseAuth(AuthBase):
         IMPORTANT: The token must be used with auth.session for requests.
         The token alone is not sufficient - you need the authenticated session cookies.
 
+        The token is fetched together with the account's user info and reused
+        until logout, a new login, or invalidate_csrf_token().
+
         Returns:
             CSRF token string.
 
@@ -324,21 +507,59 @@ class WikiverseAuth(AuthBase):
                 "Not logged in. Call login() first before getting CSRF token."
             )
 
+        if self._csrf_token is None:
+            return self._fetch_session_tokens()[0]
+        return self._csrf_token
+
+    def get_userinfo(self) -> dict[str, Any]:
+        """
+        Get the logged-in account's user info (meta=userinfo).
+
+        Shares the request that fetches the CSRF token, so whichever of the
+        two is asked for first answers both.
+
+        Returns:
+            The ``query.userinfo`` object from the MediaWiki API.
+
+        Raises:
+            AuthenticationError: If not logged in or the request fails.
+
+        Plain meaning: Find out which account this session is logged in as.
+        """
+        if not self.is_logged_in():
+            raise AuthenticationError(
+                "Not logged in. Call login() first before getting user info."
+            )
+
+        if self._userinfo is None:
+            return self._fetch_session_tokens()[1]
+        return self._userinfo
+
+    def invalidate_csrf_token(self) -> None:
+        """
+        Forget the cached CSRF token so the next edit fetches a fresh one.
+
+        Call this when the API rejects a token (error code ``badtoken``).
+        """
+        self._csrf_token = None
+
+    def _clear_session_cache(self) -> None:
+        self._csrf_token = None
+        self._userinfo = None
+
+    def _fetch_session_tokens(self) -> tuple[str, dict[str, Any]]:
+        """Fetch and cache the CSRF token and user info in one API request."""
         try:
-            token_params = {
-                "action": "query",
-                "meta": "tokens",
-                "type": "csrf",
-                "format": "json",
-            }
             # Use POST to ensure cookies are properly handled
-            response = self.session.post(self.api_url, data=token_params)
+            response = self.session.post(self.api_url, data=self._SESSION_TOKEN_PARAMS)
             response.raise_for_status()
-            data = response.json()
+            data = _response_data(response)
 
             if "query" in data and "tokens" in data["query"]:
                 csrf_token: str = data["query"]["tokens"]["csrftoken"]
-                return csrf_token
+                userinfo: dict[str, Any] = data["query"].get("userinfo", {})
+                self._csrf_token, self._userinfo = csrf_token, userinfo
+                return csrf_token, userinfo
             else:
                 raise AuthenticationError(f"Failed to get CSRF token. Response: {data}")
 
@@ -368,9 +589,7 @@ class WikiverseAuth(AuthBase):
             >>> auth.get_bot_name()
             'MyBot'
         """
-        if self.username and "@" in self.username:
-            return self.username.split("@", 1)[1]
-        return None
+        return self._bot_name
 
     def get_account_name(self) -> Optional[str]:
         """
@@ -384,9 +603,7 @@ class WikiverseAuth(AuthBase):
             >>> auth.get_account_name()
             'Alice'
         """
-        if self.username and "@" in self.username:
-            return self.username.split("@", 1)[0]
-        return None
+        return self._account_name
 
     def test_authentication(self) -> dict:
         """
@@ -447,6 +664,11 @@ class OpenStreetMapAuth(AuthBase):
         Enter OpenStreetMap password: ****
     """
 
+    _USERNAME_ENV = "OPENSTREETMAP_USERNAME"
+    _PASSWORD_ENV = "OPENSTREETMAP_PASSWORD"
+    _SERVICE_LABEL = "OpenStreetMap"
+    _USERNAME_PROMPT = "Enter OpenStreetMap username: "
+
     def __init__(
         self,
         username: Optional[str] = None,
@@ -463,16 +685,9 @@ class OpenStreetMapAuth(AuthBase):
                      OPENSTREETMAP_PASSWORD environment variable.
             interactive: If True and credentials are not found, prompt user for input.
         """
-        # Try provided parameters first
-        username = username or os.environ.get("OPENSTREETMAP_USERNAME")
-        password = password or os.environ.get("OPENSTREETMAP_PASSWORD")
-
-        # If credentials still not available and interactive mode is requested
-        if interactive and not (username and password):
-            print("OpenStreetMap credentials not found in environment.")
-            username = input("Enter OpenStreetMap username: ").strip()
-            password = getpass.getpass("Enter OpenStreetMap password: ").strip()
-
+        username, password, _ = self._resolve_credentials(
+            username, password, interactive
+        )
         super().__init__(username, password)
 
     def __repr__(self) -> str:
@@ -9,8 +9,136 @@ the product is in the right format, labeled correctly, and ready for consumption
 Plain meaning: Convert transformed data into Wikidata item structure.
 """
 
+import copy
 import math
-from typing import Any, Optional, Union
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import date
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Callable, Iterator, Mapping, Optional, Union
+
+from gkc import _json
+
+
+def _is_array(value: Any) -> bool:
+    """True for array-valued fields (e.g. list columns read through pandas)."""
+    np = sys.modules.get("numpy")
+    if np is not None and isinstance(value, np.ndarray):
+        return True
+    pd = sys.modules.get("pandas")
+    return pd is not None and isinstance(value, (pd.Series, pd.Index))
+
+
+# Marks a source field that is absent from the record (distinct from None)
+_MISSING = object()
+
+# Named precisions accepted in recipe ``transform`` blocks
+_TIME_PRECISIONS = {"year": 9, "month": 10, "day": 11}
+
+# Year, year-month, or full date with optional leading "+" and time portion
+_DATE_PATTERN = re.compile(r"^\+?(\d{1,4})(?:-(\d{1,2})(?:-(\d{1,2})(?:T.*)?)?)?$")
+# Precision indexed by the number of date parts matched (year, month, day)
+_PRECISION_BY_PARTS = (None, 9, 10, 11)
+
+# Earth (Q2), the globe for every coordinate the bottler produces
+_EARTH_GLOBE = "http://www.wikidata.org/entity/Q2"
+
+
+@lru_cache(maxsize=4096)
+def _wikibase_item_value(qid: str) -> Mapping[str, Any]:
+    """Build the inner value of a wikibase-entityid datavalue (cached)."""
+    # QIDs repeat across thousands of claims; share one string object.
+    # sys.intern only takes exact str, so str subclasses (numpy.str_) convert.
+    qid = sys.intern(str(qid))
+    numeric_id = int(qid[1:])  # Remove 'Q' prefix
+    return MappingProxyType(
+        {
+            "entity-type": "item",
+            "numeric-id": numeric_id,
+            "id": qid,
+        }
+    )
+
+
+@lru_cache(maxsize=4096)
+def _time_value(
+    date_str: str, precision: Optional[int], calendar: str
+) -> Mapping[str, Any]:
+    """Parse a date string into the inner value of a time datavalue.
+
+    Results are cached because source data repeats the same dates heavily.
+    The cached value is a read-only view, so it can be shared safely; callers
+    copy it into a plain dict before handing it out.
+    """
+    # Parse the date and determine precision
+    match = _DATE_PATTERN.match(date_str) if precision is None else None
+    if match:
+        # Common case: precision follows from which parts are present
+        year, month, day = match.groups()
+        precision = _PRECISION_BY_PARTS[match.lastindex or 1]
+        time_str = f"+{year:0>4}-{month or '00':0>2}-{day or '00':0>2}T00:00:00Z"
+    elif precision is None:
+        # Auto-detect precision from format
+        if "-" not in date_str:
+            # Just a year: 2005
+            precision = 9
+            time_str = f"+{date_str.zfill(4)}-00-00T00:00:00Z"
+        else:
+            parts = date_str.split("-")
+            if len(parts) == 2:
+                # Year-month: 2005-01
+                precision = 10
+                year, month = parts
+                time_str = f"+{year.zfill(4)}-{month.zfill(2)}-00T00:00:00Z"
+            elif len(parts) == 3:
+                # Full date: 2005-01-15
+                precision = 11
+                year, month, day = parts
+                # Handle time portion if present
+                if "T" in day:
+                    day = day.split("T")[0]
+                time_str = f"+{year.zfill(4)}-{month.zfill(2)}-{day.zfill(2)}T00:00:00Z"
+            else:
+                # Fallback for unexpected format
+                precision = 11
+                time_str = (
+                    f"+{date_str}T00:00:00Z" if "T" not in date_str else f"+{date_str}"
+                )
+    else:
+        # Use explicit precision
+        if precision == 9:
+            # Year precision: use -00-00
+            year = date_str.split("-")[0]
+            time_str = f"+{year.zfill(4)}-00-00T00:00:00Z"
+        elif precision == 10:
+            # Month precision: use -00 for day
+            parts = date_str.split("-")
+            year = parts[0]
+            month = parts[1] if len(parts) > 1 else "01"
+            time_str = f"+{year.zfill(4)}-{month.zfill(2)}-00T00:00:00Z"
+        else:
+            # Day precision (11) or other
+            if "T" not in date_str:
+                time_str = f"+{date_str}T00:00:00Z"
+            else:
+                time_str = (
+                    f"+{date_str}" if date_str.startswith("+") else f"+{date_str}"
+                )
+
+    return MappingProxyType(
+        {
+            "time": time_str,
+            "timezone": 0,
+            "before": 0,
+            "after": 0,
+            "precision": precision,
+            "calendarmodel": f"http://www.wikidata.org/entity/{calendar}",
+        }
+    )
 
 
 class DataTypeTransformer:
@@ -19,21 +147,20 @@ class DataTypeTransformer:
     @staticmethod
     def to_wikibase_item(qid: str) -> dict:
         """Convert a QID string to wikibase-entityid datavalue."""
-        numeric_id = int(qid[1:])  # Remove 'Q' prefix
-        return {
-            "value": {
-                "entity-type": "item",
-                "numeric-id": numeric_id,
-                "id": qid,
-            },
-            "type": "wikibase-entityid",
-        }
+        return {"value": dict(_wikibase_item_value(qid)), "type": "wikibase-entityid"}
 
     @staticmethod
     def to_quantity(value: Union[float, int], unit: str = "1") -> dict:
-        """Convert a number to quantity datavalue."""
+        """Convert a number to quantity datavalue.
+
+        Amounts are signed decimal strings; a sign already present (negative
+        numbers, or strings such as "+12") is kept rather than prefixed again.
+        """
+        amount = str(value)
+        if amount[:1] not in ("+", "-"):
+            amount = "+" + amount
         return {
-            "value": {"amount": f"+{value}", "unit": unit},
+            "value": {"amount": amount, "unit": unit},
             "type": "quantity",
         }
 
@@ -55,73 +182,33 @@ class DataTypeTransformer:
         Returns:
             Wikidata time datavalue structure
         """
-        # Convert int to string
-        date_str = str(date_input).strip()
-
-        # Parse the date and determine precision
-        if precision is None:
-            # Auto-detect precision from format
-            if "-" not in date_str:
-                # Just a year: 2005
-                precision = 9
-                time_str = f"+{date_str.zfill(4)}-00-00T00:00:00Z"
-            else:
-                parts = date_str.split("-")
-                if len(parts) == 2:
-                    # Year-month: 2005-01
-                    precision = 10
-                    year, month = parts
-                    time_str = f"+{year.zfill(4)}-{month.zfill(2)}-00T00:00:00Z"
-                elif len(parts) == 3:
-                    # Full date: 2005-01-15
-                    precision = 11
-                    year, month, day = parts
-                    # Handle time portion if present
-                    if "T" in day:
-                        day = day.split("T")[0]
-                    time_str = (
-                        f"+{year.zfill(4)}-{month.zfill(2)}-{day.zfill(2)}T00:00:00Z"
-                    )
-                else:
-                    # Fallback for unexpected format
-                    precision = 11
-                    time_str = (
-                        f"+{date_str}T00:00:00Z"
-                        if "T" not in date_str
-                        else f"+{date_str}"
-                    )
-        else:
-            # Use explicit precision
-            if precision == 9:
-                # Year precision: use -00-00
-                year = date_str.split("-")[0]
-                time_str = f"+{year.zfill(4)}-00-00T00:00:00Z"
-            elif precision == 10:
-                # Month precision: use -00 for day
-                parts = date_str.split("-")
-                year = parts[0]
-                month = parts[1] if len(parts) > 1 else "01"
-                time_str = f"+{year.zfill(4)}-{month.zfill(2)}-00T00:00:00Z"
-            else:
-                # Day precision (11) or other
-                if "T" not in date_str:
-                    time_str = f"+{date_str}T00:00:00Z"
-                else:
-                    time_str = (
-                        f"+{date_str}" if date_str.startswith("+") else f"+{date_str}"
-                    )
+        value = _time_value(str(date_input).strip(), precision, calendar)
+        return {"value": dict(value), "type": "time"}
 
-        return {
-            "value": {
-                "time": time_str,
-                "timezone": 0,
-                "before": 0,
-                "after": 0,
-                "precision": precision,
-                "calendarmodel": f"http://www.wikidata.org/entity/{calendar}",
-            },
-            "type": "time",
-        }
+    @staticmethod
+    def to_time_batch(
+        date_inputs: list[Union[str, int]],
+        precision: Optional[int] = None,
+        calendar: str = "Q1985727",
+    ) -> list[dict]:
+        """Convert a column of date inputs to Wikidata time datavalues.
+
+        Parsing is shared with :meth:`to_time`, so repeated dates (common in
+        source columns such as "date retrieved") are only parsed once.
+
+        Args:
+            date_inputs: Date values accepted by :meth:`to_time`
+            precision: Explicit precision applied to every value, or None to
+                auto-detect per value
+            calendar: Calendar model QID (default: Q1985727 = Gregorian)
+
+        Returns:
+            List of time datavalues aligned with ``date_inputs``
+        """
+        return [
+            DataTypeTransformer.to_time(date_input, precision, calendar)
+            for date_input in date_inputs
+        ]
 
     @staticmethod
     def to_monolingualtext(text: str, language: str) -> dict:
@@ -139,7 +226,7 @@ class DataTypeTransformer:
                 "latitude": lat,
                 "longitude": lon,
                 "precision": precision,
-                "globe": "http://www.wikidata.org/entity/Q2",
+                "globe": _EARTH_GLOBE,
             },
             "type": "globecoordinate",
         }
@@ -155,42 +242,78 @@ class SnakBuilder:
 
     def __init__(self, transformer: DataTypeTransformer):
         self.transformer = transformer
+        self._builders: dict[Any, Callable[[Any, dict], dict]] = {}
 
     def create_snak(
         self, property_id: str, value: Any, datatype: str, transform_config: dict = None
     ) -> dict:
         """Create a snak with the appropriate datavalue."""
-        # Apply transformations based on datatype
-        if datatype == "wikibase-item":
-            datavalue = self.transformer.to_wikibase_item(value)
-        elif datatype == "quantity":
-            unit = transform_config.get("unit", "1") if transform_config else "1"
-            datavalue = self.transformer.to_quantity(value, unit)
-        elif datatype == "time":
-            # Get precision from transform_config or auto-detect
-            precision = None
-            if transform_config:
-                precision = transform_config.get("precision")
-            datavalue = self.transformer.to_time(value, precision)
-        elif datatype == "monolingualtext":
-            language = (
-                transform_config.get("language", "en") if transform_config else "en"
-            )
-            datavalue = self.transformer.to_monolingualtext(value, language)
-        elif datatype == "globe-coordinate":
-            datavalue = self.transformer.to_globe_coordinate(value["lat"], value["lon"])
-        elif datatype == "url":
-            datavalue = self.transformer.to_url(value)
+        key: Any
+        if not transform_config:
+            # Most snaks carry no options; key on the datatype alone
+            key, transform_config = datatype, {}
+            build = self._builders.get(key)
         else:
-            # Default: treat as string
-            datavalue = {"value": value, "type": "string"}
+            try:
+                key = (datatype, tuple(sorted(transform_config.items())))
+                build = self._builders.get(key)
+            except TypeError:
+                # Unhashable transform options; bind without caching
+                key, build = None, None
+        if build is None:
+            build = self.datavalue_builder(datatype, transform_config)
+            if key is not None:
+                self._builders[key] = build
 
         return {
             "snaktype": "value",
             "property": property_id,
-            "datavalue": datavalue,
+            "datavalue": build(value, {}),
         }
 
+    def datavalue_builder(
+        self, datatype: str, transform: dict
+    ) -> Callable[[Any, dict], dict]:
+        """
+        Bind the DataTypeTransformer call for a datatype and its options.
+
+        Dispatch on the datatype string happens here, once; the returned
+        callable takes ``(value, record)`` and goes straight to the transformer.
+        The record is only consulted for options such as ``language_from``.
+        """
+        transformer = self.transformer
+
+        if datatype == "wikibase-item":
+            return lambda value, record: transformer.to_wikibase_item(value)
+        if datatype == "quantity":
+            unit = str(transform.get("unit", "1"))
+            return lambda value, record: transformer.to_quantity(value, unit)
+        if datatype == "time":
+            # Explicit precision (number or name) or None to auto-detect
+            precision = transform.get("precision")
+            if isinstance(precision, str):
+                precision = _TIME_PRECISIONS.get(precision, precision)
+            return lambda value, record: transformer.to_time(value, precision)
+        if datatype == "monolingualtext":
+            language = transform.get("language", "en")
+            if isinstance(language, str):
+                # Shared by every snak this builder makes; intern once here
+                language = sys.intern(language)
+            language_from = transform.get("language_from")
+            if language_from:
+                return lambda value, record: transformer.to_monolingualtext(
+                    value, record.get(language_from) or language
+                )
+            return lambda value, record: transformer.to_monolingualtext(value, language)
+        if datatype == "globe-coordinate":
+            return lambda value, record: transformer.to_globe_coordinate(
+                value["lat"], value["lon"]
+            )
+        if datatype == "url":
+            return lambda value, record: transformer.to_url(value)
+        # Default: treat as string
+        return lambda value, record: {"value": value, "type": "string"}
+
 
 class ClaimBuilder:
     """Builds complete claim structures with qualifiers and references."""
@@ -209,51 +332,144 @@ class ClaimBuilder:
         rank: str = "normal",
     ) -> dict:
         """Create a complete claim structure."""
+        create_snak = self.snak_builder.create_snak
         claim = {
-            "mainsnak": self.snak_builder.create_snak(
-                property_id, value, datatype, transform_config
-            ),
+            "mainsnak": create_snak(property_id, value, datatype, transform_config),
             "type": "statement",
             "rank": rank,
         }
 
         # Add qualifiers if provided
         if qualifiers:
-            claim["qualifiers"] = {}
-            claim["qualifiers-order"] = []
+            qualifier_snaks = {}
             for qual in qualifiers:
                 qual_prop = qual["property"]
-                qual_snak = self.snak_builder.create_snak(
-                    qual_prop,
-                    qual["value"],
-                    qual["datatype"],
-                    qual.get("transform"),
-                )
-                claim["qualifiers"][qual_prop] = [qual_snak]
-                claim["qualifiers-order"].append(qual_prop)
+                qualifier_snaks[qual_prop] = [
+                    create_snak(
+                        qual_prop,
+                        qual["value"],
+                        qual["datatype"],
+                        qual.get("transform"),
+                    )
+                ]
+            claim["qualifiers"] = qualifier_snaks
+            claim["qualifiers-order"] = list(qualifier_snaks)
 
         # Add references if provided
         if references:
-            claim["references"] = []
+            reference_blocks = []
             for ref_group in references:
-                ref_snaks = {}
-                ref_order = []
-                for ref_prop, ref_config in ref_group.items():
-                    ref_snak = self.snak_builder.create_snak(
-                        ref_prop,
-                        ref_config["value"],
-                        ref_config.get("datatype", "wikibase-item"),
-                        ref_config.get("transform"),
-                    )
-                    ref_snaks[ref_prop] = [ref_snak]
-                    ref_order.append(ref_prop)
-                claim["references"].append(
-                    {"snaks": ref_snaks, "snaks-order": ref_order}
+                ref_snaks = {
+                    ref_prop: [
+                        create_snak(
+                            ref_prop,
+                            ref_config["value"],
+                            ref_config.get("datatype", "wikibase-item"),
+                            ref_config.get("transform"),
+                        )
+                    ]
+                    for ref_prop, ref_config in ref_group.items()
+                }
+                reference_blocks.append(
+                    {"snaks": ref_snaks, "snaks-order": list(ref_snaks)}
                 )
+            claim["references"] = reference_blocks
 
         return claim
 
 
+@lru_cache(maxsize=32)
+def _load_recipe(path: str, mtime_ns: int) -> dict:
+    """Read and parse a recipe file; ``mtime_ns`` keys out stale cache entries."""
+    with open(path, "rb") as f:
+        config: dict = _json.load(f)
+    return config
+
+
+def _copy_datavalue(datavalue: dict) -> dict:
+    """Copy a datavalue without the overhead of ``copy.deepcopy``."""
+    value = datavalue["value"]
+    if isinstance(value, dict):
+        value = dict(value)
+    return {"value": value, "type": datavalue["type"]}
+
+
+def _copy_snaks(snaks_by_property: dict) -> dict:
+    """Copy a property-to-snaks mapping down to each snak's datavalue."""
+    return {
+        property_id: [
+            {**snak, "datavalue": _copy_datavalue(snak["datavalue"])} for snak in snaks
+        ]
+        for property_id, snaks in snaks_by_property.items()
+    }
+
+
+def _copy_reference(reference: dict) -> dict:
+    """Copy a prebuilt reference group so each claim owns its own dicts."""
+    return {
+        "snaks": _copy_snaks(reference["snaks"]),
+        "snaks-order": list(reference["snaks-order"]),
+    }
+
+
+@dataclass(frozen=True)
+class _SnakPlan:
+    """Precompiled recipe entry for one snak (main snak, qualifier, or reference).
+
+    ``read`` pulls the raw value out of a source record (or returns the literal
+    recipe value) and ``build`` turns that value into a Wikidata datavalue.
+    For constant plans ``build`` replays the prebuilt datavalue, while
+    ``build_value`` still converts whatever value it is given.
+    """
+
+    property_id: str
+    datatype: str
+    read: Callable[[dict], Any]
+    build: Callable[[Any, dict], dict]
+    build_value: Callable[[Any, dict], dict]
+    required: bool = False
+    constant: bool = False
+    # Fixed keys of every snak this plan produces; only the datavalue varies
+    snak_template: dict = field(default_factory=dict, compare=False)
+
+
+@dataclass(frozen=True)
+class _ClaimPlan:
+    """Precompiled recipe entry for one claim with resolved qualifiers/references."""
+
+    snak: _SnakPlan
+    qualifiers: tuple[_SnakPlan, ...]
+    references: tuple[tuple[_SnakPlan, ...], ...]
+    rank: str = "normal"
+    separator: Optional[str] = None
+    # Fully built reference per group when every snak in it is constant
+    prebuilt_references: tuple[Optional[dict], ...] = ()
+    # Fixed keys of every claim this plan produces
+    claim_template: dict = field(default_factory=dict, compare=False)
+
+
+@dataclass(frozen=True)
+class _TermPlan:
+    """Precompiled recipe entry for a label, description, or alias."""
+
+    language: str
+    source_field: Optional[str]
+    required: bool = False
+    default: Optional[str] = None
+    separator: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class _SitelinkPlan:
+    """Precompiled recipe entry for a sitelink."""
+
+    site: str
+    source_field: Optional[str]
+    title: Optional[str]
+    badges: tuple[str, ...] = ()
+    required: bool = False
+
+
 class Distillate:
     """
     Distillate: Final product of the distillation process.
@@ -279,13 +495,19 @@ class Distillate:
         # Extract and merge inline named references/qualifiers from claims
         self._extract_inline_named_elements()
 
+        # Compile the recipe once so transform_to_wikidata() never re-walks it
+        self._compile_plan()
+
     @classmethod
     def from_file(cls, file_path: str) -> "Distillate":
-        """Load distillate configuration from a JSON file."""
-        import json
+        """Load distillate configuration from a JSON file.
 
-        with open(file_path) as f:
-            config = json.load(f)
+        Parsed files are cached per path and modification time, so loading the
+        same recipe repeatedly only reads and parses it once.
+        """
+        path = os.path.abspath(file_path)
+        # Copy so mutations of one Distillate's config never leak into the cache
+        config = copy.deepcopy(_load_recipe(path, os.stat(path).st_mtime_ns))
         return cls(config)
 
     def _extract_inline_named_elements(self):
@@ -300,76 +522,603 @@ class Distillate:
         claims = self.config.get("mappings", {}).get("claims", [])
 
         for claim in claims:
-            # Extract named references
-            references = claim.get("references", [])
-
-            # Check if this reference array has a name (defines a reusable reference)
-            named_refs = [
-                r
-                for r in references
-                if isinstance(r, dict) and "name" in r and "property" in r
-            ]
-
-            if named_refs:
-                # Get the name from the first named reference
-                name = named_refs[0]["name"]
-
-                # Don't override explicit library entries
-                if name not in self.reference_library:
-                    # Store all property objects (without "name" key)
-                    # as the library entry
-                    ref_array = []
-                    for ref in references:
-                        if isinstance(ref, dict) and "property" in ref:
-                            ref_copy = {k: v for k, v in ref.items() if k != "name"}
-                            ref_array.append(ref_copy)
-                    self.reference_library[name] = ref_array
-
-            # Extract named qualifiers
-            qualifiers = claim.get("qualifiers", [])
-
-            named_quals = [
-                q
-                for q in qualifiers
-                if isinstance(q, dict) and "name" in q and "property" in q
-            ]
-
-            if named_quals:
-                name = named_quals[0]["name"]
-
-                if name not in self.qualifier_library:
-                    qual_array = []
-                    for qual in qualifiers:
-                        if isinstance(qual, dict) and "property" in qual:
-                            qual_copy = {k: v for k, v in qual.items() if k != "name"}
-                            qual_array.append(qual_copy)
-                    self.qualifier_library[name] = qual_array
+            self._register_named_entries(
+                claim.get("references", []), self.reference_library
+            )
+            self._register_named_entries(
+                claim.get("qualifiers", []), self.qualifier_library
+            )
+
+    @staticmethod
+    def _register_named_entries(entries: list, library: dict) -> None:
+        """
+        Add an inline named reference/qualifier array to its library.
+
+        The first entry carrying a "name" names the whole array. Unnamed arrays
+        (the common case) and names already in the library cost a single scan
+        and no copies.
+        """
+        name = next(
+            (
+                entry["name"]
+                for entry in entries
+                if isinstance(entry, dict) and "name" in entry and "property" in entry
+            ),
+            None,
+        )
+        # Don't override explicit library entries
+        if name is None or name in library:
+            return
+
+        # Store all property objects (without "name" key) as the library entry.
+        # Shallow copies keep the library independent of the recipe dicts.
+        library[name] = entry_copies = []
+        for entry in entries:
+            if isinstance(entry, dict) and "property" in entry:
+                entry_copy = entry.copy()
+                entry_copy.pop("name", None)
+                entry_copies.append(entry_copy)
+
+    def _compile_plan(self) -> None:
+        """
+        Compile the mapping configuration into flat, pre-resolved plans.
+
+        Named references and qualifiers are resolved against the libraries,
+        transform options are normalized, and each snak gets its datavalue
+        builder bound once here rather than on every transformed record.
+        """
+        mappings = self.config.get("mappings", {})
+
+        self._labels = tuple(self._compile_term(t) for t in mappings.get("labels", []))
+        self._descriptions = tuple(
+            self._compile_term(t) for t in mappings.get("descriptions", [])
+        )
+        self._aliases = tuple(
+            self._compile_term(t) for t in mappings.get("aliases", [])
+        )
+        self._sitelinks = tuple(
+            _SitelinkPlan(
+                site=sys.intern(s["site"]),
+                source_field=s.get("source_field"),
+                title=s.get("title"),
+                badges=tuple(s.get("badges", [])),
+                required=bool(s.get("required", False)),
+            )
+            for s in mappings.get("sitelinks", [])
+        )
+        # Library entries compile once and are shared by every claim naming them
+        self._qualifier_plans: dict[str, tuple[_SnakPlan, ...]] = {}
+        self._reference_plans: dict[str, tuple[_SnakPlan, ...]] = {}
+        self._claims = tuple(self._compile_claim(c) for c in mappings.get("claims", []))
+        # First mapping per property, for build_claim()
+        self._claims_by_property: dict[str, _ClaimPlan] = {}
+        for plan in self._claims:
+            self._claims_by_property.setdefault(plan.snak.property_id, plan)
+
+    @staticmethod
+    def _compile_term(entry: dict) -> _TermPlan:
+        return _TermPlan(
+            language=sys.intern(entry.get("language", "en")),
+            source_field=entry.get("source_field"),
+            required=bool(entry.get("required", False)),
+            default=entry.get("default"),
+            separator=entry.get("separator"),
+        )
+
+    def _compile_claim(self, entry: dict) -> _ClaimPlan:
+        qualifiers: list[_SnakPlan] = []
+        for qual in entry.get("qualifiers", []):
+            if "property" in qual:
+                qualifiers.append(self._compile_snak(qual))
+            elif "name" in qual:
+                qualifiers.extend(
+                    self._compile_named(
+                        "qualifier",
+                        qual["name"],
+                        self.qualifier_library,
+                        self._qualifier_plans,
+                    )
+                )
+
+        # Each {"name": ...} entry is one reference group; inline property
+        # entries on the claim together form a single group of their own.
+        references: list[tuple[_SnakPlan, ...]] = []
+        inline_group: list[_SnakPlan] = []
+        for ref in entry.get("references", []):
+            if "property" in ref:
+                inline_group.append(self._compile_snak(ref))
+            elif "name" in ref:
+                references.append(
+                    self._compile_named(
+                        "reference",
+                        ref["name"],
+                        self.reference_library,
+                        self._reference_plans,
+                    )
+                )
+        if inline_group:
+            references.insert(0, tuple(inline_group))
+
+        prebuilt_references = tuple(
+            (
+                self._build_reference(group, {})
+                if all(ref_plan.constant for ref_plan in group)
+                else None
+            )
+            for group in references
+        )
+
+        return _ClaimPlan(
+            snak=self._compile_snak(entry),
+            qualifiers=tuple(qualifiers),
+            references=tuple(references),
+            rank=entry.get("rank", "normal"),
+            separator=entry.get("separator"),
+            prebuilt_references=prebuilt_references,
+            claim_template={"type": "statement", "rank": entry.get("rank", "normal")},
+        )
+
+    def _compile_named(
+        self,
+        kind: str,
+        name: str,
+        library: dict,
+        compiled: dict[str, tuple[_SnakPlan, ...]],
+    ) -> tuple[_SnakPlan, ...]:
+        """Resolve a named library entry to its compiled snak plans."""
+        plans = compiled.get(name)
+        if plans is None:
+            if name not in library:
+                raise ValueError(f"Unknown {kind} library entry: {name}")
+            plans = compiled[name] = tuple(self._compile_snak(e) for e in library[name])
+        return plans
+
+    def _compile_snak(self, entry: dict) -> _SnakPlan:
+        datatype = sys.intern(entry.get("datatype", "wikibase-item"))
+        transform = entry.get("transform") or {}
+        source_field = entry.get("source_field") or entry.get("value_from")
+
+        read: Callable[[dict], Any]
+        constant = False
+        lat_field = transform.get("latitude_field")
+        lon_field = transform.get("longitude_field")
+        if datatype == "globe-coordinate" and lat_field and lon_field:
+
+            def read(record: dict) -> Any:
+                lat = record.get(lat_field, _MISSING)
+                lon = record.get(lon_field, _MISSING)
+                if self._is_empty_value(lat) or self._is_empty_value(lon):
+                    return None
+                return {"lat": lat, "lon": lon}
+
+        elif source_field:
+
+            def read(record: dict) -> Any:
+                return record.get(source_field, _MISSING)
+
+        elif datatype == "time" and entry.get("value") == "current_date":
+
+            def read(record: dict) -> Any:
+                return date.today().isoformat()
+
+        else:
+            literal = entry.get("value")
+            if isinstance(literal, str):
+                literal = sys.intern(literal)
+            constant = not self._is_empty_value(literal)
+
+            def read(record: dict) -> Any:
+                return literal
+
+        build = build_value = self.snak_builder.datavalue_builder(datatype, transform)
+        constant = constant and "language_from" not in transform
+        if constant:
+            # Constant snaks (e.g. P31 or "stated in" references) are identical
+            # for every record, so build the datavalue once and only copy it.
+            template = build(literal, {})
+
+            def build_constant(value: Any, record: dict) -> dict:
+                return _copy_datavalue(template)
+
+            build = build_constant
+
+        property_id = sys.intern(entry["property"])
+        return _SnakPlan(
+            property_id=property_id,
+            datatype=datatype,
+            read=read,
+            build=build,
+            build_value=build_value,
+            required=bool(entry.get("required", False)),
+            constant=constant,
+            snak_template={"snaktype": "value", "property": property_id},
+        )
+
+    def transform_to_wikidata(self, source_record: dict) -> dict:
+        """
+        Transform one source record into Wikidata item JSON.
+
+        Args:
+            source_record: Mapping of source field names to values
+
+        Returns:
+            Item JSON with labels, descriptions, aliases, claims, and
+            (when mapped) sitelinks
+
+        Raises:
+            ValueError: If a field marked as required is missing or empty
+
+        Plain meaning: Turn one row of source data into a Wikidata item.
+        """
+        # Bind hot attributes to locals once per record
+        read_term = self._read_term
+        is_empty = self._is_empty_value
+        build_claims = self._build_claims
+
+        labels: dict[str, dict] = {}
+        for term in self._labels:
+            text = read_term(term, source_record)
+            if text:
+                labels[term.language] = {"language": term.language, "value": text}
+
+        descriptions: dict[str, dict] = {}
+        for term in self._descriptions:
+            text = read_term(term, source_record)
+            if text:
+                descriptions[term.language] = {
+                    "language": term.language,
+                    "value": text,
+                }
+
+        aliases = self._build_aliases(source_record) if self._aliases else {}
+
+        claims: dict[str, list[dict]] = {}
+        for plan in self._claims:
+            built = build_claims(plan, source_record)
+            if built:
+                claims.setdefault(plan.snak.property_id, []).extend(built)
+
+        item: dict[str, Any] = {
+            "labels": labels,
+            "descriptions": descriptions,
+            "aliases": aliases,
+            "claims": claims,
+        }
+
+        if self._sitelinks:
+            sitelinks = item["sitelinks"] = {}
+            for link in self._sitelinks:
+                title = (
+                    source_record.get(link.source_field)
+                    if link.source_field
+                    else link.title
+                )
+                if is_empty(title):
+                    if link.required:
+                        raise ValueError(f"Required sitelink '{link.site}' is missing")
+                    continue
+                sitelinks[link.site] = {
+                    "site": link.site,
+                    "title": str(title).strip(),
+                    "badges": list(link.badges),
+                }
+
+        return item
+
+    def build_claim(
+        self, property_id: str, value: Any, record: Optional[dict] = None
+    ) -> dict:
+        """
+        Build one claim for a property from its compiled recipe mapping.
+
+        The value bypasses the mapping's source field, but datatype handling,
+        transform options, rank, qualifiers, and references come from the
+        precompiled plan, so no datatype dispatch happens per call. Qualifiers
+        and references that read source fields take them from ``record``.
+
+        Args:
+            property_id: Property of a claim mapping in the recipe (e.g. "P571")
+            value: Raw value for the main snak
+            record: Optional source record for qualifiers and references
+
+        Returns:
+            Wikidata claim JSON
+
+        Raises:
+            ValueError: If the recipe has no claim mapping for the property or
+                the value is empty
+
+        Plain meaning: Make a single statement using the recipe's rules.
+        """
+        plan = self._claims_by_property.get(property_id)
+        if plan is None:
+            raise ValueError(f"No claim mapping for property {property_id}")
+        if self._is_empty_value(value):
+            raise ValueError(f"Empty value for {property_id}")
+        return self._assemble_claims(
+            plan, [value], record or {}, plan.snak.build_value
+        )[0]
+
+    def transform_to_json(self, source_record: dict, indent: bool = False) -> str:
+        """
+        Transform one source record straight to Wikidata item JSON text.
+
+        Use this when the item is only going to be submitted or saved; it
+        skips handing the intermediate dict back to the caller and uses the
+        fast JSON encoder when available.
+
+        Args:
+            source_record: Mapping of source field names to values
+            indent: Pretty-print the JSON output
+
+        Returns:
+            Item JSON as a string
+
+        Raises:
+            ValueError: If a field marked as required is missing or empty
+
+        Plain meaning: Turn one row of source data into ready-to-send JSON.
+        """
+        return _json.dumps(self.transform_to_wikidata(source_record), indent=indent)
+
+    def iter_transform(self, source_records: Any) -> Iterator[dict]:
+        """
+        Lazily transform source records into Wikidata item JSON.
+
+        Items are produced one at a time, so memory stays flat no matter how
+        many records are streamed through.
+
+        Args:
+            source_records: Iterable of record dicts, or a pandas DataFrame
+
+        Yields:
+            Item JSON dicts, one per record, in input order
+
+        Raises:
+            ValueError: If a field marked as required is missing or empty
+
+        Plain meaning: Turn source rows into Wikidata items as they are needed.
+        """
+        transform = self.transform_to_wikidata
+        for record in self._iter_records(source_records):
+            yield transform(record)
+
+    def transform_batch(
+        self,
+        source_records: Any,
+        workers: Optional[int] = None,
+        chunksize: int = 256,
+        min_parallel: int = 1000,
+    ) -> list[dict]:
+        """
+        Transform many source records into Wikidata item JSON.
+
+        With ``workers`` greater than 1, records are split into chunks and
+        transformed in a process pool; each worker builds its own Distillate
+        from this recipe once and reuses it for every chunk it receives.
+        Batches smaller than ``min_parallel`` run in-process, where starting
+        the pool would cost more than it saves.
+
+        Args:
+            source_records: Iterable of record dicts, or a pandas DataFrame
+            workers: Number of worker processes (None or 1 runs in-process)
+            chunksize: Records per chunk sent to a worker
+            min_parallel: Smallest batch worth sending to the process pool
+
+        Returns:
+            List of item JSON dicts, one per record, in input order
+
+        Raises:
+            ValueError: If a field marked as required is missing or empty
+
+        Plain meaning: Turn a whole table of source data into Wikidata items.
+        """
+        if not workers or workers <= 1:
+            return list(self.iter_transform(source_records))
+
+        records = list(self._iter_records(source_records))
+        if len(records) <= chunksize or len(records) < min_parallel:
+            return [self.transform_to_wikidata(record) for record in records]
+
+        chunks = [
+            records[start : start + chunksize]
+            for start in range(0, len(records), chunksize)
+        ]
+        items: list[dict] = []
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(chunks)),
+            initializer=_init_batch_worker,
+            initargs=(self.config,),
+        ) as pool:
+            for chunk_items in pool.map(_transform_batch_chunk, chunks):
+                items.extend(chunk_items)
+        return items
+
+    @staticmethod
+    def _iter_records(source_records: Any) -> Iterator[dict]:
+        """Yield record dicts from an iterable of dicts or a pandas DataFrame."""
+        if hasattr(source_records, "itertuples"):
+            columns = list(source_records.columns)
+            for row in source_records.itertuples(index=False, name=None):
+                yield dict(zip(columns, row))
+        else:
+            yield from source_records
+
+    def write_jsonl(self, source_records: Any, file_path: str) -> int:
+        """
+        Stream transformed items to a JSON Lines file.
+
+        Args:
+            source_records: Iterable of record dicts, or a pandas DataFrame
+            file_path: Destination path; one item JSON object per line
+
+        Returns:
+            Number of items written
+
+        Raises:
+            ValueError: If a field marked as required is missing or empty
+
+        Plain meaning: Save Wikidata items to disk without holding them all.
+        """
+        count = 0
+        with open(file_path, "wb") as f:
+            for item in self.iter_transform(source_records):
+                f.write(_json.dumpb(item))
+                f.write(b"\n")
+                count += 1
+        return count
+
+    def _build_aliases(self, record: dict) -> dict[str, list[dict]]:
+        aliases: dict[str, list[dict]] = {}
+        # Track seen texts per language so de-duplication stays O(1) per alias
+        seen: dict[str, set[str]] = {}
+        for term in self._aliases:
+            raw = record.get(term.source_field) if term.source_field else None
+            if self._is_empty_value(raw):
+                if term.required:
+                    raise ValueError(f"Required field '{term.source_field}' is missing")
+                continue
+            language = term.language
+            seen_texts = seen.setdefault(language, set())
+            for text in self._split_values(raw, term.separator):
+                if text not in seen_texts:
+                    seen_texts.add(text)
+                    aliases.setdefault(language, []).append(
+                        {"language": language, "value": text}
+                    )
+        return aliases
+
+    def _read_term(self, term: _TermPlan, record: dict) -> Optional[str]:
+        raw = record.get(term.source_field) if term.source_field else None
+        if self._is_empty_value(raw):
+            if term.default is not None:
+                return term.default
+            if term.required:
+                raise ValueError(f"Required field '{term.source_field}' is missing")
+            return None
+        return str(raw).strip()
+
+    def _build_snak(self, plan: _SnakPlan, record: dict) -> Optional[dict]:
+        value = plan.read(record)
+        if self._is_empty_value(value):
+            if plan.required:
+                raise ValueError(
+                    f"Required value for {plan.property_id} is missing from record"
+                )
+            return None
+        return {**plan.snak_template, "datavalue": plan.build(value, record)}
+
+    def _build_reference(
+        self, group: tuple[_SnakPlan, ...], record: dict
+    ) -> Optional[dict]:
+        ref_snaks: dict[str, list[dict]] = {}
+        for ref_plan in group:
+            snak = self._build_snak(ref_plan, record)
+            if snak is not None:
+                ref_snaks.setdefault(ref_plan.property_id, []).append(snak)
+        if not ref_snaks:
+            return None
+        return {"snaks": ref_snaks, "snaks-order": list(ref_snaks)}
+
+    def _build_claims(self, plan: _ClaimPlan, record: dict) -> list[dict]:
+        raw = plan.snak.read(record)
+        if self._is_empty_value(raw):
+            if plan.snak.required:
+                raise ValueError(
+                    f"Required value for {plan.snak.property_id} is missing from record"
+                )
+            return []
+        values = self._split_values(raw, plan.separator) if plan.separator else [raw]
+        return self._assemble_claims(plan, values, record)
+
+    def _assemble_claims(
+        self,
+        plan: _ClaimPlan,
+        values: list,
+        record: dict,
+        build: Optional[Callable[[Any, dict], dict]] = None,
+    ) -> list[dict]:
+        qualifiers: dict[str, list[dict]] = {}
+        for qual_plan in plan.qualifiers:
+            snak = self._build_snak(qual_plan, record)
+            if snak is not None:
+                qualifiers.setdefault(qual_plan.property_id, []).append(snak)
+
+        references = []
+        for group, prebuilt in zip(plan.references, plan.prebuilt_references):
+            if prebuilt is not None:
+                references.append(_copy_reference(prebuilt))
+                continue
+            reference = self._build_reference(group, record)
+            if reference is not None:
+                references.append(reference)
+
+        claims = []
+        snak_template = plan.snak.snak_template
+        if build is None:
+            build = plan.snak.build
+        for index, value in enumerate(values):
+            claim: dict[str, Any] = {
+                "mainsnak": {**snak_template, "datavalue": build(value, record)},
+                **plan.claim_template,
+            }
+            # Claims split from one value each own their containers, so
+            # editing one claim's qualifiers or references leaves the rest alone
+            if qualifiers:
+                claim["qualifiers"] = _copy_snaks(qualifiers) if index else qualifiers
+                claim["qualifiers-order"] = list(qualifiers)
+            if references:
+                claim["references"] = (
+                    [_copy_reference(ref) for ref in references]
+                    if index
+                    else references
+                )
+            claims.append(claim)
+        return claims
 
     @staticmethod
     def _is_empty_value(value: Any) -> bool:
-        if value is None:
-            return True
-        if isinstance(value, float) and math.isnan(value):
-            return True
-        try:
-            import pandas as pd
-        except Exception:
-            pd = None
-        if pd is not None and pd.isna(value):
+        # Cheap identity/type checks first; most values are plain str/int
+        if value is None or value is _MISSING:
             return True
+        value_type = type(value)
+        if value_type is str:
+            return not value.strip()
+        if value_type in (int, bool, dict, list, tuple):
+            return False
+        if isinstance(value, float):
+            # Covers numpy.float64, which subclasses float
+            return math.isnan(value)
+        pd = sys.modules.get("pandas")
+        if pd is not None:
+            try:
+                if bool(pd.isna(value)):
+                    return True
+            except (TypeError, ValueError):
+                pass
+            else:
+                # pd.isna already covers NaN-like scalars; only str subclasses remain
+                return isinstance(value, str) and not value.strip()
         try:
-            nan_check = value != value
+            # NaN is the only value unequal to itself; numpy scalars answer
+            # with numpy.bool_, and arrays refuse bool() and count as non-empty
+            if bool(value != value) is True:
+                return True
         except Exception:
-            nan_check = False
-        if isinstance(nan_check, bool) and nan_check:
-            return True
+            pass
         if isinstance(value, str) and not value.strip():
             return True
         return False
 
     @staticmethod
     def _split_values(value: Any, separator: Optional[str] = None) -> list[str]:
-        values = value if isinstance(value, (list, tuple)) else [value]
+        if isinstance(value, (list, tuple)):
+            values = value
+        elif _is_array(value):
+            # One C-level conversion to Python scalars; NaN entries are skipped below
+            values = value.tolist()
+        else:
+            values = [value]
         result: list[str] = []
 
         for val in values:
@@ -386,3 +1135,17 @@ class Distillate:
                 result.append(text)
 
         return result
+
+
+# Per-process Distillate used by transform_batch(workers=...)
+_batch_worker_distillate: Optional[Distillate] = None
+
+
+def _init_batch_worker(mapping_config: dict) -> None:
+    global _batch_worker_distillate
+    _batch_worker_distillate = Distillate(mapping_config)
+
+
+def _transform_batch_chunk(records: list[dict]) -> list[dict]:
+    assert _batch_worker_distillate is not None
+    return [_batch_worker_distillate.transform_to_wikidata(r) for r in records]
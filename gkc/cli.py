@@ -6,11 +6,11 @@ Plain meaning: Run GKC tasks from the terminal.
 from __future__ import annotations
 
 import argparse
-import json
 import sys
 from typing import Any, Optional
 
 import gkc
+from gkc import _json
 from gkc.auth import AuthenticationError, OpenStreetMapAuth, WikiverseAuth
 from gkc.mash import WikidataLoader, WikipediaLoader
 from gkc.profiles import FormSchemaGenerator, ProfileLoader, ProfileValidator
@@ -494,9 +494,8 @@ def _add_osm_args(parser: argparse.ArgumentParser) -> None:
 
 
 def _handle_wikiverse_login(args: argparse.Namespace) -> dict[str, Any]:
-    auth = WikiverseAuth(interactive=args.interactive, api_url=args.api_url)
-
     try:
+        auth = WikiverseAuth(interactive=args.interactive, api_url=args.api_url)
         auth.login()
     except AuthenticationError as exc:
         raise CLIError(str(exc)) from exc
@@ -545,9 +544,8 @@ def _handle_wikiverse_status(args: argparse.Namespace) -> dict[str, Any]:
 
 
 def _handle_wikiverse_token(args: argparse.Namespace) -> dict[str, Any]:
-    auth = WikiverseAuth(interactive=args.interactive, api_url=args.api_url)
-
     try:
+        auth = WikiverseAuth(interactive=args.interactive, api_url=args.api_url)
         auth.login()
         token = auth.get_csrf_token()
     except AuthenticationError as exc:
@@ -567,7 +565,10 @@ def _handle_wikiverse_token(args: argparse.Namespace) -> dict[str, Any]:
 
 
 def _handle_osm_login(args: argparse.Namespace) -> dict[str, Any]:
-    auth = OpenStreetMapAuth(interactive=args.interactive)
+    try:
+        auth = OpenStreetMapAuth(interactive=args.interactive)
+    except AuthenticationError as exc:
+        raise CLIError(str(exc)) from exc
 
     ok = auth.is_authenticated()
     message = "Credentials present" if ok else "Credentials missing"
@@ -643,8 +644,7 @@ def _handle_mash_qid(args: argparse.Namespace) -> dict[str, Any]:
         raise CLIError("No QIDs specified. Provide at least one QID.")
 
     # Remove duplicates while preserving order
-    seen = set()
-    qids = [qid for qid in qids if not (qid in seen or seen.add(qid))]  # type: ignore[func-returns-value]
+    qids = list(dict.fromkeys(qids))
 
     # Parse filter options
     include_properties = []
@@ -765,11 +765,11 @@ def _handle_mash_qid(args: argparse.Namespace) -> dict[str, Any]:
         # Handle output (file or stdout)
         if args.output:
             # Write to file
-            with open(args.output, "w") as f:
+            with open(args.output, "w", encoding="utf-8") as f:
                 if isinstance(output_data, str):
                     f.write(output_data)
                 else:
-                    json.dump(output_data, f, indent=2)
+                    _json.dump(output_data, f, indent=True)
             return {
                 "command": args.command_path,
                 "ok": True,
@@ -781,7 +781,7 @@ def _handle_mash_qid(args: argparse.Namespace) -> dict[str, Any]:
             if isinstance(output_data, str):
                 print(output_data)
             else:
-                print(json.dumps(output_data, indent=2))
+                print(_json.dumps(output_data, indent=True, ensure_ascii=True))
             return {
                 "command": args.command_path,
                 "ok": True,
@@ -808,16 +808,24 @@ def _handle_mash_pid(args: argparse.Namespace) -> dict[str, Any]:
         raise CLIError("No PIDs specified. Provide at least one PID.")
 
     # Remove duplicates while preserving order
-    seen = set()
-    pids = [pid for pid in pids if not (pid in seen or seen.add(pid))]  # type: ignore[func-returns-value]
+    pids = list(dict.fromkeys(pids))
 
     try:
         loader = WikidataLoader()
 
-        # Load properties individually (batch loading removed with EntityCatalog)
-        templates = {}
-        for pid in pids:
-            templates[pid] = loader.load_property(pid)
+        if len(pids) == 1:
+            templates = {pids[0]: loader.load_property(pids[0])}
+        else:
+            # Batch through wbgetentities rather than one request per property
+            templates = loader.load_properties(pids)
+        # Unknown PIDs are reported in the result; the rest are still output
+        missing = [pid for pid in pids if pid not in templates]
+        if len(missing) == len(pids):
+            raise RuntimeError(
+                f"no-such-entity: {', '.join(missing)} not found on Wikidata"
+            )
+        resolved = [pid for pid in pids if pid in templates]
+        missing_note = f"; not found: {', '.join(missing)}" if missing else ""
 
         # Apply filters to all templates
         for template in templates.values():
@@ -837,7 +845,7 @@ def _handle_mash_pid(args: argparse.Namespace) -> dict[str, Any]:
                 output_data = (
                     [template.to_shell() for template in templates.values()]
                     if len(templates) > 1
-                    else templates[pids[0]].to_shell()
+                    else templates[resolved[0]].to_shell()
                 )
             elif transform == "gkc_entity_profile":
                 raise CLIError(
@@ -849,37 +857,43 @@ def _handle_mash_pid(args: argparse.Namespace) -> dict[str, Any]:
                 output_data = (
                     [template.to_dict() for template in templates.values()]
                     if len(templates) > 1
-                    else templates[pids[0]].to_dict()
+                    else templates[resolved[0]].to_dict()
                 )
 
         # Handle output (file or stdout)
         if args.output:
             # Write to file
-            with open(args.output, "w") as f:
+            with open(args.output, "w", encoding="utf-8") as f:
                 if isinstance(output_data, str):
                     f.write(output_data)
                 else:
-                    json.dump(output_data, f, indent=2)
+                    _json.dump(output_data, f, indent=True)
             return {
                 "command": args.command_path,
                 "ok": True,
                 "message": (
-                    f"Wrote output for {len(pids)} property/properties "
-                    f"to {args.output}"
+                    f"Wrote output for {len(resolved)} property/properties "
+                    f"to {args.output}{missing_note}"
                 ),
-                "details": {"pids": pids, "output_file": args.output},
+                "details": {
+                    "pids": resolved,
+                    "missing_pids": missing,
+                    "output_file": args.output,
+                },
             }
         else:
             # Print to stdout
             if isinstance(output_data, str):
                 print(output_data)
             else:
-                print(json.dumps(output_data, indent=2))
+                print(_json.dumps(output_data, indent=True, ensure_ascii=True))
             return {
                 "command": args.command_path,
                 "ok": True,
-                "message": f"Output for {len(pids)} property/properties",
-                "details": {"pids": pids},
+                "message": (
+                    f"Output for {len(resolved)} property/properties{missing_note}"
+                ),
+                "details": {"pids": resolved, "missing_pids": missing},
             }
 
     except Exception as exc:
@@ -918,11 +932,11 @@ def _handle_mash_eid(args: argparse.Namespace) -> dict[str, Any]:
         # Handle output (file or stdout)
         if args.output:
             # Write to file
-            with open(args.output, "w") as f:
+            with open(args.output, "w", encoding="utf-8") as f:
                 if isinstance(output_data, str):
                     f.write(output_data)
                 else:
-                    json.dump(output_data, f, indent=2)
+                    _json.dump(output_data, f, indent=True)
             return {
                 "command": args.command_path,
                 "ok": True,
@@ -934,7 +948,7 @@ def _handle_mash_eid(args: argparse.Namespace) -> dict[str, Any]:
             if isinstance(output_data, str):
                 print(output_data)
             else:
-                print(json.dumps(output_data, indent=2))
+                print(_json.dumps(output_data, indent=True, ensure_ascii=True))
             return {
                 "command": args.command_path,
                 "ok": True,
@@ -969,8 +983,8 @@ def _handle_mash_wp_template(args: argparse.Namespace) -> dict[str, Any]:
         # Handle output (file or stdout)
         if args.output:
             # Write to file
-            with open(args.output, "w") as f:
-                json.dump(output_data, f, indent=2)
+            with open(args.output, "w", encoding="utf-8") as f:
+                _json.dump(output_data, f, indent=True)
             return {
                 "command": args.command_path,
                 "ok": True,
@@ -984,7 +998,7 @@ def _handle_mash_wp_template(args: argparse.Namespace) -> dict[str, Any]:
             }
         else:
             # Print to stdout
-            print(json.dumps(output_data, indent=2))
+            print(_json.dumps(output_data, indent=True, ensure_ascii=True))
             return {
                 "command": args.command_path,
                 "ok": True,
@@ -1127,8 +1141,8 @@ def _handle_profile_validate(args: argparse.Namespace) -> dict[str, Any]:
         entity_data = item.to_dict()
         source = args.qid
     else:
-        with open(args.item_json, "r") as f:
-            entity_data = json.load(f)
+        with open(args.item_json, "rb") as f:
+            entity_data = _json.load(f)
         source = args.item_json
 
     validator = ProfileValidator(profile)
@@ -1163,11 +1177,11 @@ def _handle_profile_form_schema(args: argparse.Namespace) -> dict[str, Any]:
     schema = FormSchemaGenerator(profile).build_schema()
 
     if args.output:
-        with open(args.output, "w") as f:
-            json.dump(schema, f, indent=2)
+        with open(args.output, "w", encoding="utf-8") as f:
+            _json.dump(schema, f, indent=True)
         message = f"Wrote form schema to {args.output}"
     else:
-        print(json.dumps(schema))
+        print(_json.dumps(schema, ensure_ascii=True))
         message = "Form schema generated"
 
     return {
@@ -1289,21 +1303,25 @@ def _handle_profile_lookups_hydrate(args: argparse.Namespace) -> dict[str, Any]:
 
 def _emit_output(output: dict[str, Any], json_output: bool, verbose: bool) -> None:
     if json_output:
-        print(json.dumps(output))
+        sys.stdout.write(_json.dumps(output, ensure_ascii=True) + "\n")
         return
 
+    # Collect every line and write once rather than one print() per detail
+    lines = []
     message = output.get("message", "")
     if message:
-        print(message)
+        lines.append(message)
 
     # Show details for summary format or when verbose is requested
     details = output.get("details") or {}
     if details and (verbose or output.get("command", "").endswith(".qid")):
         if verbose and message:
             # Add blank line before details if message was printed
-            print()
-        for key, value in details.items():
-            print(f"{key}: {value}")
+            lines.append("")
+        lines.extend(f"{key}: {value}" for key, value in details.items())
+
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 if __name__ == "__main__":
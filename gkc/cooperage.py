@@ -13,12 +13,37 @@ lookups.
 Plain meaning: Central repository for target system schemas and metadata.
 """
 
-from typing import Optional
+import copy
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Optional, Union
 
 import requests
 
+from gkc import _http, _json
+
 DEFAULT_USER_AGENT = "GKC-Python-Client/0.1 (https://github.com/skybristol/gkc)"
 
+# Freshness limit (seconds) and entry bound for the in-process schema memos;
+# EntitySchemas get edited, so a long-running process must eventually refetch
+SCHEMA_MEMO_TTL = 3600.0
+SCHEMA_MEMO_SIZE = 128
+
+# EntitySchema text keyed by EID, shared by every caller in the process
+_schema_specification_cache: OrderedDict[str, tuple[float, str]] = OrderedDict()
+
+# Raw EntitySchema JSON keyed by EID; callers always receive a copy
+_entity_schema_json_cache: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+
+_schema_memo_lock = threading.Lock()
+
+# Opt-in on-disk cache shared across runs; see set_metadata_cache()
+_metadata_cache: Optional["MetadataCache"] = None
+
 
 class CooperageError(Exception):
     """Raised when Cooperage operations (Barrel Schema/reference management) fail."""
@@ -26,6 +51,142 @@ class CooperageError(Exception):
     pass
 
 
+def default_metadata_cache_path() -> Path:
+    """
+    Resolve the default on-disk metadata cache location.
+
+    Honors ``XDG_CACHE_HOME`` and falls back to ``~/.cache``.
+
+    Returns:
+        Path to ``gkc/metadata.sqlite3`` under the user cache directory
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "gkc" / "metadata.sqlite3"
+
+
+class MetadataCache:
+    """
+    Persistent key/value store for remote metadata lookups.
+
+    Entries live in a single SQLite table keyed by ``(kind, key)`` with the
+    time they were fetched, so repeated runs can skip network calls for
+    EntitySchemas, page existence checks, and similar lookups. ``max_age``
+    bounds how stale an entry may be before it is treated as missing.
+
+    Args:
+        path: SQLite file location (default: default_metadata_cache_path())
+        max_age: Default freshness limit in seconds; None keeps entries forever
+
+    Example:
+        >>> cache = MetadataCache(max_age=86400)
+        >>> cache.set("schema_text", "E502", "<Shape> {}")
+        >>> cache.get("schema_text", "E502")
+        '<Shape> {}'
+
+    Plain meaning: Remember Wikidata lookups on disk between runs.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Union[str, Path]] = None,
+        max_age: Optional[float] = None,
+    ):
+        self.path = Path(path) if path is not None else default_metadata_cache_path()
+        self.max_age = max_age
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(str(self.path), check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS metadata ("
+                "kind TEXT NOT NULL, key TEXT NOT NULL, payload BLOB NOT NULL, "
+                "fetched_at REAL NOT NULL, PRIMARY KEY (kind, key))"
+            )
+
+    def get(self, kind: str, key: str, max_age: Optional[float] = None) -> Any:
+        """
+        Look up a cached payload.
+
+        Args:
+            kind: Lookup family (e.g., 'schema_text', 'page_exists')
+            key: Key within the family
+            max_age: Freshness limit in seconds, overriding the cache default
+
+        Returns:
+            The stored payload, or None if missing or stale
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT payload, fetched_at FROM metadata WHERE kind = ? AND key = ?",
+                (kind, key),
+            ).fetchone()
+        if row is None:
+            return None
+
+        payload, fetched_at = row
+        limit = self.max_age if max_age is None else max_age
+        if limit is not None and time.time() - fetched_at > limit:
+            return None
+        return _json.loads(payload)
+
+    def set(self, kind: str, key: str, payload: Any) -> None:
+        """
+        Store a JSON-compatible payload, replacing any existing entry.
+
+        Args:
+            kind: Lookup family
+            key: Key within the family
+            payload: JSON-compatible value to store
+        """
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO metadata VALUES (?, ?, ?, ?)",
+                (kind, key, _json.dumps(payload), time.time()),
+            )
+
+    def clear(self, kind: Optional[str] = None) -> None:
+        """
+        Remove cached entries.
+
+        Args:
+            kind: Only remove entries of this family; None removes everything
+        """
+        with self._lock, self._connection:
+            if kind is None:
+                self._connection.execute("DELETE FROM metadata")
+            else:
+                self._connection.execute("DELETE FROM metadata WHERE kind = ?", (kind,))
+
+    def close(self) -> None:
+        """Close the underlying SQLite connection."""
+        self._connection.close()
+
+
+def set_metadata_cache(cache: Optional[MetadataCache]) -> None:
+    """
+    Set the package-wide on-disk metadata cache.
+
+    Pass None to disable persistent caching (the default).
+
+    Args:
+        cache: MetadataCache instance to share, or None
+
+    Plain meaning: Turn on (or off) remembering lookups between runs.
+    """
+    global _metadata_cache
+    _metadata_cache = cache
+
+
+def get_metadata_cache() -> Optional[MetadataCache]:
+    """
+    Get the package-wide on-disk metadata cache, if one is configured.
+
+    Returns:
+        The active MetadataCache, or None when persistent caching is off
+    """
+    return _metadata_cache
+
+
 def fetch_entity_rdf(
     qid: str, format: str = "ttl", user_agent: Optional[str] = None
 ) -> str:
@@ -59,7 +220,7 @@ def fetch_entity_rdf(
     headers = {"User-Agent": user_agent or DEFAULT_USER_AGENT}
 
     try:
-        response = requests.get(url, headers=headers, timeout=30)
+        response = _http.get(url, headers=headers, timeout=30)
         response.raise_for_status()
         return response.text
     except requests.RequestException as e:
@@ -68,7 +229,32 @@ def fetch_entity_rdf(
         ) from e
 
 
-def fetch_schema_specification(eid: str, user_agent: Optional[str] = None) -> str:
+def _memo_get(memo: OrderedDict, eid: str) -> Any:
+    """Return a fresh memo entry for an EID, or None (evicting stale ones)."""
+    with _schema_memo_lock:
+        entry = memo.get(eid)
+        if entry is None:
+            return None
+        fetched_at, value = entry
+        if time.monotonic() - fetched_at > SCHEMA_MEMO_TTL:
+            del memo[eid]
+            return None
+        memo.move_to_end(eid)
+        return value
+
+
+def _memo_set(memo: OrderedDict, eid: str, value: Any) -> None:
+    """Store a memo entry, dropping the least recently used past the bound."""
+    with _schema_memo_lock:
+        memo[eid] = (time.monotonic(), value)
+        memo.move_to_end(eid)
+        while len(memo) > SCHEMA_MEMO_SIZE:
+            memo.popitem(last=False)
+
+
+def fetch_schema_specification(
+    eid: str, user_agent: Optional[str] = None, use_cache: bool = True
+) -> str:
     """
     Fetch Wikidata Barrel Schema (EntitySchema in ShExC format).
 
@@ -76,11 +262,20 @@ def fetch_schema_specification(eid: str, user_agent: Optional[str] = None) -> st
     define the shape and structure constraints that form part of Wikidata's
     Barrel Schema (along with property constraints).
 
+    Schema text is memoized per EID, so repeated validators or builders for the
+    same EntitySchema only fetch it once. The memo keeps at most
+    SCHEMA_MEMO_SIZE schemas (least recently used are dropped first) and
+    refetches entries older than SCHEMA_MEMO_TTL seconds (default one hour),
+    so edits on Wikidata reach long-running processes. When
+    a MetadataCache is configured (see set_metadata_cache()), text is also
+    read from and written to disk so later runs skip the fetch entirely.
+
     Plain meaning: Get the shape/structure specification for Wikidata entities.
 
     Args:
         eid: EntitySchema ID (e.g., 'E502')
         user_agent: Custom user agent string
+        use_cache: Reuse previously fetched schema text (default: True)
 
     Returns:
         ShExC schema text as string
@@ -94,9 +289,48 @@ def fetch_schema_specification(eid: str, user_agent: Optional[str] = None) -> st
     if not eid:
         raise ValueError("EntitySchema ID (eid) is required")
 
+    if use_cache:
+        memoized: Optional[str] = _memo_get(_schema_specification_cache, eid)
+        if memoized is not None:
+            return memoized
+
+    disk_cache = _metadata_cache
+    if use_cache and disk_cache is not None:
+        cached = disk_cache.get("schema_text", eid)
+        if isinstance(cached, str):
+            _memo_set(_schema_specification_cache, eid, cached)
+            return cached
+
+    schema_text = _fetch_schema_text(eid, user_agent, use_cache)
+    _memo_set(_schema_specification_cache, eid, schema_text)
+    if disk_cache is not None:
+        disk_cache.set("schema_text", eid, schema_text)
+    return schema_text
+
+
+def clear_schema_cache() -> None:
+    """
+    Discard all memoized EntitySchema text and JSON.
+
+    Only the in-process memo is cleared; use MetadataCache.clear() to drop
+    entries persisted on disk.
+
+    Plain meaning: Force the next schema fetch to go back to Wikidata.
+    """
+    with _schema_memo_lock:
+        _schema_specification_cache.clear()
+        _entity_schema_json_cache.clear()
+
+
+def _fetch_schema_text(
+    eid: str, user_agent: Optional[str], use_cache: bool = True
+) -> str:
+    """Fetch EntitySchema text from Wikidata without consulting the text cache."""
     # Prefer the EntitySchema JSON content (action=raw), which includes schemaText
     try:
-        schema_json = fetch_entity_schema_json(eid, user_agent=user_agent)
+        schema_json = fetch_entity_schema_json(
+            eid, user_agent=user_agent, use_cache=use_cache
+        )
         schema_text = schema_json.get("schemaText")
         if isinstance(schema_text, str) and schema_text.strip():
             return schema_text
@@ -108,7 +342,7 @@ def fetch_schema_specification(eid: str, user_agent: Optional[str] = None) -> st
     headers = {"User-Agent": user_agent or DEFAULT_USER_AGENT}
 
     try:
-        response = requests.get(url, headers=headers, timeout=30)
+        response = _http.get(url, headers=headers, timeout=30)
         response.raise_for_status()
         return response.text
     except requests.RequestException as e:
@@ -117,19 +351,25 @@ def fetch_schema_specification(eid: str, user_agent: Optional[str] = None) -> st
         ) from e
 
 
-def fetch_entity_schema_json(eid: str, user_agent: Optional[str] = None) -> dict:
+def fetch_entity_schema_json(
+    eid: str, user_agent: Optional[str] = None, use_cache: bool = True
+) -> dict:
     """
     Fetch the JSON content for a Wikidata EntitySchema.
 
     Uses the MediaWiki raw action endpoint to retrieve the full EntitySchema
     JSON, which includes labels, descriptions, aliases, and schemaText.
+    The JSON is memoized per EID (with the same SCHEMA_MEMO_TTL and
+    SCHEMA_MEMO_SIZE limits as fetch_schema_specification), so loading a
+    template, its metadata, and its schema text costs one request.
 
     Args:
         eid: EntitySchema ID (e.g., 'E502')
         user_agent: Custom user agent string
+        use_cache: Reuse previously fetched JSON (default: True)
 
     Returns:
-        Parsed JSON dictionary for the EntitySchema
+        Parsed JSON dictionary for the EntitySchema (a private copy)
 
     Raises:
         CooperageError: If fetch or parsing fails
@@ -137,11 +377,21 @@ def fetch_entity_schema_json(eid: str, user_agent: Optional[str] = None) -> dict
     if not eid:
         raise ValueError("EntitySchema ID (eid) is required")
 
+    data = _memo_get(_entity_schema_json_cache, eid) if use_cache else None
+    if data is None:
+        data = _fetch_entity_schema_json(eid, user_agent)
+        _memo_set(_entity_schema_json_cache, eid, data)
+    return copy.deepcopy(data)
+
+
+def _fetch_entity_schema_json(eid: str, user_agent: Optional[str]) -> dict:
+    """Fetch EntitySchema JSON from Wikidata without consulting the cache."""
+
     url = f"https://www.wikidata.org/wiki/EntitySchema:{eid}?action=raw"
     headers = {"User-Agent": user_agent or DEFAULT_USER_AGENT}
 
     try:
-        response = requests.get(url, headers=headers, timeout=30)
+        response = _http.get(url, headers=headers, timeout=30)
         response.raise_for_status()
         data = response.json()
         if not isinstance(data, dict):
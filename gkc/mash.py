@@ -20,13 +20,33 @@ from __future__ import annotations
 
 import copy
 import json
+import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import Any, Optional, Protocol, Union
 
 import requests
 
+from gkc import _http, _json
 from gkc.sparql import fetch_entity_labels
 
+# wbgetentities accepts at most 50 IDs per request
+_ENTITY_BATCH_SIZE = 50
+
+# Tokens that matter when locating shape declarations: a ``<label>`` opening a
+# line, other IRIs, string literals, and comments (skipped so their contents
+# cannot count as braces), and braces. Only labels outside every ``{ ... }``
+# declare shapes (``<tribe> EXTRA wdt:P31 {``); inside a body a line can also
+# open with a full-IRI predicate such as ``<http://...prop/direct/P31>``.
+_SHAPE_TOKEN = re.compile(
+    r"""(?P<label>^[ \t]*<(?P<name>[^>\s]+)>)"""
+    r"""|<[^>\s]*>|"(?:[^"\\\n]|\\.)*"|'(?:[^'\\\n]|\\.)*'|#[^\n]*"""
+    r"""|(?P<open>\{)|(?P<close>\})""",
+    re.MULTILINE,
+)
+# Property references through any of the Wikidata statement prefixes
+_PROPERTY_REFERENCE = re.compile(r"\b(?:wdt|p|ps|pq|pr|psv|pqv|prv):(P\d+)\b")
+
 
 class DataTemplate(Protocol):
     """Abstract interface for all data templates in the mash module.
@@ -278,32 +298,29 @@ class WikidataTemplate:
             return
 
         # Convert single string to list for uniform handling
-        if isinstance(languages, str):
-            languages = [languages]
+        keep = frozenset([languages] if isinstance(languages, str) else languages)
 
         # Filter each field
-        self.labels = {k: v for k, v in self.labels.items() if k in languages}
-        self.descriptions = {
-            k: v for k, v in self.descriptions.items() if k in languages
-        }
-        self.aliases = {k: v for k, v in self.aliases.items() if k in languages}
+        self.labels = {k: v for k, v in self.labels.items() if k in keep}
+        self.descriptions = {k: v for k, v in self.descriptions.items() if k in keep}
+        self.aliases = {k: v for k, v in self.aliases.items() if k in keep}
 
         labels = self.entity_data.get("labels")
         if isinstance(labels, dict):
             self.entity_data["labels"] = {
-                lang: value for lang, value in labels.items() if lang in languages
+                lang: value for lang, value in labels.items() if lang in keep
             }
 
         descriptions = self.entity_data.get("descriptions")
         if isinstance(descriptions, dict):
             self.entity_data["descriptions"] = {
-                lang: value for lang, value in descriptions.items() if lang in languages
+                lang: value for lang, value in descriptions.items() if lang in keep
             }
 
         aliases = self.entity_data.get("aliases")
         if isinstance(aliases, dict):
             self.entity_data["aliases"] = {
-                lang: value for lang, value in aliases.items() if lang in languages
+                lang: value for lang, value in aliases.items() if lang in keep
             }
 
     def summary(self) -> dict[str, Any]:
@@ -442,32 +459,29 @@ class WikidataPropertyTemplate:
             return
 
         # Convert single string to list for uniform handling
-        if isinstance(languages, str):
-            languages = [languages]
+        keep = frozenset([languages] if isinstance(languages, str) else languages)
 
         # Filter each field
-        self.labels = {k: v for k, v in self.labels.items() if k in languages}
-        self.descriptions = {
-            k: v for k, v in self.descriptions.items() if k in languages
-        }
-        self.aliases = {k: v for k, v in self.aliases.items() if k in languages}
+        self.labels = {k: v for k, v in self.labels.items() if k in keep}
+        self.descriptions = {k: v for k, v in self.descriptions.items() if k in keep}
+        self.aliases = {k: v for k, v in self.aliases.items() if k in keep}
 
         labels = self.entity_data.get("labels")
         if isinstance(labels, dict):
             self.entity_data["labels"] = {
-                lang: value for lang, value in labels.items() if lang in languages
+                lang: value for lang, value in labels.items() if lang in keep
             }
 
         descriptions = self.entity_data.get("descriptions")
         if isinstance(descriptions, dict):
             self.entity_data["descriptions"] = {
-                lang: value for lang, value in descriptions.items() if lang in languages
+                lang: value for lang, value in descriptions.items() if lang in keep
             }
 
         aliases = self.entity_data.get("aliases")
         if isinstance(aliases, dict):
             self.entity_data["aliases"] = {
-                lang: value for lang, value in aliases.items() if lang in languages
+                lang: value for lang, value in aliases.items() if lang in keep
             }
 
     def summary(self) -> dict[str, Any]:
@@ -537,6 +551,68 @@ class WikidataEntitySchemaTemplate:
     descriptions: dict[str, str]
     schema_text: str
     entity_data: dict[str, Any]
+    _shape_spans: Optional[dict[str, tuple[int, int]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def _index_shapes(self) -> dict[str, tuple[int, int]]:
+        """Record ``(start, end)`` offsets of each shape declaration.
+
+        The scan runs once and only locates declarations; shape bodies are
+        sliced out on demand by :meth:`shape_text`.
+        """
+        if self._shape_spans is None:
+            starts = []
+            depth = 0
+            for match in _SHAPE_TOKEN.finditer(self.schema_text):
+                if match.group("open"):
+                    depth += 1
+                elif match.group("close"):
+                    depth = max(depth - 1, 0)
+                elif match.group("label") and depth == 0:
+                    starts.append((match.group("name"), match.start()))
+            spans: dict[str, tuple[int, int]] = {}
+            for index, (name, start) in enumerate(starts):
+                end = (
+                    starts[index + 1][1]
+                    if index + 1 < len(starts)
+                    else len(self.schema_text)
+                )
+                spans.setdefault(name, (start, end))
+            self._shape_spans = spans
+        return self._shape_spans
+
+    def shape_names(self) -> list[str]:
+        """Return shape labels declared in the schema, in declaration order.
+
+        Plain meaning: List the shapes this EntitySchema defines.
+        """
+        return list(self._index_shapes())
+
+    def shape_text(self, name: str) -> str:
+        """Return the ShExC text for a single shape declaration.
+
+        Args:
+            name: Shape label without angle brackets (e.g., "wikidata-tribe").
+
+        Raises:
+            KeyError: If the schema does not declare the shape.
+
+        Plain meaning: Pull out just one shape from the schema text.
+        """
+        start, end = self._index_shapes()[name]
+        return self.schema_text[start:end].rstrip()
+
+    def property_ids(self, shape: Optional[str] = None) -> list[str]:
+        """Return unique property IDs referenced by the schema or one shape.
+
+        Args:
+            shape: Optional shape label to restrict the scan to.
+
+        Plain meaning: Which Wikidata properties does this schema talk about?
+        """
+        text = self.shape_text(shape) if shape else self.schema_text
+        return list(dict.fromkeys(_PROPERTY_REFERENCE.findall(text)))
 
     def filter_languages(
         self, languages: Optional[Union[str, list[str]]] = None
@@ -562,25 +638,22 @@ class WikidataEntitySchemaTemplate:
             return
 
         # Convert single string to list for uniform handling
-        if isinstance(languages, str):
-            languages = [languages]
+        keep = frozenset([languages] if isinstance(languages, str) else languages)
 
         # Filter each field
-        self.labels = {k: v for k, v in self.labels.items() if k in languages}
-        self.descriptions = {
-            k: v for k, v in self.descriptions.items() if k in languages
-        }
+        self.labels = {k: v for k, v in self.labels.items() if k in keep}
+        self.descriptions = {k: v for k, v in self.descriptions.items() if k in keep}
 
         labels = self.entity_data.get("labels")
         if isinstance(labels, dict):
             self.entity_data["labels"] = {
-                lang: value for lang, value in labels.items() if lang in languages
+                lang: value for lang, value in labels.items() if lang in keep
             }
 
         descriptions = self.entity_data.get("descriptions")
         if isinstance(descriptions, dict):
             self.entity_data["descriptions"] = {
-                lang: value for lang, value in descriptions.items() if lang in languages
+                lang: value for lang, value in descriptions.items() if lang in keep
             }
 
     def summary(self) -> dict[str, Any]:
@@ -701,14 +774,18 @@ class WikidataLoader:
         """
         return self.load_item(qid)
 
-    def load_items(self, qids: list[str]) -> dict[str, WikidataTemplate]:
+    def load_items(
+        self, qids: list[str], max_workers: int = 4
+    ) -> dict[str, WikidataTemplate]:
         """Load multiple Wikidata items in batch and return them as templates.
 
         Uses the wbgetentities API to efficiently fetch multiple items in batches
-        of 50. Handles partial failures gracefully.
+        of 50, with several batches in flight at once. Handles partial failures
+        gracefully.
 
         Args:
             qids: List of Wikidata item IDs (e.g., ['Q42', 'Q5']).
+            max_workers: Maximum number of batch requests issued concurrently.
 
         Returns:
             Dict mapping QIDs to WikidataTemplates. Only successfully loaded
@@ -730,20 +807,14 @@ class WikidataLoader:
 
         result: dict[str, WikidataTemplate] = {}
 
-        # Process in batches of 50 (wbgetentities limit)
-        batch_size = 50
-        for i in range(0, len(qids), batch_size):
-            batch = qids[i : i + batch_size]
-            batch_results = self._fetch_entities_batch(batch)
-
-            # Build templates for each successfully fetched entity
-            for qid, entity_data in batch_results.items():
-                try:
-                    template = self._build_template(qid, entity_data)
-                    result[qid] = template
-                except Exception:
-                    # Skip items that fail to parse
-                    continue
+        # Build templates for each successfully fetched entity
+        for qid, entity_data in self._fetch_entities(qids, max_workers).items():
+            try:
+                template = self._build_template(qid, entity_data)
+                result[qid] = template
+            except Exception:
+                # Skip items that fail to parse
+                continue
 
         return result
 
@@ -769,6 +840,37 @@ class WikidataLoader:
         entity_data = self.load_entity_data(pid)
         return self._build_property_template(pid, entity_data)
 
+    def load_properties(
+        self, pids: list[str], max_workers: int = 4
+    ) -> dict[str, WikidataPropertyTemplate]:
+        """Load multiple Wikidata properties in batch and return them as templates.
+
+        Properties are fetched 50 at a time through wbgetentities with several
+        batches in flight at once, instead of one request per property. Useful
+        for resolving every property an EntitySchema references, e.g.
+        ``loader.load_properties(schema.property_ids())``.
+
+        Args:
+            pids: List of Wikidata property IDs (e.g., ['P31', 'P17']).
+            max_workers: Maximum number of batch requests issued concurrently.
+
+        Returns:
+            Dict mapping PIDs to WikidataPropertyTemplates, in input order.
+            Properties that do not exist are omitted.
+
+        Raises:
+            RuntimeError: If a batch request fails.
+
+        Plain meaning: Load many property definitions with few requests.
+        """
+        if not pids:
+            return {}
+
+        return {
+            pid: self._build_property_template(pid, entity_data)
+            for pid, entity_data in self._fetch_entities(pids, max_workers).items()
+        }
+
     def load_entity_schema(self, eid: str) -> WikidataEntitySchemaTemplate:
         """Load a Wikidata EntitySchema and return it as a template.
 
@@ -793,6 +895,41 @@ class WikidataLoader:
         entity_data = fetch_entity_schema_json(eid, user_agent=self.user_agent)
         return self._build_entity_schema_template(eid, entity_data)
 
+    def _fetch_entities(
+        self, entity_ids: list[str], max_workers: int
+    ) -> dict[str, dict[str, Any]]:
+        """Fetch entities in wbgetentities-sized batches, several at a time.
+
+        Args:
+            entity_ids: Entity IDs to fetch (any number).
+            max_workers: Maximum number of batch requests issued concurrently.
+
+        Returns:
+            Dict mapping entity IDs to their entity data, in input order.
+
+        Plain meaning: Fetch a long list of entities as quickly as is polite.
+        """
+        # De-duplicate so each entity is requested once
+        unique_ids = list(dict.fromkeys(entity_ids))
+        batches = [
+            unique_ids[i : i + _ENTITY_BATCH_SIZE]
+            for i in range(0, len(unique_ids), _ENTITY_BATCH_SIZE)
+        ]
+
+        # The work is network-bound, so threads overlap the round trips
+        if max_workers > 1 and len(batches) > 1:
+            with ThreadPoolExecutor(
+                max_workers=min(max_workers, len(batches))
+            ) as executor:
+                batch_results = list(executor.map(self._fetch_entities_batch, batches))
+        else:
+            batch_results = [self._fetch_entities_batch(batch) for batch in batches]
+
+        entities: dict[str, dict[str, Any]] = {}
+        for fetched in batch_results:
+            entities.update(fetched)
+        return {eid: entities[eid] for eid in unique_ids if eid in entities}
+
     def _fetch_entities_batch(self, entity_ids: list[str]) -> dict[str, dict[str, Any]]:
         """Fetch multiple entities using wbgetentities API.
 
@@ -819,7 +956,7 @@ class WikidataLoader:
             headers["User-Agent"] = self.user_agent
 
         try:
-            response = requests.get(url, params=params, headers=headers, timeout=30)
+            response = _http.get(url, params=params, headers=headers, timeout=30)
             response.raise_for_status()
             data = response.json()
 
@@ -871,7 +1008,7 @@ class WikidataLoader:
             headers["User-Agent"] = self.user_agent
 
         try:
-            response = requests.get(url, headers=headers, timeout=30)
+            response = _http.get(url, headers=headers, timeout=30)
 
             # Handle 404 or 400 errors which indicate item doesn't exist
             if response.status_code == 404:
@@ -901,7 +1038,7 @@ class WikidataLoader:
         """
 
         try:
-            response = json.loads(json_text)
+            response = _json.loads(json_text)
         except json.JSONDecodeError as exc:
             raise ValueError(f"Failed to parse JSON response for {qid}: {exc}") from exc
 
@@ -1284,7 +1421,7 @@ class WikipediaLoader:
         }
 
         try:
-            response = requests.get(
+            response = _http.get(
                 self.base_url,
                 params=params,
                 headers={"User-Agent": self.user_agent},
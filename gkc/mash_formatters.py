@@ -53,6 +53,7 @@ class QSV1Formatter:
         """
 
         lines: list[str] = []
+        excluded = frozenset(self.exclude_properties)
 
         if for_new_item:
             lines.append("CREATE")
@@ -70,7 +71,7 @@ class QSV1Formatter:
 
             # Add claims with inline comments
             for claim in template.claims:
-                if claim.property_id in self.exclude_properties:
+                if claim.property_id in excluded:
                     continue
 
                 line = self._claim_to_qs_line("LAST", claim)
@@ -86,7 +87,7 @@ class QSV1Formatter:
                 lines.append(f'{qid}\tDn\t"{text}"')
 
             for claim in template.claims:
-                if claim.property_id in self.exclude_properties:
+                if claim.property_id in excluded:
                     continue
 
                 line = self._claim_to_qs_line(qid, claim)
@@ -51,14 +51,12 @@ class TypeAheadSelect(Vertical):
     ) -> Dict[str, List[tuple[str, str]]]:
         """Build normalized search index for fast prefix matching."""
         index: Dict[str, List[tuple[str, str]]] = {}
-        for id_, label in choices:
-            normalized = label.lower()
+        # De-duplicate up front: a choice's prefixes are all distinct, so each
+        # bucket then needs no linear membership scan while it is filled.
+        for choice in dict.fromkeys(choices):
+            normalized = choice[1].lower()
             for i in range(1, len(normalized) + 1):
-                prefix = normalized[:i]
-                if prefix not in index:
-                    index[prefix] = []
-                if (id_, label) not in index[prefix]:
-                    index[prefix].append((id_, label))
+                index.setdefault(normalized[:i], []).append(choice)
         return index
 
     def compose(self) -> ComposeResult:
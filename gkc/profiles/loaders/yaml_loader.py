@@ -5,15 +5,27 @@ Plain meaning: Load YAML profile files into typed Python objects.
 
 from __future__ import annotations
 
-import json
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Iterable, Optional, Union
 
 import yaml
 from jsonschema import Draft202012Validator
 
+from gkc import _json
 from gkc.profiles.models import ProfileDefinition
 
+_DEFAULT_SCHEMA_PATH = (
+    Path(__file__).resolve().parents[1] / "schemas" / "profile.schema.json"
+)
+
+
+@lru_cache(maxsize=8)
+def _read_schema(path: Path, mtime_ns: int) -> dict[str, Any]:
+    """Parse a profile JSON schema; ``mtime_ns`` keys out stale entries."""
+    schema: dict[str, Any] = _json.loads(path.read_bytes())
+    return schema
+
 
 class ProfileLoader:
     """Load YAML profile definitions into ProfileDefinition objects.
@@ -132,9 +144,10 @@ class ProfileLoader:
             yield f"{path}: {error.message}"
 
     def _load_schema(self) -> dict[str, Any]:
-        schema_text = self._schema_path.read_text(encoding="utf-8")
-        return json.loads(schema_text)
+        # Every ProfileLoader shares one parsed copy of an unchanged schema file
+        path = Path(self._schema_path)
+        return _read_schema(path, path.stat().st_mtime_ns)
 
     @staticmethod
     def _default_schema_path() -> Path:
-        return Path(__file__).resolve().parents[1] / "schemas" / "profile.schema.json"
+        return _DEFAULT_SCHEMA_PATH
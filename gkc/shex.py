@@ -7,10 +7,10 @@ and validation of local RDF data against local or remote ShEx schemas.
 Plain meaning: Check if Wikidata data matches schema requirements.
 """
 
+import gzip
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
-
-from pyshex import ShExEvaluator  # type: ignore[import-untyped]
+from typing import Any, Optional, Union
 
 from gkc.cooperage import (
     CooperageError,
@@ -26,6 +26,29 @@ class ShexValidationError(Exception):
     pass
 
 
+@lru_cache(maxsize=64)
+def _parse_schema(schema_text: str) -> tuple[Any, Any]:
+    """Parse ShExC text once per process and reuse the compiled schema."""
+    # pyshex pulls in rdflib and the ShExC parser (~150 ms); only pay for it
+    # when a schema is actually evaluated, not on ``import gkc``.
+    from pyshex import PrefixLibrary  # type: ignore[import-untyped]
+    from pyshex.utils.schema_loader import (  # type: ignore[import-untyped]
+        SchemaLoader,
+    )
+
+    loader = SchemaLoader()
+    schema = loader.loads(schema_text)
+    if schema is None:
+        raise ValueError("Unable to parse ShEx schema")
+    return schema, PrefixLibrary(loader.schema_text)
+
+
+@lru_cache(maxsize=32)
+def _read_schema_file(path: str, mtime_ns: int) -> str:
+    """Read a schema file; ``mtime_ns`` keys out stale cache entries."""
+    return Path(path).read_text(encoding="utf-8")
+
+
 class ShexValidator:
     """
     ShEx Validator: Validate RDF data against ShEx schemas.
@@ -80,6 +103,7 @@ class ShexValidator:
             schema_file: Path to file containing ShEx schema (alternative to eid).
             rdf_text: RDF data as a string (alternative to qid).
             rdf_file: Path to file containing RDF data (alternative to qid).
+                Gzip-compressed Turtle (``.ttl.gz``) is read directly.
         """
         self.qid = qid
         self.eid = eid
@@ -90,7 +114,10 @@ class ShexValidator:
         self.rdf_file = rdf_file
 
         self._schema: Optional[str] = None
-        self._rdf: Optional[str] = None
+        # RDF text, or the path of an RDF file that is parsed straight from disk
+        self._rdf: Optional[Union[str, Path]] = None
+        self._graph: Any = None
+        self._graph_source: Optional[Union[str, Path]] = None
         self.results = None
 
     def load_specification(self) -> "ShexValidator":
@@ -114,7 +141,10 @@ class ShexValidator:
                     raise ShexValidationError(
                         f"Schema file not found: {self.schema_file}"
                     )
-                self._schema = schema_path.read_text(encoding="utf-8")
+                resolved = str(schema_path.resolve())
+                self._schema = _read_schema_file(
+                    resolved, schema_path.stat().st_mtime_ns
+                )
             elif self.eid:
                 self._schema = fetch_schema_specification(self.eid, self.user_agent)
             else:
@@ -130,6 +160,50 @@ class ShexValidator:
 
         return self
 
+    def with_rdf(
+        self,
+        rdf_file: Optional[str] = None,
+        rdf_text: Optional[str] = None,
+        qid: Optional[str] = None,
+    ) -> "ShexValidator":
+        """
+        Create a validator for other RDF data that shares this schema.
+
+        The schema is loaded once (if it has not been already) and handed to
+        the new validator as text, so checking many entities against the same
+        schema reads, fetches, and parses it only once.
+
+        Args:
+            rdf_file: Path to file containing RDF data
+            rdf_text: RDF data as a string
+            qid: Wikidata entity ID to fetch and validate
+
+        Returns:
+            New ShexValidator with the same schema and the given RDF source
+
+        Raises:
+            ShexValidationError: If the schema cannot be loaded
+
+        Plain meaning: Reuse one schema to check several pieces of data.
+
+        Example:
+            >>> base = ShexValidator(schema_file='schema.shex')
+            >>> base.with_rdf(rdf_file='valid.ttl').check().is_valid()
+            >>> base.with_rdf(rdf_file='invalid.ttl').check().is_valid()
+        """
+        if self._schema is None:
+            self.load_specification()
+
+        return ShexValidator(
+            qid=qid,
+            eid=self.eid,
+            user_agent=self.user_agent,
+            schema_text=self._schema,
+            schema_file=self.schema_file,
+            rdf_text=rdf_text,
+            rdf_file=rdf_file,
+        )
+
     def load_rdf(self) -> "ShexValidator":
         """
         Load RDF data from configured source.
@@ -150,7 +224,7 @@ class ShexValidator:
                 if not rdf_path.exists():
                     msg = f"RDF file not found: {self.rdf_file}"
                     raise ShexValidationError(msg)
-                self._rdf = rdf_path.read_text(encoding="utf-8")
+                self._rdf = rdf_path
             elif self.qid:
                 self._rdf = fetch_entity_rdf(
                     self.qid, format="ttl", user_agent=self.user_agent
@@ -204,16 +278,51 @@ class ShexValidator:
         if self.qid:
             focus = get_entity_uri(self.qid)
 
+        from pyshex import ShExEvaluator  # type: ignore[import-untyped]
+
         try:
-            self.results = ShExEvaluator(
-                rdf=self._rdf, schema=self._schema, focus=focus
-            ).evaluate()
+            schema, prefixes = _parse_schema(self._schema)
+            graph = self._parsed_graph(self._rdf)
+            evaluator = ShExEvaluator(rdf=graph, schema=schema, focus=focus)
+            evaluator.pfx = prefixes
+            self.results = evaluator.evaluate()
         except Exception as e:
             msg = f"ShEx evaluation failed: {str(e)}"
             raise ShexValidationError(msg) from e
 
         return self
 
+    def _parsed_graph(self, rdf: Union[str, Path]) -> Any:
+        """
+        Parse Turtle into an rdflib Graph, reusing it while the RDF is unchanged.
+
+        Handing pyshex a parsed Graph means repeated evaluations (for example
+        against several schemas) parse the data once, and text without line
+        breaks is never mistaken for a file location. Files are streamed to
+        the parser as bytes (decompressing ``.gz`` on the fly) rather than
+        first being decoded into one large Python string.
+        """
+        if self._graph is None or self._graph_source is not rdf:
+            from rdflib import Graph
+
+            graph = Graph()
+            if isinstance(rdf, Path):
+                if rdf.suffix == ".gz":
+                    with gzip.open(rdf, "rb") as gz_stream:
+                        # GzipFile is a binary stream; rdflib's stubs omit it
+                        graph.parse(
+                            source=gz_stream,  # type: ignore[arg-type]
+                            format="turtle",
+                        )
+                else:
+                    with open(rdf, "rb") as stream:
+                        graph.parse(source=stream, format="turtle")
+            else:
+                graph.parse(data=rdf, format="turtle")
+            self._graph = graph
+            self._graph_source = rdf
+        return self._graph
+
     def check(self) -> "ShexValidator":
         """
         Validate: Load schema, load RDF, and evaluate in one call.
@@ -10,10 +10,10 @@ Plain meaning: Send Bottled output to target APIs in a safe, testable way.
 from __future__ import annotations
 
 import copy
-import json
 from dataclasses import dataclass, field
 from typing import Any, Optional
 
+from gkc import _json
 from gkc.auth import OpenStreetMapAuth, WikiverseAuth
 
 
@@ -61,7 +61,7 @@ class WriteResult:
         Plain meaning: Turn the result into a JSON string.
         """
 
-        return json.dumps(self.to_dict(), sort_keys=True)
+        return _json.dumps(self.to_dict(), sort_keys=True)
 
 
 class Shipper:
@@ -174,9 +174,12 @@ class WikidataShipper(Shipper):
 
         response = self.auth.session.post(self.api_url, data=request_data)
         response.raise_for_status()
-        response_json = response.json()
+        response_json = _json.loads(response.content)
 
         if "error" in response_json:
+            if response_json["error"].get("code") == "badtoken":
+                # Session token went stale; fetch a fresh one on the next write
+                self.auth.invalidate_csrf_token()
             warnings.append(self._format_api_error(response_json["error"]))
             return WriteResult(
                 entity_id=entity_id,
@@ -238,7 +241,7 @@ class WikidataShipper(Shipper):
             "action": "wbeditentity",
             "format": "json",
             "token": csrf_token,
-            "data": json.dumps(payload),
+            "data": _json.dumps(payload),
             "summary": summary,
         }
 
@@ -5,12 +5,17 @@ This module provides utilities for validating Wikipedia and other Wikimedia
 project sitelinks before attempting to create them on Wikidata items.
 """
 
+import sys
 from time import sleep
-from typing import Optional
+from typing import Any, Iterable, Optional
 
 import requests
 
-from gkc.cooperage import DEFAULT_USER_AGENT
+from gkc import _http
+from gkc.cooperage import DEFAULT_USER_AGENT, MetadataCache, get_metadata_cache
+
+# MediaWiki accepts at most 50 titles per query for regular accounts
+MAX_TITLES_PER_QUERY = 50
 
 
 class SitelinkValidator:
@@ -37,18 +42,28 @@ class SitelinkValidator:
         # Add more as needed - pattern: {lang}wiki, {lang}wikisource, etc.
     }
 
-    def __init__(self, user_agent: str = DEFAULT_USER_AGENT, timeout: int = 10):
+    def __init__(
+        self,
+        user_agent: str = DEFAULT_USER_AGENT,
+        timeout: int = 10,
+        cache: Optional[MetadataCache] = None,
+        session: Optional[requests.Session] = None,
+    ):
         """
         Initialize the sitelink validator.
 
         Args:
             user_agent: User agent string for API requests
             timeout: Timeout in seconds for API requests
+            cache: On-disk cache for page existence results (default: the
+                package-wide cache from set_metadata_cache(), if any)
+            session: HTTP session to use (default: the package-wide pooled
+                session, so validators share keep-alive connections)
         """
         self.user_agent = user_agent
         self.timeout = timeout
-        self.session = requests.Session()
-        self.session.headers.update({"User-Agent": user_agent})
+        self.cache = cache if cache is not None else get_metadata_cache()
+        self.session = session if session is not None else _http.session()
 
     def _get_api_endpoint(self, site_code: str) -> Optional[str]:
         """
@@ -98,50 +113,205 @@ class SitelinkValidator:
             - (True, ""): Page exists and is valid
             - (False, reason): Page doesn't exist or is invalid, with reason
         """
-        if not title or not title.strip():
-            return (False, "Empty title")
+        return self.check_pages_exist([title], site_code, allow_redirects)[title]
+
+    def check_pages_exist(
+        self,
+        titles: Iterable[str],
+        site_code: str,
+        allow_redirects: bool = False,
+        delay_between_checks: float = 0.0,
+    ) -> dict[str, tuple[bool, str]]:
+        """
+        Check many page titles on one site using batched API queries.
+
+        Titles are sent up to ``MAX_TITLES_PER_QUERY`` at a time in a single
+        ``action=query`` request, so checking hundreds of pages costs a handful
+        of round trips instead of one per title.
+
+        Args:
+            titles: Page titles to check
+            site_code: Site code (e.g., 'enwiki', 'commonswiki')
+            allow_redirects: If False, report redirect pages as invalid
+            delay_between_checks: Delay in seconds between batch requests
+                (rate limiting)
+
+        Returns:
+            Dictionary mapping each input title to (exists: bool, message: str),
+            using the same messages as check_page_exists()
+
+        Plain meaning: Check lots of pages on one wiki with few requests.
+        """
+        results: dict[str, tuple[bool, str]] = {}
+        pending: dict[str, list[str]] = {}
+        for title in titles:
+            if title in results:
+                continue
+            stripped = title.strip() if title else ""
+            if not stripped:
+                results[title] = (False, "Empty title")
+                continue
+            originals = pending.setdefault(stripped, [])
+            if title not in originals:
+                originals.append(title)
+
+        if not pending:
+            return results
 
-        # Get API endpoint
         api_url = self._get_api_endpoint(site_code)
         if not api_url:
-            return (False, f"Unknown site code: {site_code}")
+            for originals in pending.values():
+                for title in originals:
+                    results[title] = (False, f"Unknown site code: {site_code}")
+            return results
+
+        uncached_titles: list[str] = []
+        for title in pending:
+            cached = self._cached_result(site_code, title, allow_redirects)
+            if cached is None:
+                uncached_titles.append(title)
+                continue
+            for original in pending[title]:
+                results[original] = cached
 
-        # Query the MediaWiki API
+        for start in range(0, len(uncached_titles), MAX_TITLES_PER_QUERY):
+            if start and delay_between_checks > 0:
+                sleep(delay_between_checks)
+            batch = uncached_titles[start : start + MAX_TITLES_PER_QUERY]
+            batch_results, answered = self._query_titles(
+                api_url, batch, site_code, allow_redirects
+            )
+            for title in batch:
+                if answered and self.cache is not None:
+                    self.cache.set(
+                        "page_exists",
+                        f"{site_code}|{title}|{allow_redirects}",
+                        list(batch_results[title]),
+                    )
+                for original in pending[title]:
+                    results[original] = batch_results[title]
+
+        return results
+
+    def _cached_result(
+        self, site_code: str, title: str, allow_redirects: bool
+    ) -> Optional[tuple[bool, str]]:
+        """Return a stored page existence result, if the cache has one."""
+        if self.cache is None:
+            return None
+        cached = self.cache.get("page_exists", f"{site_code}|{title}|{allow_redirects}")
+        if cached is None:
+            return None
+        return (bool(cached[0]), str(cached[1]))
+
+    def _query_titles(
+        self,
+        api_url: str,
+        titles: list[str],
+        site_code: str,
+        allow_redirects: bool,
+    ) -> tuple[dict[str, tuple[bool, str]], bool]:
+        """
+        Issue one ``action=query`` request for a batch of stripped titles.
+
+        Args:
+            api_url: MediaWiki API endpoint
+            titles: Stripped titles, at most MAX_TITLES_PER_QUERY of them
+            site_code: Site code, used in error messages
+            allow_redirects: If False, resolve and reject redirect pages
+
+        Returns:
+            Tuple of (results, answered): results maps each title to
+            (exists: bool, message: str); answered is False when the request
+            itself failed, so the results should not be cached
+        """
         params = {
             "action": "query",
-            "titles": title.strip(),
+            "titles": "|".join(titles),
             "format": "json",
             "redirects": "" if not allow_redirects else None,
         }
 
         try:
-            response = self.session.get(api_url, params=params, timeout=self.timeout)
+            response = self.session.get(
+                api_url,
+                params=params,
+                headers={"User-Agent": self.user_agent},
+                timeout=self.timeout,
+            )
             response.raise_for_status()
-            data = response.json()
-
-            # Check for redirects
-            if not allow_redirects and "redirects" in data.get("query", {}):
-                redirect_to = data["query"]["redirects"][0].get("to", "")
-                return (False, f"Page is a redirect to: {redirect_to}")
-
-            # Check if page exists
-            pages = data.get("query", {}).get("pages", {})
-            for page_id, page_info in pages.items():
-                if int(page_id) > 0:
-                    # Page exists (positive page ID)
-                    return (True, "")
+            query = response.json().get("query", {})
+
+            # Follow the API's title normalization and redirect resolution so
+            # each input title can be matched to the page entry it ended up as
+            normalized = {n["from"]: n["to"] for n in query.get("normalized", [])}
+            redirects = {r["from"]: r["to"] for r in query.get("redirects", [])}
+            pages = {page["title"]: page for page in query.get("pages", {}).values()}
+
+            results: dict[str, tuple[bool, str]] = {}
+            for title in titles:
+                resolved = normalized.get(title, title)
+                if resolved in redirects:
+                    results[title] = (
+                        False,
+                        f"Page is a redirect to: {redirects[resolved]}",
+                    )
+                    continue
+                page = pages.get(resolved)
+                if page is None:
+                    results[title] = (False, "No pages returned from API")
+                elif "missing" in page or "invalid" in page:
+                    results[title] = (False, "Page does not exist")
                 else:
-                    # Page doesn't exist (negative page ID)
-                    return (False, "Page does not exist")
-
-            return (False, "No pages returned from API")
+                    results[title] = (True, "")
+            return results, True
 
         except requests.Timeout:
-            return (False, f"Timeout checking {site_code}")
+            error = (False, f"Timeout checking {site_code}")
         except requests.RequestException as e:
-            return (False, f"Request error: {str(e)}")
-        except (KeyError, ValueError, TypeError) as e:
-            return (False, f"Error parsing response: {str(e)}")
+            error = (False, f"Request error: {str(e)}")
+        except (KeyError, ValueError, TypeError, AttributeError) as e:
+            error = (False, f"Error parsing response: {str(e)}")
+        return {title: error for title in titles}, False
+
+    def validate_series(
+        self,
+        titles: Any,
+        site_code: str = "enwiki",
+        allow_redirects: bool = False,
+    ) -> Any:
+        """
+        Validate a column of page titles, keeping only titles that exist.
+
+        This is the batched counterpart to applying check_wikipedia_page() to
+        every row: all distinct titles are checked with a few API queries.
+
+        Args:
+            titles: pandas Series or any iterable of titles (None/NaN allowed)
+            site_code: Site code shared by every title
+            allow_redirects: If False, reject redirect pages
+
+        Returns:
+            Values aligned with the input: the title where the page is valid,
+            otherwise None. A pandas Series (same index, missing rows kept as
+            NaN) when given one, otherwise a list.
+
+        Plain meaning: Check a whole column of page names at once.
+        """
+        # A Series implies pandas is loaded; never import it just to check
+        pd = sys.modules.get("pandas")
+        is_series = pd is not None and isinstance(titles, pd.Series)
+        values = titles.dropna().drop_duplicates().tolist() if is_series else titles
+
+        # Check each distinct title once, then map the answers back onto rows
+        unique_titles = list(dict.fromkeys(v for v in values if isinstance(v, str)))
+        results = self.check_pages_exist(unique_titles, site_code, allow_redirects)
+        valid = {title: title if results[title][0] else None for title in results}
+
+        if is_series:
+            # Dict lookup per row; rows that were missing stay missing (NaN)
+            return titles.map(valid)
+        return [valid.get(v) if isinstance(v, str) else None for v in titles]
 
     def validate_sitelinks(
         self, sitelinks: dict[str, dict], delay_between_checks: float = 0.1
@@ -149,6 +319,10 @@ class SitelinkValidator:
         """
         Validate multiple sitelinks at once.
 
+        Each sitelink lives on a different site, so this issues one request per
+        site. To check many titles on the same site (e.g. a column of enwiki
+        titles), use check_pages_exist() or validate_series() instead.
+
         Args:
             sitelinks: Dictionary of sitelinks from transform_to_wikidata()
                 Format: {"enwiki": {"site": "enwiki", "title": "...",
@@ -173,6 +347,7 @@ class SitelinkValidator:
             }
         """
         results = {}
+        checked = 0
 
         for site_code, sitelink_data in sitelinks.items():
             title = sitelink_data.get("title")
@@ -180,36 +355,42 @@ class SitelinkValidator:
                 results[site_code] = (False, "No title provided")
                 continue
 
-            # Check if page exists
-            exists, message = self.check_page_exists(title, site_code)
-            results[site_code] = (exists, message)
-
             # Rate limiting
-            if delay_between_checks > 0:
+            if checked and delay_between_checks > 0:
                 sleep(delay_between_checks)
+            checked += 1
+
+            # Goes through the batched path so message handling stays in one place
+            results[site_code] = self.check_pages_exist([title], site_code)[title]
 
         return results
 
-    def filter_valid_sitelinks(
+    def validate_and_filter(
         self, sitelinks: dict[str, dict], verbose: bool = False
-    ) -> dict[str, dict]:
+    ) -> tuple[dict[str, dict], dict[str, tuple[bool, str]]]:
         """
-        Filter out invalid sitelinks, returning only valid ones.
+        Validate sitelinks once, returning both the valid subset and the details.
+
+        Use this instead of calling validate_sitelinks() and
+        filter_valid_sitelinks() on the same data, which checks every page
+        twice.
 
         Args:
             sitelinks: Dictionary of sitelinks to validate
             verbose: If True, print validation results
 
         Returns:
-            Filtered dictionary containing only valid sitelinks
+            Tuple of (valid_sitelinks, details): the filtered dictionary of
+            valid sitelinks, and a dictionary mapping every site code to
+            (valid: bool, message: str)
+
+        Plain meaning: Check sitelinks in one pass and keep the good ones.
         """
-        validation_results = self.validate_sitelinks(sitelinks)
+        details = self.validate_sitelinks(sitelinks)
         valid_sitelinks = {}
 
         for site_code, sitelink_data in sitelinks.items():
-            is_valid, message = validation_results.get(
-                site_code, (False, "Not checked")
-            )
+            is_valid, message = details.get(site_code, (False, "Not checked"))
 
             if verbose:
                 status = "✓" if is_valid else "✗"
@@ -221,6 +402,22 @@ class SitelinkValidator:
             if is_valid:
                 valid_sitelinks[site_code] = sitelink_data
 
+        return valid_sitelinks, details
+
+    def filter_valid_sitelinks(
+        self, sitelinks: dict[str, dict], verbose: bool = False
+    ) -> dict[str, dict]:
+        """
+        Filter out invalid sitelinks, returning only valid ones.
+
+        Args:
+            sitelinks: Dictionary of sitelinks to validate
+            verbose: If True, print validation results
+
+        Returns:
+            Filtered dictionary containing only valid sitelinks
+        """
+        valid_sitelinks, _ = self.validate_and_filter(sitelinks, verbose=verbose)
         return valid_sitelinks
 
 
@@ -253,6 +450,31 @@ def check_wikipedia_page(
     return title if exists else None
 
 
+def validate_series(
+    titles: Any, site_code: str = "enwiki", allow_redirects: bool = False
+) -> Any:
+    """
+    Convenience function to validate a column of Wikipedia page titles.
+
+    Vectorized replacement for ``df[col].apply(check_wikipedia_page)``: each
+    distinct title is checked once through batched API queries.
+
+    Args:
+        titles: pandas Series or any iterable of titles (None/NaN allowed)
+        site_code: Wikipedia site code (default: "enwiki" for English Wikipedia)
+        allow_redirects: If False, reject redirect pages
+
+    Returns:
+        The title where the page is valid, otherwise None, aligned with the
+        input (a Series with the same index when given one, else a list)
+
+    Example:
+        >>> df["wikipedia_en_valid"] = validate_series(df["wikipedia_en"])
+    """
+    validator = SitelinkValidator()
+    return validator.validate_series(titles, site_code, allow_redirects)
+
+
 def validate_sitelink_dict(sitelinks: dict[str, dict]) -> dict[str, dict]:
     """
     Convenience function to validate and filter sitelinks.
@@ -272,4 +494,5 @@ def validate_sitelink_dict(sitelinks: dict[str, dict]) -> dict[str, dict]:
         >>> # Returns only valid sitelinks
     """
     validator = SitelinkValidator()
-    return validator.filter_valid_sitelinks(sitelinks, verbose=False)
+    valid_sitelinks, _ = validator.validate_and_filter(sitelinks)
+    return valid_sitelinks
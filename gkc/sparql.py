@@ -6,17 +6,31 @@ or custom SPARQL endpoints, with support for both Wikidata Query Service URL for
 and raw query strings.
 """
 
-from typing import Any, Optional, overload
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from importlib.util import find_spec
+from typing import TYPE_CHECKING, Any, Optional, Union, overload
 from urllib.parse import unquote, urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
 
-try:
-    import pandas as pd
+from gkc import _json
 
-    HAS_PANDAS = True
-except ImportError:
-    HAS_PANDAS = False
+# pandas and pyarrow take hundreds of milliseconds to import, which every
+# `gkc` CLI invocation would pay; only check availability here and import them
+# in the methods that build frames and tables.
+HAS_PANDAS = find_spec("pandas") is not None
+HAS_PYARROW = find_spec("pyarrow") is not None
+
+if TYPE_CHECKING:
+    import pandas as pd
+    import pyarrow as pa
 
 
 DEFAULT_WIKIDATA_ENDPOINT = "https://query.wikidata.org/sparql"
@@ -27,10 +41,179 @@ except ImportError:
     DEFAULT_USER_AGENT = "GKC-SPARQL/1.0 (https://github.com/skybristol/gkc)"
 
 
+_XSD = "http://www.w3.org/2001/XMLSchema#"
+_NUMERIC_DATATYPES = frozenset(
+    _XSD + name
+    for name in (
+        "integer",
+        "int",
+        "long",
+        "short",
+        "byte",
+        "decimal",
+        "double",
+        "float",
+        "nonNegativeInteger",
+        "positiveInteger",
+        "nonPositiveInteger",
+        "negativeInteger",
+        "unsignedLong",
+        "unsignedInt",
+        "unsignedShort",
+        "unsignedByte",
+    )
+)
+
+_INTEGER_DATATYPES = frozenset(
+    _XSD + name
+    for name in (
+        "integer",
+        "int",
+        "long",
+        "short",
+        "byte",
+        "nonNegativeInteger",
+        "positiveInteger",
+        "nonPositiveInteger",
+        "negativeInteger",
+        "unsignedLong",
+        "unsignedInt",
+        "unsignedShort",
+        "unsignedByte",
+    )
+)
+_DATETIME_DATATYPE = _XSD + "dateTime"
+
+
+def _binding_columns(
+    results: dict[str, Any],
+) -> tuple[list[str], dict[str, list[Optional[str]]], dict[str, set[str]]]:
+    """
+    Pivot SPARQL JSON bindings into one list of values per variable.
+
+    Returns:
+        Tuple of (variables in order, values per variable, kinds per variable).
+        A kind is the literal datatype IRI, or the term type ("uri",
+        "literal", "bnode") when untyped; unbound cells are None and add no
+        kind.
+    """
+    bindings = results.get("results", {}).get("bindings", [])
+    variables = list(results.get("head", {}).get("vars", []))
+    known = set(variables)
+    for binding in bindings:
+        for var in binding:
+            if var not in known:
+                known.add(var)
+                variables.append(var)
+
+    # Build one list per variable instead of one dict per row
+    columns: dict[str, list[Optional[str]]] = {}
+    kinds: dict[str, set[str]] = {}
+    empty: dict[str, str] = {}
+    for var in variables:
+        values: list[Optional[str]] = []
+        append = values.append
+        var_kinds: set[str] = set()
+        for binding in bindings:
+            # Value objects have structure: {"value": "...", "type": "..."}
+            value_obj = binding.get(var, empty)
+            append(value_obj.get("value"))
+            if value_obj:
+                var_kinds.add(value_obj.get("datatype") or value_obj.get("type", ""))
+        columns[var] = values
+        kinds[var] = var_kinds
+    return variables, columns, kinds
+
+
+def _arrow_array(values: list[Optional[str]], kinds: set[str]) -> "pa.Array":
+    """Build a typed Arrow array for one result column."""
+    import pyarrow as pa
+
+    strings = pa.array(values, type=pa.string())
+    if not kinds:
+        return strings
+    try:
+        if kinds <= _INTEGER_DATATYPES:
+            return strings.cast(pa.int64())
+        if kinds <= _NUMERIC_DATATYPES:
+            return strings.cast(pa.float64())
+        if kinds == {_DATETIME_DATATYPE}:
+            return strings.cast(pa.timestamp("s", tz="UTC"))
+    except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+        # e.g. BCE dates or out-of-range values; keep the lexical form
+        return strings
+    if kinds == {"uri"} and len(set(values)) * 2 < len(values):
+        return strings.dictionary_encode()
+    return strings
+
+
+# SPARQL results media types, sent as Accept alongside the format parameter
+_RESULT_MEDIA_TYPES = {
+    "json": "application/sparql-results+json",
+    "xml": "application/sparql-results+xml",
+    "csv": "text/csv",
+    "tsv": "text/tab-separated-values",
+}
+
+
+def _accept_header(format: str) -> Optional[dict[str, str]]:
+    """Return the Accept header for a results format, if it has a known type."""
+    media_type = _RESULT_MEDIA_TYPES.get(format)
+    return {"Accept": media_type} if media_type else None
+
+
+# Wikidata Query Service asks clients to keep parallel queries to a handful
+MAX_PARALLEL_QUERIES = 4
+
+# Tokens that must survive cache-key normalization untouched: string literals
+# (long and short forms) and IRIs. Comments and whitespace runs are rewritten.
+_QUERY_TOKEN_PATTERN = re.compile(
+    r'''"""(?:[^"\\]|\\.|"(?!""))*"""'''
+    r"""|'''(?:[^'\\]|\\.|'(?!''))*'''"""
+    r'''|"(?:[^"\\\n]|\\.)*"'''
+    r"""|'(?:[^'\\\n]|\\.)*'"""
+    r"""|<[^<>"{}|^`\\\s]*>"""
+    r"|(?:\s+|#[^\n]*)+"
+)
+
+
+@lru_cache(maxsize=256)
+def _canonical_query(query: str) -> str:
+    """
+    Reduce a SPARQL query to a canonical form for result caching.
+
+    Comments are dropped and whitespace runs collapse to a single space;
+    string literals and IRIs are left exactly as written.
+    """
+
+    def replace(match: "re.Match[str]") -> str:
+        token = match.group(0)
+        return " " if token[0] == "#" or token[0].isspace() else token
+
+    return _QUERY_TOKEN_PATTERN.sub(replace, query).strip()
+
+
 class SPARQLError(Exception):
     """Raised when a SPARQL query fails."""
 
-    pass
+    def __init__(self, message: str, response: Optional[requests.Response] = None):
+        """
+        Args:
+            message: Short description (status line, never the response body)
+            response: HTTP response that caused the failure, if any
+        """
+        super().__init__(message)
+        self.response = response
+
+    @property
+    def body(self) -> Optional[str]:
+        """
+        Response body of the failed request, decoded only when asked for.
+
+        The query service explains syntax errors here; the text can be large,
+        so it is kept out of the exception message.
+        """
+        return self.response.text if self.response is not None else None
 
 
 class SPARQLQuery:
@@ -41,6 +224,8 @@ class SPARQLQuery:
         endpoint: str = DEFAULT_WIKIDATA_ENDPOINT,
         user_agent: str = DEFAULT_USER_AGENT,
         timeout: int = 30,
+        cache_ttl: float = 300.0,
+        cache_size: int = 0,
     ):
         """
         Initialize SPARQL query executor.
@@ -49,12 +234,29 @@ class SPARQLQuery:
             endpoint: SPARQL endpoint URL (default: Wikidata)
             user_agent: User agent string for HTTP requests
             timeout: Request timeout in seconds
+            cache_ttl: Seconds a cached response stays fresh
+            cache_size: Maximum cached responses. The default of 0 disables
+                caching so every query sees current data; set it (e.g. 128)
+                when re-running identical queries within ``cache_ttl`` is
+                expected and slightly stale answers are acceptable.
         """
         self.endpoint = endpoint
         self.user_agent = user_agent
         self.timeout = timeout
+        self.cache_ttl = cache_ttl
+        self.cache_size = cache_size
+        # (format, canonical query) -> (fetched_at, response body), LRU ordered
+        self._cache: OrderedDict[tuple[str, str], tuple[float, Union[str, bytes]]]
+        self._cache = OrderedDict()
+        self._cache_lock = threading.Lock()
         self.session = requests.Session()
-        self.session.headers.update({"User-Agent": user_agent})
+        self.session.headers.update(
+            # Includes "br" when a Brotli decoder is installed
+            {"User-Agent": user_agent, "Accept-Encoding": ACCEPT_ENCODING}
+        )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
 
     @staticmethod
     def parse_wikidata_query_url(url: str) -> str:
@@ -116,7 +318,7 @@ class SPARQLQuery:
         query = query.strip()
 
         # Check if it's a URL
-        if query.startswith("http://") or query.startswith("https://"):
+        if query.startswith(("http://", "https://")):
             return SPARQLQuery.parse_wikidata_query_url(query)
 
         return query
@@ -127,6 +329,7 @@ class SPARQLQuery:
         query: str,
         format: str,
         raw: bool = True,
+        no_cache: bool = False,
     ) -> str: ...
 
     @overload
@@ -135,6 +338,7 @@ class SPARQLQuery:
         query: str,
         format: str = "json",
         raw: bool = False,
+        no_cache: bool = False,
     ) -> dict[str, Any]: ...
 
     def query(
@@ -142,6 +346,7 @@ class SPARQLQuery:
         query: str,
         format: str = "json",
         raw: bool = False,
+        no_cache: bool = False,
     ) -> Any:
         """
         Execute a SPARQL query.
@@ -150,6 +355,7 @@ class SPARQLQuery:
             query: SPARQL query string or Wikidata Query Service URL
             format: Response format ('json', 'xml', 'csv', 'tsv')
             raw: If False, parse JSON to Python dict; if True, return raw string
+            no_cache: Skip the result cache and always query the endpoint
 
         Returns:
             Query results (dict if JSON and raw=False, else string)
@@ -170,6 +376,17 @@ class SPARQLQuery:
         """
         # Normalize query
         normalized_query = self.normalize_query(query)
+        parse_json = format == "json" and not raw
+
+        use_cache = not no_cache and self.cache_size > 0
+        if use_cache:
+            cache_key = (format, _canonical_query(normalized_query))
+            cached_body = self._cached_response(cache_key)
+            if cached_body is not None:
+                try:
+                    return _json.loads(cached_body) if parse_json else cached_body
+                except ValueError as e:
+                    raise SPARQLError(f"Failed to parse response: {str(e)}")
 
         # Prepare request parameters
         params = {
@@ -177,33 +394,104 @@ class SPARQLQuery:
             "format": format,
         }
 
+        response: Optional[requests.Response] = None
         try:
             response = self.session.get(
                 self.endpoint,
                 params=params,
+                headers=_accept_header(format),
                 timeout=self.timeout,
             )
             response.raise_for_status()
 
-            # Parse response
-            if format == "json" and not raw:
-                return response.json()
-            else:
-                return response.text
+            # Parse JSON straight from the undecoded bytes (orjson when available)
+            body: Union[str, bytes] = response.content if parse_json else response.text
+            result = _json.loads(body) if parse_json else body
 
         except requests.Timeout:
             raise SPARQLError(f"Query timeout after {self.timeout} seconds")
         except requests.RequestException as e:
-            raise SPARQLError(f"Query failed: {str(e)}")
+            raise SPARQLError(f"Query failed: {str(e)}", response=e.response)
         except ValueError as e:
-            raise SPARQLError(f"Failed to parse response: {str(e)}")
+            raise SPARQLError(f"Failed to parse response: {str(e)}", response=response)
+
+        if use_cache:
+            self._store_response(cache_key, body)
+        return result
+
+    def _cached_response(self, key: tuple[str, str]) -> Optional[Union[str, bytes]]:
+        """Return a fresh cached response body, evicting it if expired."""
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+            fetched_at, body = entry
+            if time.monotonic() - fetched_at > self.cache_ttl:
+                del self._cache[key]
+                return None
+            self._cache.move_to_end(key)
+            return body
+
+    def _store_response(self, key: tuple[str, str], body: Union[str, bytes]) -> None:
+        """Cache a response body, dropping the least recently used overflow."""
+        with self._cache_lock:
+            self._cache[key] = (time.monotonic(), body)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def clear_cache(self) -> None:
+        """Discard all cached query responses."""
+        with self._cache_lock:
+            self._cache.clear()
+
+    def query_many(
+        self,
+        queries: list[str],
+        format: str = "json",
+        raw: bool = False,
+        max_workers: int = MAX_PARALLEL_QUERIES,
+    ) -> list[Any]:
+        """
+        Execute several independent SPARQL queries concurrently.
+
+        Round trips overlap on this executor's pooled session; concurrency is
+        capped at MAX_PARALLEL_QUERIES to stay within Wikidata's usage limits.
+
+        Args:
+            queries: SPARQL query strings or Wikidata Query Service URLs
+            format: Response format ('json', 'xml', 'csv', 'tsv')
+            raw: If False, parse JSON to Python dict; if True, return raw string
+            max_workers: Maximum number of queries in flight at once
 
-    def to_dataframe(self, query: str) -> "pd.DataFrame":
+        Returns:
+            Query results in the same order as ``queries``
+
+        Raises:
+            SPARQLError: If any query fails
+
+        Plain meaning: Run a list of queries at the same time.
+        """
+        workers = min(max_workers, MAX_PARALLEL_QUERIES, len(queries))
+        if workers <= 1:
+            return [self.query(q, format=format, raw=raw) for q in queries]
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(
+                pool.map(lambda q: self.query(q, format=format, raw=raw), queries)
+            )
+
+    def to_dataframe(self, query: str, typed: bool = False) -> "pd.DataFrame":
         """
         Execute a SPARQL query and return results as a pandas DataFrame.
 
+        Cells hold the lexical value strings and unbound cells are NaN. With
+        ``typed=True``, columns whose values all carry a numeric XSD datatype
+        are converted with ``pd.to_numeric`` instead.
+
         Args:
             query: SPARQL query string or Wikidata Query Service URL
+            typed: Convert numeric-literal columns to numeric dtypes
 
         Returns:
             pandas DataFrame with query results
@@ -224,22 +512,60 @@ class SPARQLQuery:
                 "Install with: pip install pandas"
             )
 
+        import pandas as pd
+
         # Execute query
-        results = self.query(query, format="json", raw=False)
+        results = self.query(query)
+
+        variables, columns, kinds = _binding_columns(results)
+        nan = float("nan")
+        # Unbound cells are NaN, as when building the frame from row dicts
+        frame = pd.DataFrame(
+            {
+                var: [nan if value is None else value for value in columns[var]]
+                for var in variables
+            },
+            columns=variables,
+        )
+        if typed:
+            for var in variables:
+                # Typed literals (xsd:integer, xsd:decimal, ...) become numeric
+                if kinds[var] and kinds[var] <= _NUMERIC_DATATYPES:
+                    frame[var] = pd.to_numeric(frame[var], errors="coerce")
+        return frame
+
+    def to_arrow(self, query: str) -> "pa.Table":
+        """
+        Execute a SPARQL query and return results as a pyarrow Table.
 
-        # Extract bindings
-        bindings = results.get("results", {}).get("bindings", [])  # type: ignore[attr-defined]
+        Columns are typed from the SPARQL literal datatypes: integers become
+        int64, other numbers float64 and xsd:dateTime a UTC timestamp. IRI
+        columns with many repeated values are dictionary-encoded.
 
-        # Convert to DataFrame
-        data = []
-        for binding in bindings:
-            row = {}
-            for var, value_obj in binding.items():
-                # Value objects have structure: {"value": "...", "type": "..."}
-                row[var] = value_obj.get("value")
-            data.append(row)
+        Args:
+            query: SPARQL query string or Wikidata Query Service URL
 
-        return pd.DataFrame(data)
+        Returns:
+            pyarrow Table with one column per query variable
+
+        Raises:
+            SPARQLError: If pyarrow is not installed or query fails
+
+        Plain meaning: Get query results as a compact, typed table.
+        """
+        if not HAS_PYARROW:
+            raise SPARQLError(
+                "pyarrow is required for to_arrow(). "
+                "Install with: pip install pyarrow"
+            )
+
+        import pyarrow as pa
+
+        results = self.query(query)
+        variables, columns, kinds = _binding_columns(results)
+        return pa.table(
+            {var: _arrow_array(columns[var], kinds[var]) for var in variables}
+        )
 
     def to_dict_list(self, query: str) -> list[dict[str, str]]:
         """
@@ -265,14 +591,10 @@ class SPARQLQuery:
         results = self.query(query, format="json", raw=False)
         bindings = results.get("results", {}).get("bindings", [])  # type: ignore[attr-defined]
 
-        data = []
-        for binding in bindings:
-            row = {}
-            for var, value_obj in binding.items():
-                row[var] = value_obj.get("value")
-            data.append(row)
-
-        return data
+        return [
+            {var: value_obj.get("value") for var, value_obj in binding.items()}
+            for binding in bindings
+        ]
 
     def to_csv(self, query: str, filepath: Optional[str] = None) -> str:
         """
@@ -295,12 +617,25 @@ class SPARQLQuery:
         csv_data = self.query(query, format="csv", raw=True)
 
         if filepath:
-            with open(filepath, "w") as f:
+            # The endpoint already produced the CSV; write it through verbatim so
+            # its CRLF row endings are not translated on platforms that would
+            with open(filepath, "w", encoding="utf-8", newline="") as f:
                 f.write(csv_data)
 
         return csv_data
 
 
+@lru_cache(maxsize=8)
+def _executor_for(endpoint: str) -> SPARQLQuery:
+    """
+    Return a shared executor for an endpoint.
+
+    The module-level helpers below reuse one executor (and so one keep-alive
+    session) per endpoint instead of opening a new connection for each call.
+    """
+    return SPARQLQuery(endpoint=endpoint)
+
+
 def execute_sparql(
     query: str,
     endpoint: str = DEFAULT_WIKIDATA_ENDPOINT,
@@ -322,13 +657,13 @@ def execute_sparql(
         ...     'SELECT ?item ?itemLabel WHERE { ... }'
         ... )
     """
-    executor = SPARQLQuery(endpoint=endpoint)
-    return executor.query(query, format=format)
+    return _executor_for(endpoint).query(query, format=format)
 
 
 def execute_sparql_to_dataframe(
     query: str,
     endpoint: str = DEFAULT_WIKIDATA_ENDPOINT,
+    typed: bool = False,
 ) -> "pd.DataFrame":
     """
     Convenience function to execute a SPARQL query and return DataFrame.
@@ -336,6 +671,7 @@ def execute_sparql_to_dataframe(
     Args:
         query: SPARQL query string or Wikidata Query Service URL
         endpoint: SPARQL endpoint (default: Wikidata)
+        typed: Convert numeric-literal columns to numeric dtypes
 
     Returns:
         pandas DataFrame with query results
@@ -345,8 +681,7 @@ def execute_sparql_to_dataframe(
         ...     'SELECT ?item ?itemLabel WHERE { ... }'
         ... )
     """
-    executor = SPARQLQuery(endpoint=endpoint)
-    return executor.to_dataframe(query)
+    return _executor_for(endpoint).to_dataframe(query, typed=typed)
 
 
 def add_pagination(query: str, limit: int, offset: int = 0) -> str:
@@ -417,7 +752,7 @@ def paginate_query(
 
     Plain meaning: Automatically fetch large result sets in manageable chunks.
     """
-    executor = SPARQLQuery(endpoint=endpoint)
+    executor = _executor_for(endpoint)
     all_results: list[dict[str, str]] = []
     offset = 0
 
@@ -510,7 +845,7 @@ def fetch_entity_labels(
     """
 
     # Execute query
-    executor = SPARQLQuery(endpoint=endpoint)
+    executor = _executor_for(endpoint)
     results = executor.to_dict_list(query)
 
     # Build result dict, taking first label per entity
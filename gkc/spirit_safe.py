@@ -23,6 +23,7 @@ from typing import Any, Literal, Optional, Union
 import requests
 import yaml
 
+from gkc import _http, _json
 from gkc.sparql import SPARQLQuery, paginate_query
 
 RefreshPolicy = Literal["manual", "daily", "weekly", "on_release"]
@@ -199,7 +200,7 @@ def _read_text_from_resolved_path(resolved: Union[Path, str]) -> str:
     if isinstance(resolved, Path):
         return resolved.read_text(encoding="utf-8")
     # GitHub URL
-    response = requests.get(str(resolved), timeout=10)
+    response = _http.get(str(resolved), timeout=10)
     response.raise_for_status()
     return response.text
 
@@ -248,7 +249,7 @@ def list_profiles() -> list[str]:
         f"contents/profiles?ref={source.github_ref}"
     )
     try:
-        response = requests.get(api_url, timeout=10)
+        response = _http.get(api_url, timeout=10)
         response.raise_for_status()
         contents = response.json()
         # Filter for directories only
@@ -426,8 +427,8 @@ class LookupCache:
             return None
 
         try:
-            with open(cache_path, "r") as f:
-                return json.load(f)
+            with open(cache_path, "rb") as f:
+                return _json.load(f)
         except (json.JSONDecodeError, IOError):
             return None
 
@@ -457,8 +458,8 @@ class LookupCache:
             "metadata": metadata or {},
         }
 
-        with open(cache_path, "w") as f:
-            json.dump(cache_data, f, indent=2)
+        with open(cache_path, "w", encoding="utf-8") as f:
+            _json.dump(cache_data, f, indent=True)
 
     def is_fresh(self, query: str, refresh_policy: RefreshPolicy = "manual") -> bool:
         """Check if cached results are still fresh.
@@ -1,8 +1,11 @@
 """Tests for authentication module."""
 
+import json
+from http.cookiejar import LWPCookieJar
 from unittest.mock import Mock, patch
 
 import pytest
+import requests
 
 from gkc.auth import AuthenticationError, OpenStreetMapAuth, WikiverseAuth
 
@@ -27,6 +30,23 @@ class TestWikiverseAuth:
         assert auth.password == "envpass"
         assert auth.is_authenticated()
 
+    def test_default_session_pools_and_retries(self):
+        """The default session keeps connections alive and retries reads."""
+        auth = WikiverseAuth(username="testuser@testbot", password="testpass")
+        adapter = auth.session.get_adapter(auth.api_url)
+
+        assert adapter._pool_maxsize == 16
+        assert 503 in adapter.max_retries.status_forcelist
+        assert "GKC-Python-Client" in auth.session.headers["User-Agent"]
+
+    def test_injected_session_is_used(self):
+        """A caller-supplied session is used as given."""
+        shared = Mock()
+        auth = WikiverseAuth(
+            username="testuser@testbot", password="testpass", session=shared
+        )
+        assert auth.session is shared
+
     def test_init_with_custom_api_url(self):
         """Test initialization with custom API URL."""
         auth = WikiverseAuth(
@@ -136,13 +156,13 @@ class TestWikiverseAuth:
 
         # Mock token request
         token_response = Mock()
-        token_response.json.return_value = {
-            "query": {"tokens": {"logintoken": "test_token"}}
-        }
+        token_response.content = json.dumps(
+            {"query": {"tokens": {"logintoken": "test_token"}}}
+        ).encode()
 
         # Mock login request
         login_response = Mock()
-        login_response.json.return_value = {"login": {"result": "Success"}}
+        login_response.content = json.dumps({"login": {"result": "Success"}}).encode()
 
         mock_session.get.return_value = token_response
         mock_session.post.return_value = login_response
@@ -153,6 +173,38 @@ class TestWikiverseAuth:
         assert result is True
         assert auth.is_logged_in()
 
+    def test_login_when_logged_in_is_a_no_op(self):
+        """A second login() call does not contact the API."""
+        session = Mock()
+        auth = WikiverseAuth(
+            username="testuser@testbot", password="testpass", session=session
+        )
+        auth._logged_in = True
+
+        assert auth.login() is True
+        session.get.assert_not_called()
+        session.post.assert_not_called()
+
+    def test_forced_login_repeats_the_handshake(self):
+        """force=True logs in again even when already logged in."""
+        session = Mock()
+        token_response = Mock()
+        token_response.content = json.dumps(
+            {"query": {"tokens": {"logintoken": "test_token"}}}
+        ).encode()
+        login_response = Mock()
+        login_response.content = json.dumps({"login": {"result": "Success"}}).encode()
+        session.get.return_value = token_response
+        session.post.return_value = login_response
+        auth = WikiverseAuth(
+            username="testuser@testbot", password="testpass", session=session
+        )
+        auth._logged_in = True
+
+        assert auth.login(force=True) is True
+        assert session.get.call_count == 1
+        assert session.post.call_count == 1
+
     @patch("gkc.auth.requests.Session")
     def test_login_failure(self, mock_session_class):
         """Test failed login."""
@@ -162,15 +214,15 @@ class TestWikiverseAuth:
 
         # Mock token request
         token_response = Mock()
-        token_response.json.return_value = {
-            "query": {"tokens": {"logintoken": "test_token"}}
-        }
+        token_response.content = json.dumps(
+            {"query": {"tokens": {"logintoken": "test_token"}}}
+        ).encode()
 
         # Mock login request with failure
         login_response = Mock()
-        login_response.json.return_value = {
-            "login": {"result": "Failed", "reason": "Invalid credentials"}
-        }
+        login_response.content = json.dumps(
+            {"login": {"result": "Failed", "reason": "Invalid credentials"}}
+        ).encode()
 
         mock_session.get.return_value = token_response
         mock_session.post.return_value = login_response
@@ -203,9 +255,9 @@ class TestWikiverseAuth:
 
         # Mock token response
         token_response = Mock()
-        token_response.json.return_value = {
-            "query": {"tokens": {"csrftoken": "csrf_test_token"}}
-        }
+        token_response.content = json.dumps(
+            {"query": {"tokens": {"csrftoken": "csrf_test_token"}}}
+        ).encode()
         mock_session.post.return_value = token_response
 
         auth = WikiverseAuth(username="testuser@testbot", password="testpass")
@@ -214,6 +266,56 @@ class TestWikiverseAuth:
         token = auth.get_csrf_token()
         assert token == "csrf_test_token"
 
+    @patch("gkc.auth.requests.Session")
+    def test_csrf_token_and_userinfo_share_one_request(self, mock_session_class):
+        """Token and user info come from one request and are reused."""
+        mock_session = Mock()
+        mock_session_class.return_value = mock_session
+        token_response = Mock()
+        token_response.content = json.dumps(
+            {
+                "query": {
+                    "tokens": {"csrftoken": "csrf_test_token"},
+                    "userinfo": {"id": 7, "name": "Testuser"},
+                }
+            }
+        ).encode()
+        mock_session.post.return_value = token_response
+
+        auth = WikiverseAuth(username="testuser@testbot", password="testpass")
+        auth._logged_in = True
+
+        assert auth.get_csrf_token() == "csrf_test_token"
+        assert auth.get_userinfo() == {"id": 7, "name": "Testuser"}
+        assert auth.get_csrf_token() == "csrf_test_token"
+        assert mock_session.post.call_count == 1
+        params = mock_session.post.call_args.kwargs["data"]
+        assert params["meta"] == "tokens|userinfo"
+
+        auth.invalidate_csrf_token()
+        auth.get_csrf_token()
+        assert mock_session.post.call_count == 2
+
+        # Logout reuses the cached token instead of fetching another
+        auth.logout()
+        mock_session.get.assert_not_called()
+        assert auth._csrf_token is None
+
+    @patch("gkc.auth.requests.Session")
+    def test_invalid_json_raises_authentication_error(self, mock_session_class):
+        """A non-JSON API body surfaces as an AuthenticationError."""
+        mock_session = Mock()
+        mock_session_class.return_value = mock_session
+        token_response = Mock()
+        token_response.content = b"<html>Service unavailable</html>"
+        mock_session.post.return_value = token_response
+
+        auth = WikiverseAuth(username="testuser@testbot", password="testpass")
+        auth._logged_in = True
+
+        with pytest.raises(AuthenticationError, match="Invalid JSON"):
+            auth.get_csrf_token()
+
     def test_get_csrf_token_not_logged_in(self):
         """Test getting CSRF token when not logged in."""
         auth = WikiverseAuth(username="testuser@testbot", password="testpass")
@@ -232,9 +334,9 @@ class TestWikiverseAuth:
 
         # Mock responses
         token_response = Mock()
-        token_response.json.return_value = {
-            "query": {"tokens": {"csrftoken": "csrf_token"}}
-        }
+        token_response.content = json.dumps(
+            {"query": {"tokens": {"csrftoken": "csrf_token"}}}
+        ).encode()
         mock_session.get.return_value = token_response
 
         auth = WikiverseAuth(username="testuser@testbot", password="testpass")
@@ -244,6 +346,126 @@ class TestWikiverseAuth:
         assert not auth.is_logged_in()
         mock_session.cookies.clear.assert_called_once()
 
+    def _cookie_session(self):
+        session = Mock()
+        session.cookies = requests.cookies.RequestsCookieJar()
+        return session
+
+    def test_fresh_login_saves_cookie_jar(self, tmp_path):
+        """A full login writes the session cookies to an owner-only file."""
+        session = self._cookie_session()
+        token_response = Mock()
+        token_response.content = json.dumps(
+            {"query": {"tokens": {"logintoken": "test_token"}}}
+        ).encode()
+        session.get.return_value = token_response
+
+        def login_post(url, data):
+            session.cookies.set("centralauth_Session", "abc", domain=".wikidata.org")
+            response = Mock()
+            response.content = json.dumps({"login": {"result": "Success"}}).encode()
+            return response
+
+        session.post.side_effect = login_post
+        jar_path = tmp_path / "cookies.lwp"
+
+        auth = WikiverseAuth(
+            username="testuser@testbot",
+            password="testpass",
+            session=session,
+            cookie_jar_path=jar_path,
+        )
+        assert auth.login() is True
+
+        assert "centralauth_Session" in jar_path.read_text()
+        assert jar_path.stat().st_mode & 0o777 == 0o600
+
+    def test_saved_session_skips_login(self, tmp_path):
+        """Valid saved cookies resume the login with one userinfo request."""
+        jar_path = tmp_path / "cookies.lwp"
+        jar = LWPCookieJar(str(jar_path))
+        jar.set_cookie(
+            requests.cookies.create_cookie(
+                "centralauth_Session", "abc", domain=".wikidata.org"
+            )
+        )
+        jar.save(ignore_discard=True)
+
+        session = self._cookie_session()
+        userinfo_response = Mock()
+        userinfo_response.content = json.dumps(
+            {
+                "query": {
+                    "tokens": {"csrftoken": "csrf_token"},
+                    "userinfo": {"id": 7, "name": "testuser"},
+                }
+            }
+        ).encode()
+        session.post.return_value = userinfo_response
+
+        auth = WikiverseAuth(
+            username="testuser@testbot",
+            password="testpass",
+            session=session,
+            cookie_jar_path=jar_path,
+        )
+
+        assert auth.login() is True
+        assert session.get.call_count == 0
+        assert session.post.call_count == 1
+        assert session.cookies.get("centralauth_Session") == "abc"
+        assert auth.get_csrf_token() == "csrf_token"
+
+    def test_expired_saved_session_falls_back_to_login(self, tmp_path):
+        """An anonymous userinfo answer discards the cookies and logs in again."""
+        jar_path = tmp_path / "cookies.lwp"
+        jar = LWPCookieJar(str(jar_path))
+        jar.set_cookie(
+            requests.cookies.create_cookie(
+                "centralauth_Session", "stale", domain=".wikidata.org"
+            )
+        )
+        jar.save(ignore_discard=True)
+
+        session = self._cookie_session()
+        anon_response = Mock()
+        anon_response.content = json.dumps(
+            {
+                "query": {
+                    "tokens": {"csrftoken": "+\\"},
+                    "userinfo": {"id": 0, "name": "127.0.0.1", "anon": ""},
+                }
+            }
+        ).encode()
+        login_response = Mock()
+        login_response.content = json.dumps({"login": {"result": "Success"}}).encode()
+        token_response = Mock()
+        token_response.content = json.dumps(
+            {"query": {"tokens": {"logintoken": "test_token"}}}
+        ).encode()
+        session.get.return_value = token_response
+
+        def post(url, data):
+            if data["action"] == "query":
+                return anon_response
+            session.cookies.set("centralauth_Session", "new", domain=".wikidata.org")
+            return login_response
+
+        session.post.side_effect = post
+
+        auth = WikiverseAuth(
+            username="testuser@testbot",
+            password="testpass",
+            session=session,
+            cookie_jar_path=jar_path,
+        )
+
+        assert auth.login() is True
+        assert session.get.call_count == 1
+        assert session.post.call_count == 2
+        assert auth._csrf_token is None
+        assert "centralauth_Session=new;" in jar_path.read_text()
+
 
 class TestOpenStreetMapAuth:
     """Tests for OpenStreetMapAuth class."""
@@ -255,6 +477,43 @@ class TestOpenStreetMapAuth:
         assert auth.password == "testpass"
         assert auth.is_authenticated()
 
+    def test_interactive_prompt_fills_missing_credentials(self, monkeypatch):
+        """Interactive mode prompts when neither arguments nor env provide them."""
+        monkeypatch.delenv("OPENSTREETMAP_USERNAME", raising=False)
+        monkeypatch.delenv("OPENSTREETMAP_PASSWORD", raising=False)
+        monkeypatch.setattr("builtins.input", lambda prompt: " mapper ")
+        monkeypatch.setattr("getpass.getpass", lambda prompt: "secret")
+        monkeypatch.setattr("sys.stdin", Mock(closed=False, isatty=lambda: True))
+
+        auth = OpenStreetMapAuth(interactive=True)
+
+        assert auth.username == "mapper"
+        assert auth.password == "secret"
+
+    def test_interactive_prompt_works_without_tty(self, monkeypatch):
+        """Notebook kernels prompt through a stdin that is not a tty."""
+        monkeypatch.delenv("WIKIVERSE_USERNAME", raising=False)
+        monkeypatch.delenv("WIKIVERSE_PASSWORD", raising=False)
+        monkeypatch.setattr("builtins.input", lambda prompt: "User@Bot")
+        monkeypatch.setattr("getpass.getpass", lambda prompt: "secret")
+        monkeypatch.setattr("sys.stdin", Mock(closed=False, isatty=lambda: False))
+
+        auth = WikiverseAuth(interactive=True)
+
+        assert auth.username == "User@Bot"
+        assert auth.password == "secret"
+
+    @pytest.mark.parametrize("stdin", [None, Mock(closed=True)])
+    def test_interactive_without_stdin_fails_fast(self, monkeypatch, stdin):
+        """Interactive mode raises instead of prompting when stdin is gone."""
+        monkeypatch.delenv("OPENSTREETMAP_USERNAME", raising=False)
+        monkeypatch.delenv("OPENSTREETMAP_PASSWORD", raising=False)
+        monkeypatch.setattr("sys.stdin", stdin)
+        monkeypatch.setattr("builtins.input", Mock(side_effect=AssertionError))
+
+        with pytest.raises(AuthenticationError, match="stdin is not available"):
+            OpenStreetMapAuth(interactive=True)
+
     def test_init_from_environment(self, monkeypatch):
         """Test initialization from environment variables."""
         monkeypatch.setenv("OPENSTREETMAP_USERNAME", "envuser")
@@ -0,0 +1,623 @@
+"""Tests for the Bottler transformation pipeline."""
+
+import json
+import os
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+
+from gkc.bottler import ClaimBuilder, DataTypeTransformer, Distillate, SnakBuilder
+
+
+class _Text(str):
+    """str subclass, which bypasses the exact-type fast paths."""
+
+
+def _recipe() -> dict:
+    """Small recipe exercising constants, source fields, and named libraries."""
+    return {
+        "reference_library": {
+            "stated_in_register": [
+                {"property": "P248", "value": "Q106648236", "datatype": "wikibase-item"}
+            ]
+        },
+        "qualifier_library": {
+            "point_in_time": [
+                {
+                    "property": "P585",
+                    "source_field": "count_date",
+                    "datatype": "time",
+                    "transform": {"precision": "day"},
+                }
+            ]
+        },
+        "mappings": {
+            "labels": [{"source_field": "name", "language": "en", "required": True}],
+            "descriptions": [
+                {
+                    "source_field": "description",
+                    "language": "en",
+                    "default": "Federally recognized tribe",
+                }
+            ],
+            "aliases": [
+                {"source_field": "aliases", "language": "en", "separator": ";"}
+            ],
+            "claims": [
+                {
+                    "property": "P31",
+                    "value": "Q7840353",
+                    "datatype": "wikibase-item",
+                    "references": [{"name": "stated_in_register"}],
+                },
+                {
+                    "property": "P571",
+                    "source_field": "established",
+                    "datatype": "time",
+                    "transform": {"precision": "year"},
+                },
+                {
+                    "property": "P2124",
+                    "source_field": "members",
+                    "datatype": "quantity",
+                    "qualifiers": [{"name": "point_in_time"}],
+                    "references": [
+                        {
+                            "name": "with_url",
+                            "property": "P854",
+                            "value_from": "source_url",
+                            "datatype": "url",
+                        }
+                    ],
+                },
+                {
+                    "property": "P1705",
+                    "source_field": "native_name",
+                    "datatype": "monolingualtext",
+                    "transform": {"language_from": "native_language"},
+                },
+            ],
+            "sitelinks": [{"site": "enwiki", "source_field": "enwiki_title"}],
+        },
+    }
+
+
+RECORD = {
+    "name": "Cherokee Nation",
+    "aliases": "CNO; Cherokee Nation of Oklahoma",
+    "established": "1839-09-06",
+    "members": 450000,
+    "count_date": "2023-01-01",
+    "source_url": "https://example.org/register",
+    "native_name": "ᏣᎳᎩ ᎠᏰᎵ",
+    "native_language": "chr",
+    "enwiki_title": "Cherokee Nation",
+}
+
+
+class TestDistillateTransform:
+    """Tests for Distillate.transform_to_wikidata."""
+
+    def test_terms(self):
+        """Labels, default descriptions, and split aliases are produced."""
+        item = Distillate(_recipe()).transform_to_wikidata(RECORD)
+
+        assert item["labels"]["en"] == {"language": "en", "value": "Cherokee Nation"}
+        assert item["descriptions"]["en"]["value"] == "Federally recognized tribe"
+        assert [a["value"] for a in item["aliases"]["en"]] == [
+            "CNO",
+            "Cherokee Nation of Oklahoma",
+        ]
+        assert item["sitelinks"]["enwiki"]["title"] == "Cherokee Nation"
+
+    def test_duplicate_aliases_are_collapsed(self):
+        """Repeated alias texts in one language are emitted once, in order."""
+        record = {**RECORD, "aliases": "CNO; Tsalagi; CNO"}
+        item = Distillate(_recipe()).transform_to_wikidata(record)
+
+        assert [a["value"] for a in item["aliases"]["en"]] == ["CNO", "Tsalagi"]
+
+    def test_constant_claim_with_named_reference(self):
+        """Literal values and library references resolve into the claim."""
+        item = Distillate(_recipe()).transform_to_wikidata(RECORD)
+
+        claim = item["claims"]["P31"][0]
+        assert claim["mainsnak"]["datavalue"]["value"]["id"] == "Q7840353"
+        ref = claim["references"][0]
+        assert ref["snaks-order"] == ["P248"]
+        assert ref["snaks"]["P248"][0]["datavalue"]["value"]["id"] == "Q106648236"
+
+    def test_transform_options(self):
+        """Named precisions and language_from are applied."""
+        item = Distillate(_recipe()).transform_to_wikidata(RECORD)
+
+        inception = item["claims"]["P571"][0]["mainsnak"]["datavalue"]["value"]
+        assert inception["time"] == "+1839-00-00T00:00:00Z"
+        assert inception["precision"] == 9
+
+        native = item["claims"]["P1705"][0]["mainsnak"]["datavalue"]["value"]
+        assert native == {"text": "ᏣᎳᎩ ᎠᏰᎵ", "language": "chr"}
+
+    def test_qualifiers_and_inline_reference(self):
+        """Library qualifiers and inline references read from the record."""
+        item = Distillate(_recipe()).transform_to_wikidata(RECORD)
+
+        claim = item["claims"]["P2124"][0]
+        assert claim["qualifiers-order"] == ["P585"]
+        qual = claim["qualifiers"]["P585"][0]["datavalue"]["value"]
+        assert qual["time"] == "+2023-01-01T00:00:00Z"
+        url = claim["references"][0]["snaks"]["P854"][0]["datavalue"]
+        assert url == {"value": "https://example.org/register", "type": "string"}
+
+    def test_missing_optional_fields_are_skipped(self):
+        """Claims and qualifiers without source values are omitted."""
+        record = {"name": "Navajo Nation", "members": 399494}
+        item = Distillate(_recipe()).transform_to_wikidata(record)
+
+        assert "P571" not in item["claims"]
+        assert "qualifiers" not in item["claims"]["P2124"][0]
+        assert "references" not in item["claims"]["P2124"][0]
+        assert item["aliases"] == {}
+        assert item["sitelinks"] == {}
+
+    def test_transform_to_json(self):
+        """JSON output round-trips to the dict form."""
+        distillate = Distillate(_recipe())
+        text = distillate.transform_to_json(RECORD)
+
+        assert json.loads(text) == distillate.transform_to_wikidata(RECORD)
+
+    @pytest.mark.parametrize(
+        "value,expected",
+        [
+            (None, True),
+            ("", True),
+            ("   ", True),
+            (float("nan"), True),
+            ("x", False),
+            (0, False),
+            (0.0, False),
+            (False, False),
+            ({"lat": 1}, False),
+            (Decimal("NaN"), True),
+            (Decimal("1.5"), False),
+            (_Text("  "), True),
+            (_Text("x"), False),
+        ],
+    )
+    def test_is_empty_value(self, value, expected):
+        """Missing-value detection covers None, blanks, and NaN."""
+        assert Distillate._is_empty_value(value) is expected
+
+    @pytest.mark.skipif(
+        not __import__("importlib.util").util.find_spec("numpy"),
+        reason="numpy not installed",
+    )
+    def test_is_empty_value_numpy_nan_without_pandas(self, monkeypatch):
+        """numpy NaN scalars are empty even when pandas has not been imported."""
+        import sys
+
+        import numpy as np
+
+        monkeypatch.delitem(sys.modules, "pandas", raising=False)
+        assert Distillate._is_empty_value(np.float64("nan")) is True
+        assert Distillate._is_empty_value(np.float32("nan")) is True
+        assert Distillate._is_empty_value(np.float32(1.5)) is False
+        assert Distillate._is_empty_value(np.array([1.0, float("nan")])) is False
+
+    def test_split_values(self):
+        """Lists are flattened, separators split, and blanks dropped."""
+        assert Distillate._split_values([" a; b ", None, ""], ";") == ["a", "b"]
+
+    @pytest.mark.skipif(
+        not __import__("importlib.util").util.find_spec("pandas"),
+        reason="pandas not installed",
+    )
+    def test_split_values_accepts_arrays(self):
+        """Array-valued fields are split element-wise like lists."""
+        import numpy as np
+        import pandas as pd
+
+        values = np.array(["Cherokee; Tsalagi", "", "Keetoowah"], dtype=object)
+        assert Distillate._split_values(values, ";") == [
+            "Cherokee",
+            "Tsalagi",
+            "Keetoowah",
+        ]
+        series = pd.Series([1.5, float("nan")])
+        assert Distillate._split_values(series) == ["1.5"]
+
+    def test_missing_required_field_raises(self):
+        """A missing required label raises ValueError."""
+        with pytest.raises(ValueError, match="name"):
+            Distillate(_recipe()).transform_to_wikidata({"members": 1})
+
+    def test_unknown_library_name_raises(self):
+        """Referencing an undefined library entry fails at construction."""
+        recipe = _recipe()
+        recipe["mappings"]["claims"][0]["references"] = [{"name": "nope"}]
+        with pytest.raises(ValueError, match="nope"):
+            Distillate(recipe)
+
+    def test_constant_reference_groups_are_prebuilt(self):
+        """Reference groups made only of literals are built at compile time."""
+        distillate = Distillate(_recipe())
+        p31_plan, p2124_plan = distillate._claims[0], distillate._claims[2]
+
+        assert p31_plan.prebuilt_references[0]["snaks-order"] == ["P248"]
+        assert p2124_plan.prebuilt_references == (None,)
+
+        first = distillate.transform_to_wikidata(RECORD)["claims"]["P31"][0]
+        second = distillate.transform_to_wikidata(RECORD)["claims"]["P31"][0]
+        assert first["references"] == second["references"]
+        assert first["references"][0] is not second["references"][0]
+
+    def test_split_claims_do_not_share_containers(self):
+        """Each claim split from one field owns its qualifiers and references."""
+        recipe = _recipe()
+        recipe["mappings"]["claims"][2].update(
+            {"source_field": "member_counts", "separator": ";"}
+        )
+        record = {**RECORD, "member_counts": "450000; 460000"}
+        claims = Distillate(recipe).transform_to_wikidata(record)["claims"]["P2124"]
+
+        first, second = claims
+        assert first["qualifiers"] == second["qualifiers"]
+        assert first["references"] == second["references"]
+        first_snak, second_snak = (
+            first["qualifiers"]["P585"][0],
+            second["qualifiers"]["P585"][0],
+        )
+        assert first_snak is not second_snak
+        assert first_snak["datavalue"]["value"] is not second_snak["datavalue"]["value"]
+        first["qualifiers"]["P585"].append({"snaktype": "novalue"})
+        first["qualifiers"]["P1480"] = []
+        first["references"][0]["snaks"].clear()
+        assert len(second["qualifiers"]["P585"]) == 1
+        assert "P1480" not in second["qualifiers"]
+        assert second["references"][0]["snaks"]
+
+    def test_build_claim_matches_record_transform(self):
+        """build_claim reuses the compiled plan for a single property."""
+        distillate = Distillate(_recipe())
+        expected = distillate.transform_to_wikidata(RECORD)["claims"]["P2124"][0]
+
+        assert distillate.build_claim("P2124", 450000, RECORD) == expected
+        year = distillate.build_claim("P571", "1839-09-06")
+        assert year["mainsnak"]["datavalue"]["value"]["precision"] == 9
+
+    def test_build_claim_uses_given_value_for_constant_mapping(self):
+        """A constant recipe value does not override the value passed in."""
+        distillate = Distillate(_recipe())
+        claim = distillate.build_claim("P31", "Q5")
+
+        assert claim["mainsnak"]["datavalue"]["value"]["id"] == "Q5"
+        item = distillate.transform_to_wikidata(RECORD)
+        assert item["claims"]["P31"][0]["mainsnak"]["datavalue"]["value"]["id"] != "Q5"
+
+    def test_build_claim_rejects_unmapped_property(self):
+        """Properties without a claim mapping raise ValueError."""
+        with pytest.raises(ValueError, match="P999"):
+            Distillate(_recipe()).build_claim("P999", "x")
+
+    def test_named_library_entries_compile_once(self):
+        """Claims naming the same library entry share one compiled plan."""
+        recipe = _recipe()
+        recipe["mappings"]["claims"][1]["references"] = [{"name": "stated_in_register"}]
+        distillate = Distillate(recipe)
+
+        p31_plan, p571_plan = distillate._claims[0], distillate._claims[1]
+        assert p31_plan.references[0] is p571_plan.references[0]
+
+    def test_inline_named_reference_is_reusable(self):
+        """Inline named references are registered in the reference library."""
+        distillate = Distillate(_recipe())
+        assert distillate.reference_library["with_url"] == [
+            {"property": "P854", "value_from": "source_url", "datatype": "url"}
+        ]
+
+    def test_inline_named_qualifier_does_not_override_library(self):
+        """Inline qualifier names register once; explicit entries win."""
+        recipe = _recipe()
+        recipe["mappings"]["claims"][1]["qualifiers"] = [
+            {"name": "point_in_time", "property": "P580", "datatype": "time"},
+        ]
+        recipe["mappings"]["claims"][0]["qualifiers"] = [
+            {"name": "applies_to", "property": "P518", "value": "Q1"},
+            {"property": "P1480", "value": "Q2"},
+        ]
+        distillate = Distillate(recipe)
+
+        assert distillate.qualifier_library["point_in_time"][0]["property"] == "P585"
+        assert distillate.qualifier_library["applies_to"] == [
+            {"property": "P518", "value": "Q1"},
+            {"property": "P1480", "value": "Q2"},
+        ]
+
+
+class TestDataTypeTransformer:
+    """Tests for DataTypeTransformer datavalue builders."""
+
+    @pytest.mark.parametrize(
+        "value,expected_amount",
+        [(12, "+12"), (-3.5, "-3.5"), ("+7", "+7"), ("-2", "-2"), ("4", "+4")],
+    )
+    def test_to_quantity_signs_amount_once(self, value, expected_amount):
+        """Amounts get a leading "+" only when they carry no sign."""
+        datavalue = DataTypeTransformer.to_quantity(value)
+        assert datavalue["value"] == {"amount": expected_amount, "unit": "1"}
+
+    def test_to_monolingualtext_accepts_missing_language(self):
+        """A None language passes through instead of raising."""
+        datavalue = DataTypeTransformer.to_monolingualtext("Tsalagi", None)
+        assert datavalue["value"] == {"text": "Tsalagi", "language": None}
+
+    def test_to_wikibase_item(self):
+        """QIDs convert to wikibase-entityid datavalues."""
+        assert DataTypeTransformer.to_wikibase_item("Q5") == {
+            "value": {"entity-type": "item", "numeric-id": 5, "id": "Q5"},
+            "type": "wikibase-entityid",
+        }
+
+    @pytest.mark.parametrize(
+        "date_input,expected_time,expected_precision",
+        [
+            (2005, "+2005-00-00T00:00:00Z", 9),
+            ("2005-01", "+2005-01-00T00:00:00Z", 10),
+            ("2005-01-15", "+2005-01-15T00:00:00Z", 11),
+            ("2005-01-15T12:00:00Z", "+2005-01-15T00:00:00Z", 11),
+            ("+2005-01-15", "+2005-01-15T00:00:00Z", 11),
+            ("805-3-7", "+0805-03-07T00:00:00Z", 11),
+        ],
+    )
+    def test_to_time_auto_precision(
+        self, date_input, expected_time, expected_precision
+    ):
+        """Precision is inferred from the shape of the date input."""
+        value = DataTypeTransformer.to_time(date_input)["value"]
+        assert value["time"] == expected_time
+        assert value["precision"] == expected_precision
+
+    def test_to_time_batch_matches_scalar(self):
+        """Batch conversion matches per-value conversion and keeps order."""
+        inputs = ["2005-01-15", 1999, "2005-01", "2005-01-15"]
+        batch = DataTypeTransformer.to_time_batch(inputs)
+
+        assert batch == [DataTypeTransformer.to_time(v) for v in inputs]
+        assert batch[0]["value"] is not batch[3]["value"]
+
+    def test_cached_conversions_return_fresh_dicts(self):
+        """Mutating a returned datavalue does not leak into later calls."""
+        item = DataTypeTransformer.to_wikibase_item("Q5")
+        item["value"]["id"] = "Q6"
+        time = DataTypeTransformer.to_time("2005")
+        time["value"]["precision"] = 11
+
+        assert DataTypeTransformer.to_wikibase_item("Q5")["value"]["id"] == "Q5"
+        assert DataTypeTransformer.to_time("2005")["value"]["precision"] == 9
+
+    def test_cached_values_are_read_only(self):
+        """Cached inner values cannot be mutated through the cache."""
+        from gkc.bottler import _time_value, _wikibase_item_value
+
+        with pytest.raises(TypeError):
+            _wikibase_item_value("Q5")["id"] = "Q6"  # type: ignore[index]
+        with pytest.raises(TypeError):
+            _time_value("2005", None, "Q1985727")["precision"] = 11  # type: ignore[index]
+
+    def test_to_wikibase_item_accepts_str_subclass(self):
+        """QIDs held in str subclasses (e.g. numpy.str_) still convert."""
+        value = DataTypeTransformer.to_wikibase_item(_Text("Q42"))["value"]
+        assert value["id"] == "Q42"
+        assert type(value["id"]) is str
+
+    def test_to_time_explicit_precision(self):
+        """Explicit precision truncates the date."""
+        value = DataTypeTransformer.to_time("2005-01-15", precision=9)["value"]
+        assert value["time"] == "+2005-00-00T00:00:00Z"
+
+
+class TestDistillateBatch:
+    """Tests for Distillate.transform_batch."""
+
+    def test_batch_matches_single_record(self):
+        """Batch output equals per-record transformation, in order."""
+        distillate = Distillate(_recipe())
+        records = [RECORD, {"name": "Navajo Nation", "established": "1839"}]
+
+        batch = distillate.transform_batch(records)
+
+        assert batch == [distillate.transform_to_wikidata(r) for r in records]
+
+    def test_repeated_dates_yield_independent_datavalues(self):
+        """Memoized time parsing never shares datavalue dicts between items."""
+        distillate = Distillate(_recipe())
+        first, second = distillate.transform_batch([RECORD, RECORD])
+
+        first_time = first["claims"]["P571"][0]["mainsnak"]["datavalue"]
+        second_time = second["claims"]["P571"][0]["mainsnak"]["datavalue"]
+        assert first_time == second_time
+        first_time["value"]["precision"] = 11
+        assert second_time["value"]["precision"] == 9
+
+    def test_constant_snaks_are_not_shared(self):
+        """Prebuilt constant datavalues are copied for every item."""
+        distillate = Distillate(_recipe())
+        first, second = distillate.transform_batch([RECORD, RECORD])
+
+        first_p31 = first["claims"]["P31"][0]["mainsnak"]["datavalue"]
+        second_p31 = second["claims"]["P31"][0]["mainsnak"]["datavalue"]
+        assert first_p31 == second_p31
+        assert first_p31["value"] is not second_p31["value"]
+
+    def test_identifiers_are_interned(self):
+        """Repeated identifiers share one string object across items."""
+        distillate = Distillate(_recipe())
+        first, second = distillate.transform_batch([RECORD, RECORD])
+
+        first_id = first["claims"]["P31"][0]["mainsnak"]["datavalue"]["value"]["id"]
+        second_id = second["claims"]["P31"][0]["mainsnak"]["datavalue"]["value"]["id"]
+        assert first_id is second_id
+        assert next(iter(first["claims"])) is next(iter(second["claims"]))
+
+    def test_iter_transform_is_lazy(self):
+        """Records are only transformed as the iterator is consumed."""
+        distillate = Distillate(_recipe())
+        items = distillate.iter_transform(iter([RECORD, {"members": 1}]))
+
+        assert next(items)["labels"]["en"]["value"] == "Cherokee Nation"
+        with pytest.raises(ValueError):
+            next(items)
+
+    def test_write_jsonl(self, tmp_path):
+        """Items are written one JSON object per line."""
+        distillate = Distillate(_recipe())
+        path = tmp_path / "items.jsonl"
+
+        count = distillate.write_jsonl([RECORD, RECORD], str(path))
+
+        lines = path.read_text(encoding="utf-8").splitlines()
+        assert count == len(lines) == 2
+        assert json.loads(lines[0]) == distillate.transform_to_wikidata(RECORD)
+
+    def test_transform_batch_with_workers(self):
+        """Process-pool batches match the in-process result and order."""
+        distillate = Distillate(_recipe())
+        records = [dict(RECORD, name=f"Nation {i}") for i in range(7)]
+
+        parallel = distillate.transform_batch(
+            records, workers=2, chunksize=2, min_parallel=0
+        )
+
+        assert parallel == distillate.transform_batch(records)
+
+    def test_small_batches_skip_the_process_pool(self):
+        """Batches under min_parallel are transformed in-process."""
+        distillate = Distillate(_recipe())
+        records = [dict(RECORD, name=f"Nation {i}") for i in range(7)]
+
+        with patch("gkc.bottler.ProcessPoolExecutor") as pool:
+            items = distillate.transform_batch(records, workers=4, chunksize=2)
+
+        pool.assert_not_called()
+        assert items == distillate.transform_batch(records)
+
+
+class TestSnakBuilder:
+    """Tests for SnakBuilder datatype dispatch."""
+
+    @pytest.mark.parametrize(
+        "datatype,value,transform,expected_type",
+        [
+            ("wikibase-item", "Q5", None, "wikibase-entityid"),
+            ("quantity", 12, {"unit": "1"}, "quantity"),
+            ("time", "2005", {"precision": 9}, "time"),
+            ("monolingualtext", "Tribe", {"language": "en"}, "monolingualtext"),
+            ("globe-coordinate", {"lat": 1.0, "lon": 2.0}, None, "globecoordinate"),
+            ("url", "https://example.org", None, "string"),
+            ("external-id", "abc", None, "string"),
+        ],
+    )
+    def test_create_snak(self, datatype, value, transform, expected_type):
+        """Each datatype dispatches to the matching transformer."""
+        builder = SnakBuilder(DataTypeTransformer())
+        snak = builder.create_snak("P1", value, datatype, transform)
+
+        assert snak["property"] == "P1"
+        assert snak["datavalue"]["type"] == expected_type
+
+    def test_builders_are_reused(self):
+        """Repeated calls with the same options reuse the bound builder."""
+        builder = SnakBuilder(DataTypeTransformer())
+        builder.create_snak("P1", "2005", "time", {"precision": "year"})
+        builder.create_snak("P2", "2006", "time", {"precision": "year"})
+
+        assert len(builder._builders) == 1
+
+    def test_missing_and_empty_options_share_a_builder(self):
+        """Snaks without transform options are keyed by datatype alone."""
+        builder = SnakBuilder(DataTypeTransformer())
+        builder.create_snak("P1", "Q5", "wikibase-item")
+        builder.create_snak("P2", "Q6", "wikibase-item", {})
+
+        assert list(builder._builders) == ["wikibase-item"]
+
+
+class TestClaimBuilder:
+    """Tests for ClaimBuilder claim assembly."""
+
+    def test_create_claim_with_qualifiers_and_references(self):
+        """Qualifiers and reference groups are keyed and ordered by property."""
+        builder = ClaimBuilder(SnakBuilder(DataTypeTransformer()))
+        claim = builder.create_claim(
+            "P2124",
+            120,
+            "quantity",
+            qualifiers=[{"property": "P585", "value": "2020", "datatype": "time"}],
+            references=[
+                {
+                    "P248": {"value": "Q106648236"},
+                    "P854": {"value": "https://example.org", "datatype": "url"},
+                }
+            ],
+        )
+
+        assert claim["mainsnak"]["datavalue"]["value"]["amount"] == "+120"
+        assert claim["qualifiers-order"] == ["P585"]
+        assert claim["qualifiers"]["P585"][0]["datavalue"]["type"] == "time"
+        assert claim["references"] == [
+            {
+                "snaks": {
+                    "P248": [
+                        SnakBuilder(DataTypeTransformer()).create_snak(
+                            "P248", "Q106648236", "wikibase-item"
+                        )
+                    ],
+                    "P854": [
+                        SnakBuilder(DataTypeTransformer()).create_snak(
+                            "P854", "https://example.org", "url"
+                        )
+                    ],
+                },
+                "snaks-order": ["P248", "P854"],
+            }
+        ]
+
+    def test_create_claim_without_extras(self):
+        """Claims without qualifiers or references omit those keys."""
+        builder = ClaimBuilder(SnakBuilder(DataTypeTransformer()))
+        claim = builder.create_claim("P31", "Q5", "wikibase-item", rank="preferred")
+
+        assert set(claim) == {"mainsnak", "type", "rank"}
+        assert claim["rank"] == "preferred"
+
+
+class TestDistillateFromFile:
+    """Tests for Distillate.from_file."""
+
+    def test_from_file_caches_and_isolates_config(self, tmp_path):
+        """Reloading is cached, yet each Distillate gets its own config."""
+        path = tmp_path / "recipe.json"
+        path.write_text(json.dumps(_recipe()), encoding="utf-8")
+
+        first = Distillate.from_file(str(path))
+        first.config["mappings"]["labels"] = []
+        second = Distillate.from_file(str(path))
+
+        assert second.config["mappings"]["labels"][0]["source_field"] == "name"
+
+    def test_from_file_sees_updated_file(self, tmp_path):
+        """A rewritten file is re-read."""
+        path = tmp_path / "recipe.json"
+        recipe = _recipe()
+        path.write_text(json.dumps(recipe), encoding="utf-8")
+        Distillate.from_file(str(path))
+
+        recipe["mappings"]["labels"][0]["language"] = "fr"
+        path.write_text(json.dumps(recipe), encoding="utf-8")
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        distillate = Distillate.from_file(str(path))
+        assert distillate.config["mappings"]["labels"][0]["language"] == "fr"
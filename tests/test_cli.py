@@ -67,6 +67,29 @@ def test_wikiverse_token_redacted(monkeypatch, capsys):
     assert data["details"]["token"] == "<redacted>"
 
 
+def test_json_stdout_is_ascii(capsys):
+    """JSON written to stdout escapes non-ASCII text."""
+    cli._emit_output({"ok": True, "message": "ᏣᎳᎩ"}, json_output=True, verbose=False)
+    output = capsys.readouterr().out
+
+    assert output.isascii()
+    assert json.loads(output)["message"] == "ᏣᎳᎩ"
+
+
+def test_verbose_text_output(monkeypatch, capsys):
+    """Verbose text output prints the message, a blank line, then details."""
+    monkeypatch.setattr(cli, "OpenStreetMapAuth", FakeOpenStreetMapAuth)
+
+    exit_code = cli.main(["--verbose", "auth", "osm", "status"])
+    assert exit_code == 0
+
+    lines = capsys.readouterr().out.split("\n")
+    assert lines[0] == "Credentials present"
+    assert lines[1] == ""
+    assert "authenticated: True" in lines[2:]
+    assert lines[-1] == ""
+
+
 def test_osm_status_json(monkeypatch, capsys):
     """OSM status returns JSON output."""
     monkeypatch.setattr(cli, "OpenStreetMapAuth", FakeOpenStreetMapAuth)
@@ -222,6 +245,47 @@ def test_mash_pid_basic(monkeypatch, capsys):
     assert data["datatype"] == "wikibase-item"
 
 
+def test_mash_pid_reports_missing_pids(monkeypatch, capsys):
+    """Unknown PIDs are reported while resolved properties are still output."""
+    from gkc.mash import WikidataPropertyTemplate
+
+    class FakeWikidataLoader:
+        def load_properties(self, pids):
+            return {
+                pid: WikidataPropertyTemplate(
+                    pid=pid,
+                    labels={"en": "instance of"},
+                    descriptions={},
+                    aliases={},
+                    datatype="wikibase-item",
+                    formatter_url=None,
+                    entity_data={"id": pid, "datatype": "wikibase-item"},
+                )
+                for pid in pids
+                if pid != "P999999"
+            }
+
+    monkeypatch.setattr(cli, "WikidataLoader", FakeWikidataLoader)
+
+    args = argparse.Namespace(
+        pid="P31",
+        pids=["P999999"],
+        pid_list=None,
+        output=None,
+        raw=False,
+        transform=None,
+        command_path="mash.pid",
+    )
+
+    result = cli._handle_mash_pid(args)
+    data = json.loads(capsys.readouterr().out)
+
+    assert result["ok"] is True
+    assert result["details"] == {"pids": ["P31"], "missing_pids": ["P999999"]}
+    assert "P999999" in result["message"]
+    assert data["id"] == "P31"
+
+
 def test_mash_eid_basic(monkeypatch, capsys):
     """Mash eid loads an EntitySchema."""
     from gkc.mash import WikidataEntitySchemaTemplate
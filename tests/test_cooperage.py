@@ -0,0 +1,127 @@
+"""Tests for Cooperage schema fetching."""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from gkc.cooperage import (
+    MetadataCache,
+    clear_schema_cache,
+    fetch_entity_schema_json,
+    fetch_entity_schema_metadata,
+    fetch_schema_specification,
+    set_metadata_cache,
+)
+
+
+@pytest.fixture(autouse=True)
+def _empty_schema_cache():
+    clear_schema_cache()
+    yield
+    clear_schema_cache()
+    set_metadata_cache(None)
+
+
+class TestFetchSchemaSpecification:
+    """Tests for fetch_schema_specification memoization."""
+
+    @patch("gkc.cooperage._http.get")
+    def test_schema_text_is_cached_per_eid(self, mock_get):
+        """Repeated fetches for the same EID only hit the network once."""
+        mock_response = Mock()
+        mock_response.json.return_value = {"schemaText": "<Shape> {}"}
+        mock_get.return_value = mock_response
+
+        first = fetch_schema_specification("E502")
+        second = fetch_schema_specification("E502")
+
+        assert first == second == "<Shape> {}"
+        assert mock_get.call_count == 1
+
+    @patch("gkc.cooperage._http.get")
+    def test_use_cache_false_refetches(self, mock_get):
+        """Disabling the cache forces a fresh fetch."""
+        mock_response = Mock()
+        mock_response.json.return_value = {"schemaText": "<Shape> {}"}
+        mock_get.return_value = mock_response
+
+        fetch_schema_specification("E502")
+        fetch_schema_specification("E502", use_cache=False)
+
+        assert mock_get.call_count == 2
+
+    @patch("gkc.cooperage._http.get")
+    def test_memo_expires_and_is_bounded(self, mock_get, monkeypatch):
+        """Stale entries are refetched and old EIDs fall out past the bound."""
+        mock_response = Mock()
+        mock_response.json.return_value = {"schemaText": "<Shape> {}"}
+        mock_get.return_value = mock_response
+
+        fetch_schema_specification("E502")
+        monkeypatch.setattr("gkc.cooperage.SCHEMA_MEMO_TTL", -1.0)
+        fetch_schema_specification("E502")
+        assert mock_get.call_count == 2
+
+        monkeypatch.setattr("gkc.cooperage.SCHEMA_MEMO_TTL", 3600.0)
+        monkeypatch.setattr("gkc.cooperage.SCHEMA_MEMO_SIZE", 1)
+        fetch_schema_specification("E503")
+        fetch_schema_specification("E502")  # evicted by E503, fetched again
+        assert mock_get.call_count == 4
+
+    @patch("gkc.cooperage._http.get")
+    def test_disk_cache_survives_memo_reset(self, mock_get, tmp_path):
+        """A configured MetadataCache serves schema text across processes."""
+        mock_response = Mock()
+        mock_response.json.return_value = {"schemaText": "<Shape> {}"}
+        mock_get.return_value = mock_response
+        set_metadata_cache(MetadataCache(tmp_path / "metadata.sqlite3"))
+
+        fetch_schema_specification("E502")
+        clear_schema_cache()  # simulate a fresh process
+        text = fetch_schema_specification("E502")
+
+        assert text == "<Shape> {}"
+        assert mock_get.call_count == 1
+
+    @patch("gkc.cooperage._http.get")
+    def test_schema_json_is_shared_and_copied(self, mock_get):
+        """Schema JSON is fetched once and each caller gets its own copy."""
+        mock_response = Mock()
+        mock_response.json.return_value = {
+            "labels": {"en": "tribe"},
+            "schemaText": "<Shape> {}",
+        }
+        mock_get.return_value = mock_response
+
+        first = fetch_entity_schema_json("E502")
+        first["labels"]["en"] = "mutated"
+        metadata = fetch_entity_schema_metadata("E502")
+        text = fetch_schema_specification("E502")
+
+        assert metadata["label"] == "tribe"
+        assert text == "<Shape> {}"
+        assert mock_get.call_count == 1
+
+
+class TestMetadataCache:
+    """Tests for the SQLite-backed MetadataCache."""
+
+    def test_round_trip_and_clear(self, tmp_path):
+        """Stored payloads come back until their kind is cleared."""
+        cache = MetadataCache(tmp_path / "metadata.sqlite3")
+        cache.set("page_exists", "enwiki|Tulsa|False", [True, ""])
+        cache.set("schema_text", "E502", "<Shape> {}")
+
+        assert cache.get("page_exists", "enwiki|Tulsa|False") == [True, ""]
+        cache.clear("page_exists")
+        assert cache.get("page_exists", "enwiki|Tulsa|False") is None
+        assert cache.get("schema_text", "E502") == "<Shape> {}"
+
+    def test_stale_entries_are_ignored(self, tmp_path):
+        """Entries older than max_age are treated as missing."""
+        cache = MetadataCache(tmp_path / "metadata.sqlite3", max_age=60)
+        cache.set("schema_text", "E502", "<Shape> {}")
+
+        with patch("gkc.cooperage.time.time", return_value=10**12):
+            assert cache.get("schema_text", "E502") is None
+        assert cache.get("schema_text", "E502", max_age=10**13) == "<Shape> {}"
@@ -0,0 +1,22 @@
+"""Tests for the shared HTTP session module."""
+
+from gkc import _http
+
+
+class TestSharedSession:
+    """Tests for gkc._http."""
+
+    def test_session_is_shared_until_closed(self):
+        """Callers get the same pooled session until it is closed."""
+        _http.close_session()
+        first = _http.session()
+
+        assert _http.session() is first
+        assert (
+            first.get_adapter("https://www.wikidata.org")._pool_maxsize
+            == _http.POOL_MAXSIZE
+        )
+
+        _http.close_session()
+        assert _http.session() is not first
+        _http.close_session()
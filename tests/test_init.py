@@ -1,5 +1,10 @@
 """Tests for package initialization."""
 
+import subprocess
+import sys
+
+import pytest
+
 import gkc
 
 
@@ -38,3 +43,47 @@ def test_cooperage_imports():
     assert hasattr(gkc, "CooperageError")
     assert hasattr(gkc, "fetch_schema_specification")
     assert hasattr(gkc, "validate_entity_reference")
+
+
+def test_submodules_load_on_first_access():
+    """Importing gkc defers submodule imports until a name is used."""
+    code = (
+        "import sys, gkc\n"
+        "assert 'gkc.shex' not in sys.modules\n"
+        "gkc.SPARQLQuery\n"
+        "assert 'gkc.sparql' in sys.modules and 'gkc.shex' not in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_cli_import_defers_dataframe_libraries():
+    """Loading the CLI, bottler, or sitelinks does not import pandas/pyarrow."""
+    code = (
+        "import sys, gkc.cli, gkc.bottler, gkc.sitelinks\n"
+        "assert 'pandas' not in sys.modules and 'pyarrow' not in sys.modules\n"
+        "assert 'numpy' not in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_unknown_attribute_raises():
+    """Unknown names still raise AttributeError."""
+    with pytest.raises(AttributeError):
+        gkc.NotAThing  # noqa: B018
+    assert "ShexValidator" in dir(gkc)
+
+
+def test_all_matches_lazy_exports():
+    """__all__ lists exactly the lazy exports plus the language helpers."""
+    assert set(gkc.__all__) == set(gkc._LAZY_ATTRIBUTES) | {
+        "get_languages",
+        "set_languages",
+    }
+    for name in gkc.__all__:
+        assert getattr(gkc, name) is not None
+
+
+def test_resolved_names_are_cached_in_module_globals():
+    """After first access, names are plain globals and skip __getattr__."""
+    value = gkc.SitelinkValidator
+    assert vars(gkc)["SitelinkValidator"] is value
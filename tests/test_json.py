@@ -0,0 +1,79 @@
+"""Tests for the JSON helper module."""
+
+import io
+import json
+
+import pytest
+
+from gkc import _json
+
+
+@pytest.fixture(params=[True, False], ids=["orjson", "stdlib"])
+def backend(request, monkeypatch):
+    """Run each test with and without the orjson fast path."""
+    if request.param and not _json.HAS_ORJSON:
+        pytest.skip("orjson not installed")
+    monkeypatch.setattr(_json, "HAS_ORJSON", request.param)
+    return request.param
+
+
+class TestJsonHelpers:
+    """Tests for gkc._json."""
+
+    def test_round_trip(self, backend):
+        """Data survives dumps/loads unchanged."""
+        data = {"labels": {"en": {"value": "Cherokee Nation"}}, "ids": [1, 2.5]}
+        assert _json.loads(_json.dumps(data)) == data
+
+    def test_indent_matches_stdlib(self, backend):
+        """Indented ASCII output matches json.dumps(indent=2)."""
+        data = {"a": [1, {"b": None}], "c": True}
+        assert _json.dumps(data, indent=True) == json.dumps(data, indent=2)
+
+    def test_compact_utf8_output(self, backend):
+        """Both encoders emit the same compact, unescaped UTF-8 text."""
+        data = {"label": "ᏣᎳᎩ", "ids": [1, 2]}
+        assert _json.dumps(data) == '{"label":"ᏣᎳᎩ","ids":[1,2]}'
+        assert _json.dumpb(data) == _json.dumps(data).encode("utf-8")
+
+    def test_ensure_ascii_escapes(self, backend):
+        """ensure_ascii escapes non-ASCII text on either backend."""
+        text = _json.dumps({"label": "ᏣᎳᎩ"}, ensure_ascii=True)
+        assert text.isascii()
+        assert _json.loads(text) == {"label": "ᏣᎳᎩ"}
+
+    def test_sort_keys(self, backend):
+        """Keys are sorted on request."""
+        assert _json.dumps({"b": 1, "a": 2}, sort_keys=True).index('"a"') < 5
+
+    def test_large_integers_fall_back(self, backend):
+        """Integers beyond 64 bits still serialize."""
+        assert _json.loads(_json.dumps({"n": 2**70})) == {"n": 2**70}
+
+    def test_dump_and_load_file_handles(self, backend):
+        """dump/load work on text handles."""
+        buffer = io.StringIO()
+        _json.dump({"x": 1}, buffer, indent=True)
+        buffer.seek(0)
+        assert _json.load(buffer) == {"x": 1}
+
+    def test_dump_to_binary_handle(self, backend):
+        """dump writes UTF-8 bytes to binary handles."""
+        buffer = io.BytesIO()
+        _json.dump({"name": "Tsalagi"}, buffer)
+        assert _json.loads(buffer.getvalue()) == {"name": "Tsalagi"}
+        assert _json.dumpb({"x": 1}) == _json.dumps({"x": 1}).encode("utf-8")
+
+    def test_streamed_dump_matches_dumps(self, backend):
+        """Member-by-member output is the same document dumps produces."""
+        data = {"items": [{"id": "Q1", "labels": {"en": "Line\nbreak"}}], "n": 2}
+        for obj in (data, [data, [], {}], {}, "scalar"):
+            buffer = io.BytesIO()
+            _json.dump(obj, buffer, indent=True)
+            assert buffer.getvalue() == _json.dumpb(obj, indent=True)
+            assert _json.loads(b"".join(_json.iter_encode(obj))) == obj
+
+    def test_invalid_json_raises_decode_error(self, backend):
+        """Invalid input raises the stdlib JSONDecodeError type."""
+        with pytest.raises(json.JSONDecodeError):
+            _json.loads("{not json")
@@ -494,6 +494,29 @@ def test_wikidata_loader_load_items_empty():
     assert result == {}
 
 
+def test_wikidata_loader_load_properties_batches(monkeypatch):
+    """Properties are fetched 50 per request and returned in input order."""
+    loader = WikidataLoader()
+    requested = []
+
+    def fake_fetch_batch(entity_ids):
+        requested.append(list(entity_ids))
+        return {
+            pid: {"id": pid, "datatype": "wikibase-item", "labels": {}}
+            for pid in entity_ids
+            if pid != "P999999"
+        }
+
+    monkeypatch.setattr(loader, "_fetch_entities_batch", fake_fetch_batch)
+    pids = [f"P{i}" for i in range(1, 121)] + ["P999999", "P1"]
+
+    templates = loader.load_properties(pids)
+
+    assert sorted(len(batch) for batch in requested) == [21, 50, 50]
+    assert list(templates) == [f"P{i}" for i in range(1, 121)]
+    assert templates["P31"].datatype == "wikibase-item"
+
+
 def test_wikipedia_template_initialization():
     """Test creating a Wikipedia template."""
     template = WikipediaTemplate(
@@ -561,3 +584,64 @@ def test_wikipedia_loader_custom_user_agent():
     """Test initializing a Wikipedia loader with custom user agent."""
     loader = WikipediaLoader(user_agent="CustomBot/1.0")
     assert loader.user_agent == "CustomBot/1.0"
+
+
+def test_wikidata_entity_schema_template_shape_index():
+    """Test lazy shape and property lookup on entity schema text."""
+    schema_text = "\n".join(
+        [
+            "PREFIX wdt: <http://www.wikidata.org/prop/direct/>",
+            "start = @<tribe>",
+            "",
+            "<tribe> EXTRA wdt:P31 {",
+            "  wdt:P31 [ wd:Q7840353 ] ;",
+            "  p:P571 @<inception> ? ;",
+            "}",
+            "",
+            "<inception> {",
+            "  ps:P571 . ;",
+            "  pq:P585 . * ;",
+            "}",
+        ]
+    )
+    template = WikidataEntitySchemaTemplate(
+        eid="E502",
+        labels={},
+        descriptions={},
+        schema_text=schema_text,
+        entity_data={"id": "E502"},
+    )
+
+    assert template.shape_names() == ["tribe", "inception"]
+    assert template.shape_text("inception").startswith("<inception> {")
+    assert template.shape_text("inception").endswith("}")
+    assert template.property_ids() == ["P31", "P571", "P585"]
+    assert template.property_ids("inception") == ["P571", "P585"]
+
+
+def test_wikidata_entity_schema_template_ignores_iri_predicate_lines():
+    """Body lines opening with a full IRI are not shape declarations."""
+    schema_text = "\n".join(
+        [
+            "<tribe> EXTRA <http://www.wikidata.org/prop/direct/P31> {",
+            "  <http://www.wikidata.org/prop/direct/P31> [ wd:Q7840353 ] ;",
+            "  # a comment with a stray { brace",
+            '  rdfs:label [ "}" ] ? ;',
+            "  <http://www.wikidata.org/prop/P571> @<inception> ?",
+            "}",
+            "",
+            "<inception> {",
+            "  ps:P571 . ;",
+            "}",
+        ]
+    )
+    template = WikidataEntitySchemaTemplate(
+        eid="E502",
+        labels={},
+        descriptions={},
+        schema_text=schema_text,
+        entity_data={"id": "E502"},
+    )
+
+    assert template.shape_names() == ["tribe", "inception"]
+    assert template.shape_text("tribe").endswith("?\n}")
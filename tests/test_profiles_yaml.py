@@ -98,3 +98,10 @@ def test_exemplar_profile_covers_datatypes_and_prompts(exemplar_fixture_path: Pa
     assert {"time", "string", "globecoordinate", "item", "monolingualtext"}.issubset(
         qualifier_types
     )
+
+
+def test_profile_loaders_share_parsed_schema():
+    """Two loaders reuse one parsed copy of the default schema."""
+    first = ProfileLoader()
+    second = ProfileLoader()
+    assert first._load_schema() is second._load_schema()
@@ -7,6 +7,7 @@ the test data files as described in tests/fixtures/README.md.
 Note: These tests will be skipped if the required data files don't exist.
 """
 
+import gzip
 from pathlib import Path
 
 import pytest
@@ -113,6 +114,32 @@ class TestShExIntegration:
 
         assert result.is_valid()
 
+    def test_with_rdf_shares_schema(
+        self,
+        organism_schema_file: Path,
+        valid_organism_rdf_file: Path,
+        invalid_organism_rdf_file: Path,
+    ) -> None:
+        """One loaded schema can validate several RDF documents.
+
+        Test is skipped if files don't exist.
+        """
+        if (
+            not organism_schema_file.exists()
+            or not valid_organism_rdf_file.exists()
+            or not invalid_organism_rdf_file.exists()
+        ):
+            pytest.skip("Test data files not found. See tests/fixtures/README.md")
+
+        base = ShexValidator(schema_file=str(organism_schema_file))
+
+        valid = base.with_rdf(rdf_file=str(valid_organism_rdf_file)).check()
+        invalid = base.with_rdf(rdf_file=str(invalid_organism_rdf_file)).check()
+
+        assert valid.is_valid()
+        assert not invalid.is_valid()
+        assert valid.schema_text == invalid.schema_text == base._schema
+
     def test_compare_file_path_vs_text_loading(
         self,
         organism_schema_file: Path,
@@ -149,6 +176,30 @@ class TestShExIntegration:
         # Results should be the same
         assert result_file.is_valid() == result_text.is_valid()
 
+    def test_validate_gzipped_rdf_file(
+        self,
+        organism_schema_file: Path,
+        valid_organism_rdf_file: Path,
+        tmp_path: Path,
+    ) -> None:
+        """Gzip-compressed Turtle files are read without manual decompression.
+
+        Test is skipped if files don't exist.
+        """
+        if not organism_schema_file.exists() or not valid_organism_rdf_file.exists():
+            pytest.skip("Test data files not found. See tests/fixtures/README.md")
+
+        gz_file = tmp_path / "entity.ttl.gz"
+        with gzip.open(gz_file, "wb") as f:
+            f.write(valid_organism_rdf_file.read_bytes())
+
+        validator = ShexValidator(
+            schema_file=str(organism_schema_file),
+            rdf_file=str(gz_file),
+        )
+
+        assert validator.check().is_valid()
+
 
 class TestFetchFromWikidata:
     """Integration tests that fetch data from Wikidata API.
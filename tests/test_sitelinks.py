@@ -0,0 +1,139 @@
+"""Tests for sitelink validation."""
+
+from unittest.mock import Mock, patch
+
+from gkc.cooperage import MetadataCache
+from gkc.sitelinks import MAX_TITLES_PER_QUERY, SitelinkValidator, validate_series
+
+
+def _query_response(query):
+    response = Mock()
+    response.json.return_value = {"query": query}
+    return response
+
+
+class TestCheckPagesExist:
+    """Tests for batched page existence checks."""
+
+    @patch("gkc.sitelinks._http.session")
+    def test_titles_share_one_request(self, mock_shared_session):
+        """All titles for a site go out in a single pipe-joined query."""
+        mock_session = Mock()
+        mock_shared_session.return_value = mock_session
+        mock_session.get.return_value = _query_response(
+            {
+                "normalized": [{"from": "cherokee nation", "to": "Cherokee nation"}],
+                "redirects": [{"from": "Old Name", "to": "New Name"}],
+                "pages": {
+                    "1": {"pageid": 1, "title": "Cherokee nation"},
+                    "2": {"pageid": 2, "title": "New Name"},
+                    "-1": {"title": "Nowhere", "missing": ""},
+                },
+            }
+        )
+
+        validator = SitelinkValidator()
+        results = validator.check_pages_exist(
+            ["cherokee nation", "Old Name", "Nowhere", ""], "enwiki"
+        )
+
+        assert mock_session.get.call_count == 1
+        params = mock_session.get.call_args.kwargs["params"]
+        assert params["titles"] == "cherokee nation|Old Name|Nowhere"
+        assert results == {
+            "cherokee nation": (True, ""),
+            "Old Name": (False, "Page is a redirect to: New Name"),
+            "Nowhere": (False, "Page does not exist"),
+            "": (False, "Empty title"),
+        }
+
+    @patch("gkc.sitelinks._http.session")
+    def test_large_inputs_are_chunked(self, mock_shared_session):
+        """Inputs beyond the API limit are split across requests."""
+        mock_session = Mock()
+        mock_shared_session.return_value = mock_session
+        mock_session.get.return_value = _query_response({"pages": {}})
+
+        titles = [f"Page {i}" for i in range(MAX_TITLES_PER_QUERY + 1)]
+        SitelinkValidator().check_pages_exist(titles, "enwiki")
+
+        assert mock_session.get.call_count == 2
+
+    @patch("gkc.sitelinks._http.session")
+    def test_cached_results_skip_the_network(self, mock_shared_session, tmp_path):
+        """Answers stored in a MetadataCache are reused by later validators."""
+        mock_session = Mock()
+        mock_shared_session.return_value = mock_session
+        mock_session.get.return_value = _query_response(
+            {"pages": {"1": {"pageid": 1, "title": "Tulsa"}}}
+        )
+        cache = MetadataCache(tmp_path / "metadata.sqlite3")
+
+        SitelinkValidator(cache=cache).check_pages_exist(["Tulsa"], "enwiki")
+        exists = SitelinkValidator(cache=cache).check_page_exists("Tulsa", "enwiki")
+
+        assert exists == (True, "")
+        assert mock_session.get.call_count == 1
+
+    @patch("gkc.sitelinks._http.session")
+    def test_validate_series_keeps_valid_titles(self, mock_shared_session):
+        """validate_series returns the title for valid pages, else None."""
+        mock_session = Mock()
+        mock_shared_session.return_value = mock_session
+        mock_session.get.return_value = _query_response(
+            {
+                "pages": {
+                    "1": {"pageid": 1, "title": "Tulsa"},
+                    "-1": {"title": "Nowhere", "missing": ""},
+                }
+            }
+        )
+
+        validated = SitelinkValidator().validate_series(
+            ["Tulsa", None, "Nowhere", "Tulsa"]
+        )
+
+        assert validated == ["Tulsa", None, None, "Tulsa"]
+        assert mock_session.get.call_count == 1
+
+    @patch("gkc.sitelinks._http.session")
+    def test_validate_series_checks_distinct_titles(self, mock_shared_session):
+        """Repeated titles are sent once and mapped back onto every row."""
+        mock_session = Mock()
+        mock_shared_session.return_value = mock_session
+        mock_session.get.return_value = _query_response(
+            {"pages": {"1": {"pageid": 1, "title": "Tulsa"}}}
+        )
+
+        validated = validate_series(["Tulsa", "Tulsa", None], "enwiki")
+
+        assert validated == ["Tulsa", "Tulsa", None]
+        params = mock_session.get.call_args.kwargs["params"]
+        assert params["titles"] == "Tulsa"
+
+
+class TestValidateAndFilter:
+    """Tests for single-pass sitelink validation."""
+
+    @patch("gkc.sitelinks._http.session")
+    def test_returns_filtered_and_details_in_one_pass(self, mock_shared_session):
+        """Each site is checked once and reported in both results."""
+        mock_session = Mock()
+        mock_shared_session.return_value = mock_session
+        mock_session.get.side_effect = [
+            _query_response({"pages": {"1": {"pageid": 1, "title": "Tulsa"}}}),
+            _query_response({"pages": {"-1": {"title": "Tulsa", "missing": ""}}}),
+        ]
+        sitelinks = {
+            "enwiki": {"site": "enwiki", "title": "Tulsa", "badges": []},
+            "frwiki": {"site": "frwiki", "title": "Tulsa", "badges": []},
+            "dewiki": {"site": "dewiki", "title": "", "badges": []},
+        }
+
+        with patch("gkc.sitelinks.sleep"):
+            valid, details = SitelinkValidator().validate_and_filter(sitelinks)
+
+        assert list(valid) == ["enwiki"]
+        assert details["frwiki"] == (False, "Page does not exist")
+        assert details["dewiki"] == (False, "No title provided")
+        assert mock_session.get.call_count == 2
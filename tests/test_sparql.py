@@ -1,13 +1,16 @@
 """Tests for SPARQL query utilities."""
 
+import json
 from unittest.mock import MagicMock, patch
 from urllib.parse import quote
 
 import pytest
 
 from gkc.sparql import (
+    DEFAULT_WIKIDATA_ENDPOINT,
     SPARQLError,
     SPARQLQuery,
+    _executor_for,
     execute_sparql,
     execute_sparql_to_dataframe,
 )
@@ -90,7 +93,7 @@ class TestSPARQLQueryExecution:
     def test_query_json_response(self, mock_get):
         """Execute query with JSON response."""
         mock_response = MagicMock()
-        mock_response.json.return_value = {"results": {"bindings": []}}
+        mock_response.content = json.dumps({"results": {"bindings": []}}).encode()
         mock_get.return_value = mock_response
 
         executor = SPARQLQuery()
@@ -121,7 +124,7 @@ class TestSPARQLQueryExecution:
     def test_query_with_url(self, mock_get):
         """Execute query provided as Wikidata URL."""
         mock_response = MagicMock()
-        mock_response.json.return_value = {"results": {"bindings": []}}
+        mock_response.content = json.dumps({"results": {"bindings": []}}).encode()
         mock_get.return_value = mock_response
 
         query_text = "SELECT ?item WHERE { ?item wdt:P31 wd:Q5 }"
@@ -171,6 +174,25 @@ class TestSPARQLQueryExecution:
         with pytest.raises(SPARQLError):
             executor.query("SELECT ?item WHERE { ?item wdt:P31 wd:Q5 }")
 
+    @patch("gkc.sparql.requests.Session.get")
+    def test_http_error_keeps_body_out_of_message(self, mock_get):
+        """The error body is available on demand but not in the message."""
+        import requests
+
+        mock_response = MagicMock()
+        mock_response.text = "MalformedQueryException: " + "x" * 10000
+        mock_response.raise_for_status.side_effect = requests.HTTPError(
+            "400 Client Error: Bad Request", response=mock_response
+        )
+        mock_get.return_value = mock_response
+
+        with pytest.raises(SPARQLError) as exc_info:
+            SPARQLQuery().query("SELECT ?item WHERE { ?item }")
+
+        assert "MalformedQueryException" not in str(exc_info.value)
+        assert exc_info.value.response is mock_response
+        assert exc_info.value.body.startswith("MalformedQueryException")
+
 
 class TestSPARQLToDataFrame:
     """Test DataFrame conversion."""
@@ -183,21 +205,23 @@ class TestSPARQLToDataFrame:
     def test_to_dataframe_with_pandas(self, mock_get):
         """Convert query results to DataFrame."""
         mock_response = MagicMock()
-        mock_response.json.return_value = {
-            "head": {"vars": ["item", "itemLabel"]},
-            "results": {
-                "bindings": [
-                    {
-                        "item": {"value": "http://www.wikidata.org/entity/Q1"},
-                        "itemLabel": {"value": "One"},
-                    },
-                    {
-                        "item": {"value": "http://www.wikidata.org/entity/Q2"},
-                        "itemLabel": {"value": "Two"},
-                    },
-                ]
-            },
-        }
+        mock_response.content = json.dumps(
+            {
+                "head": {"vars": ["item", "itemLabel"]},
+                "results": {
+                    "bindings": [
+                        {
+                            "item": {"value": "http://www.wikidata.org/entity/Q1"},
+                            "itemLabel": {"value": "One"},
+                        },
+                        {
+                            "item": {"value": "http://www.wikidata.org/entity/Q2"},
+                            "itemLabel": {"value": "Two"},
+                        },
+                    ]
+                },
+            }
+        ).encode()
         mock_get.return_value = mock_response
 
         executor = SPARQLQuery()
@@ -208,6 +232,119 @@ class TestSPARQLToDataFrame:
         assert df.iloc[0]["item"] == "http://www.wikidata.org/entity/Q1"
         assert df.iloc[0]["itemLabel"] == "One"
 
+    @pytest.mark.skipif(
+        not __import__("importlib.util").util.find_spec("pandas"),
+        reason="pandas not installed",
+    )
+    @patch("gkc.sparql.requests.Session.get")
+    def test_to_dataframe_typed_columns(self, mock_get):
+        """Numeric columns are opt-in via typed=True; unbound cells are NaN."""
+        xsd_integer = "http://www.w3.org/2001/XMLSchema#integer"
+        mock_response = MagicMock()
+        mock_response.content = json.dumps(
+            {
+                "head": {"vars": ["city", "population", "note"]},
+                "results": {
+                    "bindings": [
+                        {
+                            "city": {"type": "uri", "value": "Q1"},
+                            "population": {
+                                "type": "literal",
+                                "datatype": xsd_integer,
+                                "value": "1200000",
+                            },
+                        },
+                        {
+                            "city": {"type": "uri", "value": "Q2"},
+                            "population": {
+                                "type": "literal",
+                                "datatype": xsd_integer,
+                                "value": "900",
+                            },
+                            "note": {"type": "literal", "value": "small"},
+                        },
+                    ]
+                },
+            }
+        ).encode()
+        mock_get.return_value = mock_response
+
+        executor = SPARQLQuery()
+        query = "SELECT ?city ?population ?note WHERE {}"
+
+        plain = executor.to_dataframe(query)
+        assert list(plain.columns) == ["city", "population", "note"]
+        assert plain["population"].tolist() == ["1200000", "900"]
+        assert plain["note"].tolist()[1] == "small"
+        assert isinstance(plain["note"].tolist()[0], float)
+
+        df = executor.to_dataframe(query, typed=True)
+        assert df["population"].tolist() == [1200000, 900]
+        assert (df["population"] > 1000000).tolist() == [True, False]
+        assert df["note"].isna().tolist() == [True, False]
+
+    @pytest.mark.skipif(
+        not __import__("importlib.util").util.find_spec("pyarrow"),
+        reason="pyarrow not installed",
+    )
+    @patch("gkc.sparql.requests.Session.get")
+    def test_to_arrow_typed_columns(self, mock_get):
+        """Arrow columns follow literal datatypes; repeated IRIs are encoded."""
+        import pyarrow as pa
+
+        xsd = "http://www.w3.org/2001/XMLSchema#"
+        rows = [
+            ("Q1", "12", "1.5", "2001-01-15T00:00:00Z", "-0500-01-01T00:00:00Z"),
+            ("Q1", "7", "2", "1999-12-31T00:00:00Z", "1999-01-01T00:00:00Z"),
+            ("Q1", None, "3.25", "2020-02-29T00:00:00Z", "2000-01-01T00:00:00Z"),
+        ]
+        bindings = []
+        for item, count, ratio, date, era in rows:
+            binding = {
+                "item": {"type": "uri", "value": item},
+                "ratio": {
+                    "type": "literal",
+                    "datatype": xsd + "decimal",
+                    "value": ratio,
+                },
+                "date": {
+                    "type": "literal",
+                    "datatype": xsd + "dateTime",
+                    "value": date,
+                },
+                "era": {"type": "literal", "datatype": xsd + "dateTime", "value": era},
+            }
+            if count is not None:
+                binding["count"] = {
+                    "type": "literal",
+                    "datatype": xsd + "integer",
+                    "value": count,
+                }
+            bindings.append(binding)
+        mock_response = MagicMock()
+        mock_response.content = json.dumps(
+            {
+                "head": {"vars": ["item", "count", "ratio", "date", "era"]},
+                "results": {"bindings": bindings},
+            }
+        ).encode()
+        mock_get.return_value = mock_response
+
+        table = SPARQLQuery().to_arrow("SELECT * WHERE {}")
+
+        assert table.column_names == ["item", "count", "ratio", "date", "era"]
+        assert pa.types.is_dictionary(table.schema.field("item").type)
+        assert table.column("count").to_pylist() == [12, 7, None]
+        assert table.schema.field("ratio").type == pa.float64()
+        assert pa.types.is_timestamp(table.schema.field("date").type)
+        assert table.schema.field("era").type == pa.string()
+
+    def test_to_arrow_without_pyarrow(self):
+        """Raise error if pyarrow is not available."""
+        with patch("gkc.sparql.HAS_PYARROW", False):
+            with pytest.raises(SPARQLError, match="pyarrow is required"):
+                SPARQLQuery().to_arrow("SELECT ?item WHERE { ... }")
+
     def test_to_dataframe_without_pandas(self):
         """Raise error if pandas is not available."""
         with patch("gkc.sparql.HAS_PANDAS", False):
@@ -223,21 +360,23 @@ class TestSPARQLToDictList:
     def test_to_dict_list(self, mock_get):
         """Convert query results to list of dicts."""
         mock_response = MagicMock()
-        mock_response.json.return_value = {
-            "head": {"vars": ["item", "itemLabel"]},
-            "results": {
-                "bindings": [
-                    {
-                        "item": {"value": "http://www.wikidata.org/entity/Q1"},
-                        "itemLabel": {"value": "One"},
-                    },
-                    {
-                        "item": {"value": "http://www.wikidata.org/entity/Q2"},
-                        "itemLabel": {"value": "Two"},
-                    },
-                ]
-            },
-        }
+        mock_response.content = json.dumps(
+            {
+                "head": {"vars": ["item", "itemLabel"]},
+                "results": {
+                    "bindings": [
+                        {
+                            "item": {"value": "http://www.wikidata.org/entity/Q1"},
+                            "itemLabel": {"value": "One"},
+                        },
+                        {
+                            "item": {"value": "http://www.wikidata.org/entity/Q2"},
+                            "itemLabel": {"value": "Two"},
+                        },
+                    ]
+                },
+            }
+        ).encode()
         mock_get.return_value = mock_response
 
         executor = SPARQLQuery()
@@ -272,6 +411,19 @@ class TestSPARQLToCSV:
         call_args = mock_get.call_args
         assert call_args[1]["params"]["format"] == "csv"
 
+    @patch("gkc.sparql.requests.Session.get")
+    def test_to_csv_file_is_written_verbatim(self, mock_get, tmp_path):
+        """CSV row endings and non-ASCII text reach the file unchanged."""
+        csv_data = "item,itemLabel\r\nQ1,Tsalagi \u13e3\r\n"
+        mock_response = MagicMock()
+        mock_response.text = csv_data
+        mock_get.return_value = mock_response
+
+        filepath = tmp_path / "results.csv"
+        SPARQLQuery().to_csv("SELECT ?item WHERE { ... }", filepath=str(filepath))
+
+        assert filepath.read_bytes() == csv_data.encode("utf-8")
+
     @patch("gkc.sparql.requests.Session.get")
     def test_to_csv_with_file(self, mock_get, tmp_path):
         """Save CSV results to file."""
@@ -332,7 +484,7 @@ class TestSPARQLEndpointCustomization:
         """Use custom SPARQL endpoint."""
         custom_endpoint = "https://custom.sparql.endpoint/query"
         mock_response = MagicMock()
-        mock_response.json.return_value = {"results": {"bindings": []}}
+        mock_response.content = json.dumps({"results": {"bindings": []}}).encode()
         mock_get.return_value = mock_response
 
         executor = SPARQLQuery(endpoint=custom_endpoint)
@@ -346,7 +498,7 @@ class TestSPARQLEndpointCustomization:
         """Use custom user agent."""
         custom_agent = "Custom-Agent/1.0"
         mock_response = MagicMock()
-        mock_response.json.return_value = {"results": {"bindings": []}}
+        mock_response.content = json.dumps({"results": {"bindings": []}}).encode()
         mock_get.return_value = mock_response
 
         executor = SPARQLQuery(user_agent=custom_agent)
@@ -355,11 +507,24 @@ class TestSPARQLEndpointCustomization:
         # Check that session headers were set
         assert executor.session.headers.get("User-Agent") == custom_agent
 
+    @patch("gkc.sparql.requests.Session.get")
+    def test_compressed_results_are_requested(self, mock_get):
+        """Requests ask for compressed bodies and the SPARQL results type."""
+        mock_response = MagicMock()
+        mock_response.text = "item\nQ1"
+        mock_get.return_value = mock_response
+
+        executor = SPARQLQuery()
+        executor.query("SELECT ?item WHERE { ... }", format="csv", raw=True)
+
+        assert "gzip" in executor.session.headers["Accept-Encoding"]
+        assert mock_get.call_args[1]["headers"] == {"Accept": "text/csv"}
+
     @patch("gkc.sparql.requests.Session.get")
     def test_custom_timeout(self, mock_get):
         """Use custom timeout."""
         mock_response = MagicMock()
-        mock_response.json.return_value = {"results": {"bindings": []}}
+        mock_response.content = json.dumps({"results": {"bindings": []}}).encode()
         mock_get.return_value = mock_response
 
         executor = SPARQLQuery(timeout=60)
@@ -367,3 +532,127 @@ class TestSPARQLEndpointCustomization:
 
         call_args = mock_get.call_args
         assert call_args[1]["timeout"] == 60
+
+
+class TestSharedExecutor:
+    """Test reuse of executors by the module-level helpers."""
+
+    @patch("gkc.sparql.requests.Session.get")
+    def test_convenience_calls_reuse_one_session(self, mock_get):
+        """Repeated execute_sparql calls share the same executor and session."""
+        mock_response = MagicMock()
+        mock_response.content = json.dumps({"results": {"bindings": []}}).encode()
+        mock_get.return_value = mock_response
+
+        execute_sparql("SELECT ?a WHERE { ?a ?b ?c }", endpoint="https://example.org")
+        first = _executor_for("https://example.org")
+        execute_sparql("SELECT ?b WHERE { ?a ?b ?c }", endpoint="https://example.org")
+
+        assert _executor_for("https://example.org") is first
+        assert first.session.get_adapter("https://example.org")._pool_maxsize == 16
+        assert mock_get.call_count == 2
+
+
+class TestSPARQLResultCache:
+    """Test the opt-in per-executor query result cache."""
+
+    @staticmethod
+    def _response(text):
+        mock_response = MagicMock()
+        mock_response.text = text
+        mock_response.content = text.encode()
+        return mock_response
+
+    @patch("gkc.sparql.requests.Session.get")
+    def test_equivalent_queries_hit_the_cache(self, mock_get):
+        """Queries differing only in whitespace and comments share a result."""
+        mock_get.return_value = self._response('{"results": {"bindings": []}}')
+        executor = SPARQLQuery(cache_size=128)
+
+        first = executor.query("SELECT ?item WHERE { ?item wdt:P31 wd:Q146 }")
+        second = executor.query(
+            "SELECT ?item  # cats\nWHERE {\n  ?item wdt:P31 wd:Q146\n}"
+        )
+
+        assert first == second == {"results": {"bindings": []}}
+        assert mock_get.call_count == 1
+
+    @patch("gkc.sparql.requests.Session.get")
+    def test_literals_and_format_are_part_of_the_key(self, mock_get):
+        """Different string literals or formats are fetched separately."""
+        mock_get.return_value = self._response('{"results": {"bindings": []}}')
+        executor = SPARQLQuery(cache_size=128)
+
+        executor.query('SELECT ?i WHERE { ?i rdfs:label "a  b" }')
+        executor.query('SELECT ?i WHERE { ?i rdfs:label "a b" }')
+        executor.query(
+            'SELECT ?i WHERE { ?i rdfs:label "a b" }', format="csv", raw=True
+        )
+
+        assert mock_get.call_count == 3
+
+    @patch("gkc.sparql.requests.Session.get")
+    def test_url_and_text_forms_share_a_result(self, mock_get):
+        """A Query Service URL hits the entry cached for its decoded text."""
+        mock_get.return_value = self._response('{"results": {"bindings": []}}')
+        executor = SPARQLQuery(cache_size=128)
+        query_text = "SELECT ?item WHERE { ?item wdt:P31 wd:Q146 }"
+
+        executor.query(query_text)
+        executor.query(f"https://query.wikidata.org/#{quote(query_text)}")
+
+        assert mock_get.call_count == 1
+
+    @patch("gkc.sparql.time.monotonic")
+    @patch("gkc.sparql.requests.Session.get")
+    def test_no_cache_and_expiry(self, mock_get, mock_monotonic):
+        """no_cache bypasses the cache and stale entries are refetched."""
+        mock_get.return_value = self._response('{"results": {"bindings": []}}')
+        mock_monotonic.return_value = 0.0
+        executor = SPARQLQuery(cache_ttl=10, cache_size=128)
+        query = "SELECT ?item WHERE { ?item wdt:P31 wd:Q146 }"
+
+        executor.query(query)
+        executor.query(query, no_cache=True)
+        assert mock_get.call_count == 2
+
+        mock_monotonic.return_value = 11.0
+        executor.query(query)
+        assert mock_get.call_count == 3
+
+    @patch("gkc.sparql.requests.Session.get")
+    def test_cache_is_off_by_default(self, mock_get):
+        """Default executors, including the shared ones, always refetch."""
+        mock_get.return_value = self._response('{"results": {"bindings": []}}')
+        query = "SELECT ?item WHERE { ?item wdt:P31 wd:Q146 }"
+
+        SPARQLQuery().query(query)
+        SPARQLQuery().query(query)
+        _executor_for(DEFAULT_WIKIDATA_ENDPOINT).query(query)
+        _executor_for(DEFAULT_WIKIDATA_ENDPOINT).query(query)
+
+        assert mock_get.call_count == 4
+
+
+class TestSPARQLQueryMany:
+    """Test concurrent execution of independent queries."""
+
+    @patch("gkc.sparql.SPARQLQuery.query")
+    def test_results_keep_input_order(self, mock_query):
+        """query_many returns one result per query, in order."""
+        mock_query.side_effect = lambda q, format, raw: {"query": q}
+        queries = [f"SELECT ?x WHERE {{ ?x wdt:P31 wd:Q{i} }}" for i in range(10)]
+
+        results = SPARQLQuery().query_many(queries, max_workers=8)
+
+        assert results == [{"query": q} for q in queries]
+
+    @patch("gkc.sparql.requests.Session.get")
+    def test_failures_propagate(self, mock_get):
+        """An error in any query is raised to the caller."""
+        import requests
+
+        mock_get.side_effect = requests.ConnectionError()
+
+        with pytest.raises(SPARQLError, match="Query failed"):
+            SPARQLQuery().query_many(["SELECT ?a {}", "SELECT ?b {}"])
@@ -187,3 +187,13 @@ def test_type_ahead_search_index_builds_correctly():
     assert len(widget.search_index["nav"]) == 2
     assert ("Q2", "Navajo") in widget.search_index["nav"]
     assert ("Q3", "Navajo Nation") in widget.search_index["nav"]
+
+
+def test_type_ahead_search_index_ignores_duplicate_choices():
+    """Repeated choices appear once per prefix bucket."""
+    from gkc.profiles.forms import TypeAheadSelect
+
+    widget = TypeAheadSelect([("Q2", "Navajo"), ("Q2", "Navajo"), ("Q1", "Apache")])
+
+    assert widget.search_index["nav"] == [("Q2", "Navajo")]
+    assert widget.search_index["a"] == [("Q1", "Apache")]
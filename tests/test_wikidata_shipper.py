@@ -1,5 +1,6 @@
 """Tests for Wikidata shipper."""
 
+import json
 from unittest.mock import Mock
 
 from gkc.shipper import WikidataShipper
@@ -70,9 +71,11 @@ def test_write_item_submit_posts_request():
 
     response = Mock()
     response.raise_for_status.return_value = None
-    response.json.return_value = {
-        "entity": {"id": "Q123", "lastrevid": 42},
-    }
+    response.content = json.dumps(
+        {
+            "entity": {"id": "Q123", "lastrevid": 42},
+        }
+    ).encode()
     auth.session.post.return_value = response
 
     result = shipper.write_item(